@@ -0,0 +1,151 @@
+#!/bin/python
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORT_CODE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+import_time = time.perf_counter() - start
+import momapy.builder
+
+print(json.dumps({{
+    "import": import_time,
+    "builder_classes": len(momapy.builder.builders),
+    "modules": sorted(name for name in sys.modules if name.startswith("momapy")),
+}}))
+"""
+
+READ_CODE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import momapy.io.core
+import_time = time.perf_counter() - start
+import momapy.builder
+
+start = time.perf_counter()
+momapy.io.core.read({file_path!r})
+read_time = time.perf_counter() - start
+
+print(json.dumps({{
+    "import": import_time,
+    "read": read_time,
+    "builder_classes": len(momapy.builder.builders),
+    "modules": sorted(name for name in sys.modules if name.startswith("momapy")),
+}}))
+"""
+
+
+def run_code(code):
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def get_self_import_times(module):
+    # Parses the output of `python -X importtime`, whose lines are
+    # `import time: self [us] | cumulative | imported package`
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        self_import_times[name.strip()] = int(self_time) / 1e6
+    return self_import_times
+
+
+def print_results(title, results, repeat):
+    print(title)
+    for key in ["import", "read"]:
+        if key in results[0]:
+            times = [result[key] for result in results]
+            print(
+                f"\t{key}: median {statistics.median(times):.3f}s, "
+                f"min {min(times):.3f}s over {repeat} runs"
+            )
+    print(f"\tbuilder classes made: {results[0]['builder_classes']}")
+    modules = results[0]["modules"]
+    print(f"\tmomapy modules imported: {len(modules)}")
+    for package in ["momapy.sbgn", "momapy.celldesigner", "momapy.sbml"]:
+        print(f"\t\t{package}: {package in modules}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tool for measuring the import time of momapy modules and "
+        "the time of a first read in a fresh interpreter"
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        action="append",
+        help="Module whose import is measured, can be given several times "
+        "(default: momapy.sbgn.pd and momapy.celldesigner)",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        action="append",
+        default=[],
+        help="File whose first read is measured, can be given several times",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters per measure (default: 5)",
+    )
+    parser.add_argument(
+        "-t",
+        "--top",
+        type=int,
+        default=10,
+        help="Number of modules with the highest self import time to show "
+        "(default: 10)",
+    )
+    args = parser.parse_args()
+    run(args)
+
+
+def run(args):
+    modules = args.module
+    if modules is None:
+        modules = ["momapy.sbgn.pd", "momapy.celldesigner"]
+    for module in modules:
+        results = [
+            run_code(IMPORT_CODE.format(module=module)) for _ in range(args.repeat)
+        ]
+        print_results(f"import {module}", results, args.repeat)
+        self_import_times = get_self_import_times(module)
+        print("\tslowest modules (self time, -X importtime):")
+        for name, self_time in sorted(
+            self_import_times.items(), key=lambda item: item[1], reverse=True
+        )[: args.top]:
+            print(f"\t\t{self_time:.3f}s {name}")
+    for file_path in args.file:
+        results = [
+            run_code(READ_CODE.format(file_path=file_path)) for _ in range(args.repeat)
+        ]
+        print_results(f"read {file_path}", results, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
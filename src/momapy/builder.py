@@ -21,7 +21,9 @@ Examples:
 """
 
 import abc
+import collections.abc
 import dataclasses
+import functools
 import typing
 import typing_extensions
 import types
@@ -45,6 +47,50 @@ class Builder(abc.ABC, momapy.monitoring.Monitored):
     _cls_to_build: typing.ClassVar[type]
     __hash__ = object.__hash__
 
+    def __getattr__(self, name):
+        # Only called when the attribute is not found, i.e., for the fields
+        # of a lazy builder that are not materialized yet
+        object_to_builder = self.__dict__.get("_lazy_object_to_builder")
+        if object_to_builder is None or name not in _get_field_names(type(self)):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = builder_from_object(
+            obj=getattr(self.__dict__["_source"], name),
+            omit_keys=object_to_builder.omit_keys,
+            object_to_builder=object_to_builder,
+        )
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # Replaces Monitored.__setattr__ rather than extending it, since it
+        # runs on every write to a builder. A builder made from an object is
+        # dirty once one of its attributes is set, and is then always built
+        # into a new object
+        object.__setattr__(self, name, value)
+        self_dict = self.__dict__
+        if "_source" in self_dict:
+            self_dict["_is_dirty"] = True
+        if id(self) in momapy.monitoring._registered_attribute_callbacks:
+            momapy.monitoring.trigger_event(momapy.monitoring.SetEvent(self, name))
+
+    def __getstate__(self):
+        # The object a builder was made from is neither copied nor pickled
+        # with it: the fields of a lazy builder are materialized first, and
+        # the copy is then built into a new object
+        state = self.__dict__
+        if "_source" not in state:
+            return state
+        if "_lazy_object_to_builder" in state:
+            for field_name in _get_field_names(type(self)):
+                getattr(self, field_name)
+        return {
+            name: value
+            for name, value in state.items()
+            if name not in ("_source", "_lazy_object_to_builder", "_is_dirty")
+        }
+
     @abc.abstractmethod
     def build(
         self,
@@ -86,6 +132,209 @@ class Builder(abc.ABC, momapy.monitoring.Monitored):
 
 builders = {}
 
+
+class _LazyObjectToBuilder(dict):
+    """Builders of a lazy conversion, keyed by the id of their object.
+
+    The objects are kept with their builders, so that their ids stay valid
+    and the mapping can be rebuilt by id after a copy.
+    """
+
+    def __init__(self, omit_keys: bool = True):
+        super().__init__()
+        self.omit_keys = omit_keys
+        self.objects = {}
+
+    def register(self, obj, builder):
+        self[id(obj)] = builder
+        self.objects[id(obj)] = obj
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.omit_keys,),
+            [(obj, self[key]) for key, obj in self.objects.items() if key in self],
+        )
+
+    def __setstate__(self, state):
+        for obj, builder in state:
+            self.register(obj, builder)
+
+
+@functools.cache
+def _get_field_names(cls) -> frozenset[str]:
+    return frozenset(field_.name for field_ in dataclasses.fields(cls))
+
+
+def _make_lazy_builder(cls, obj, object_to_builder):
+    builder = object.__new__(cls)
+    object.__setattr__(builder, "_source", obj)
+    object.__setattr__(builder, "_lazy_object_to_builder", object_to_builder)
+    for field_ in dataclasses.fields(cls):
+        if not hasattr(obj, field_.name):
+            if field_.default_factory is not dataclasses.MISSING:
+                value = field_.default_factory()
+            else:
+                value = field_.default
+            object.__setattr__(builder, field_.name, value)
+    object_to_builder.register(obj, builder)
+    return builder
+
+
+def _build_from_source(builder, builder_to_object):
+    # A builder made from an object is built by reusing the values of the
+    # object that are unchanged, and is built into the object itself if it
+    # is not dirty and none of its fields changed. The fields of a lazy
+    # builder that were never accessed are built from the object.
+    obj = builder.__dict__["_source"]
+    object_to_builder = builder.__dict__.get("_lazy_object_to_builder")
+    args = {}
+    is_unchanged = not builder.__dict__.get("_is_dirty", False)
+    for field_ in dataclasses.fields(builder):
+        obj_attr_value = getattr(obj, field_.name, None)
+        if field_.name in builder.__dict__:
+            attr_value = _reuse_unchanged(
+                object_from_builder(
+                    builder=builder.__dict__[field_.name],
+                    builder_to_object=builder_to_object,
+                ),
+                obj_attr_value,
+            )
+        else:
+            attr_value = _build_from_lazy_source(
+                obj_attr_value, object_to_builder, builder_to_object
+            )
+        if is_unchanged and attr_value is not obj_attr_value:
+            is_unchanged = False
+        args[field_.name] = attr_value
+    if is_unchanged:
+        new_obj = obj
+    else:
+        new_obj = builder._cls_to_build(**args)
+    builder_to_object[id(builder)] = new_obj
+    return new_obj
+
+
+def _reuse_unchanged(value: typing.Any, old_value: typing.Any) -> typing.Any:
+    """Return `old_value` if `value` is a copy of it with the same elements.
+
+    Building a collection always makes a new collection, even when all its
+    elements were built into the objects they were made from. Such a
+    collection is replaced by the original one, so that unchanged objects
+    keep their identity. Elements are compared by identity, since the
+    equality of layout elements ignores their ids, and scalars by equality.
+    """
+    if value is old_value:
+        return old_value
+    value_type = type(value)
+    if value_type in _scalar_types:
+        # Scalars may be copied by the `__post_init__` of builders, e.g.,
+        # when rounding coordinates
+        if value_type is type(old_value) and value == old_value:
+            return old_value
+        return value
+    if (
+        value_type not in _builder_collection_to_immutable.values()
+        or value_type is not type(old_value)
+        or len(value) != len(old_value)
+    ):
+        return value
+    if value_type is tuple:
+        for element, old_element in zip(value, old_value):
+            if _reuse_unchanged(element, old_element) is not old_element:
+                return value
+        return old_value
+    if value_type is frozenset:
+        if {id(element) for element in value} == {id(element) for element in old_value}:
+            return old_value
+        return value
+    if value_type is frozendict.frozendict:
+        for (key, element), (old_key, old_element) in zip(
+            value.items(), old_value.items()
+        ):
+            if key is not old_key or element is not old_element:
+                return value
+        return old_value
+    return value
+
+
+def _build_from_lazy_source(obj, object_to_builder, builder_to_object):
+    """Return an object with its parts that have builders built.
+
+    `obj` is a part of the object a lazy conversion started from that was
+    never accessed through a builder. It may however reference objects that
+    were accessed through another path, e.g., the target of an arc that was
+    accessed through the layout elements of the layout: these are replaced
+    by their built version. The object is only copied if one of its parts
+    is replaced.
+    """
+    if len(object_to_builder) == 1:
+        # Only the builder being built was materialized, and it cannot be
+        # referenced by its own parts
+        return obj
+    builder = object_to_builder.get(id(obj))
+    if builder is not None:
+        return object_from_builder(builder=builder, builder_to_object=builder_to_object)
+    if id(obj) in builder_to_object:
+        return builder_to_object[id(obj)]
+    obj_type = type(obj)
+    if obj_type is tuple or obj_type is frozenset:
+        new_elements = [
+            _build_from_lazy_source(element, object_to_builder, builder_to_object)
+            for element in obj
+        ]
+        if all(
+            new_element is element for new_element, element in zip(new_elements, obj)
+        ):
+            new_obj = obj
+        else:
+            new_obj = obj_type(new_elements)
+    elif isinstance(obj, collections.abc.Mapping):
+        new_items = [
+            (
+                _build_from_lazy_source(key, object_to_builder, builder_to_object),
+                _build_from_lazy_source(value, object_to_builder, builder_to_object),
+            )
+            for key, value in obj.items()
+        ]
+        if all(
+            new_key is key and new_value is value
+            for (new_key, new_value), (key, value) in zip(new_items, obj.items())
+        ):
+            new_obj = obj
+        elif obj_type is frozendict.frozendict:
+            new_obj = obj_type(new_items)
+        else:
+            # Mappings with their own builder class, e.g., with extra state,
+            # are rebuilt through their builder
+            new_obj = object_from_builder(
+                builder=builder_from_object(
+                    obj=obj,
+                    omit_keys=object_to_builder.omit_keys,
+                    object_to_builder=object_to_builder,
+                ),
+                builder_to_object=builder_to_object,
+            )
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        changes = {}
+        for field_ in dataclasses.fields(obj):
+            attr_value = getattr(obj, field_.name)
+            new_attr_value = _build_from_lazy_source(
+                attr_value, object_to_builder, builder_to_object
+            )
+            if new_attr_value is not attr_value:
+                changes[field_.name] = new_attr_value
+        if changes:
+            new_obj = dataclasses.replace(obj, **changes)
+        else:
+            new_obj = obj
+    else:
+        return obj
+    builder_to_object[id(obj)] = new_obj
+    return new_obj
+
+
+_scalar_types: frozenset[type] = frozenset([int, float, str, bool, bytes])
 _builder_collection_to_immutable: dict[type, type] = {
     list: tuple,
     set: frozenset,
@@ -147,6 +396,8 @@ def _make_builder_cls(
                 return obj
         else:
             builder_to_object = {}
+        if "_source" in self.__dict__:
+            return _build_from_source(self, builder_to_object)
         args = {}
         for field in dataclasses.fields(self):
             attr_value = getattr(self, field.name)
@@ -170,6 +421,8 @@ def _make_builder_cls(
                 return builder
         else:
             object_to_builder = {}
+        if isinstance(object_to_builder, _LazyObjectToBuilder):
+            return _make_lazy_builder(cls, obj, object_to_builder)
         args = {}
         for field_ in dataclasses.fields(obj):
             attr_value = getattr(obj, field_.name)
@@ -179,6 +432,7 @@ def _make_builder_cls(
                 object_to_builder=object_to_builder,
             )
         builder = cls(**args)
+        object.__setattr__(builder, "_source", obj)
         object_to_builder[id(obj)] = builder
         return builder
 
@@ -198,7 +452,11 @@ def _make_builder_cls(
             field_dict = {}
             has_default = False
             if field_.default_factory != dataclasses.MISSING:
-                if isinstance(field_.default_factory, type):
+                if dataclasses.is_dataclass(field_.default_factory):
+                    field_dict["default_factory"] = functools.partial(
+                        new_builder_object, field_.default_factory
+                    )
+                elif isinstance(field_.default_factory, type):
                     field_dict["default_factory"] = _transform_type(
                         field_.default_factory
                     )
@@ -277,6 +535,12 @@ def _make_builder_cls(
         eq=False,
         kw_only=False,
     )
+    # Field values are only stored on instances, so that accessing a field
+    # that is not materialized yet on a lazy builder falls back to
+    # `__getattr__` instead of returning the class-level default
+    for builder_field in dataclasses.fields(builder):
+        if builder_field.name in builder.__dict__:
+            delattr(builder, builder_field.name)
     return builder
 
 
@@ -360,6 +624,7 @@ def builder_from_object(
     obj: typing.Any,
     omit_keys: bool = True,
     object_to_builder: dict[int, "Builder"] | None = None,
+    lazy: bool = False,
 ) -> Builder:
     """Convert an object (or collection of objects) to builder(s).
 
@@ -368,12 +633,29 @@ def builder_from_object(
     Immutable collection types are converted to their mutable counterparts:
     tuple → list, frozenset → set, frozendict → dict.
 
+    Builders keep the object they were made from, so that building them
+    reuses the values of the object that did not change: a builder whose
+    attributes were never set and whose fields are all built into the
+    values of its object is built into the object itself. Editing a
+    builder thus only reallocates the edited objects and the objects that
+    reference them, and the other objects keep their identity.
+
+    In lazy mode, the conversion is done on demand: the fields of a builder
+    are only converted when they are first accessed, so that converting an
+    object costs the same whatever its size. Building a lazy builder reuses
+    the parts of the object that were never accessed, and returns the
+    object itself if none of its fields changed. References to a same
+    object are converted to a same builder, as in eager mode.
+
     Args:
         obj: An object instance, collection of objects, or any value.
         omit_keys: Whether to skip converting dictionary keys to builders.
             Defaults to True.
         object_to_builder: Optional cache mapping object ids to already-created
             builders for handling circular references.
+        lazy: Whether to convert the object lazily. Ignored if
+            `object_to_builder` is given: the conversion is then lazy if
+            `object_to_builder` comes from a lazy conversion.
 
     Returns:
         The builder object, collection of builders, or the original value
@@ -396,15 +678,20 @@ def builder_from_object(
         builder = object_to_builder.get(id(obj))
         if builder is not None:
             return builder
+    elif lazy:
+        object_to_builder = _LazyObjectToBuilder(omit_keys)
     else:
         object_to_builder = {}
     cls = get_or_make_builder_cls(type(obj))
     if issubclass(cls, Builder):
-        return cls.from_object(
+        builder = cls.from_object(
             obj=obj,
             omit_keys=omit_keys,
             object_to_builder=object_to_builder,
         )
+        if isinstance(object_to_builder, _LazyObjectToBuilder):
+            object_to_builder.register(obj, builder)
+        return builder
     if isinstance(obj, (list, tuple, set, frozenset)):
         builder_type = _immutable_collection_to_builder.get(type(obj), type(obj))
         return builder_type(
@@ -491,7 +778,11 @@ def get_or_make_builder_cls(
     """Get an existing builder class or create a new one.
 
     Returns the registered builder class for the given class if it exists,
-    otherwise creates and registers a new builder class.
+    otherwise creates and registers a new builder class. Builder classes
+    are thus made when they are first used, and not at import time. Making
+    a builder class also makes the builder classes of the bases of the
+    class and of the types of its fields, which are referenced in the
+    annotations of the builder class.
 
     Args:
         cls: The class to get or create a builder for.
@@ -74,6 +74,7 @@ import lxml.objectify
 
 from momapy.core.mapping import LayoutModelMappingBuilder
 from momapy.io.core import Reader, ReaderResult
+from momapy.io.signatures import CELLDESIGNER_SIGNATURE
 from momapy.io.utils import (
     ReadingContext,
     apply_remap_to_layout_model_mapping,
@@ -327,6 +328,8 @@ class CellDesignerReadingContext(ReadingContext):
 class CellDesignerReader(Reader):
     """Class for CellDesigner reader objects"""
 
+    signature = CELLDESIGNER_SIGNATURE
+
     _KEY_TO_CLASS = {
         (
             "TEMPLATE",
@@ -668,18 +671,6 @@ class CellDesignerReader(Reader):
                 if metaid is not None:
                     real_model_ids.add(metaid)
 
-    @classmethod
-    def check_file(cls, file_path: str | os.PathLike):
-        """Return `true` if the file is a CellDesigner file, `false` otherwise"""
-        try:
-            with open(file_path) as f:
-                for line in f:
-                    if "http://www.sbml.org/2001/ns/celldesigner" in line:
-                        return True
-            return False
-        except Exception:
-            return False
-
     @classmethod
     def read(
         cls,
@@ -122,10 +122,29 @@ def highlight_layout_elements(
         The modified map or map builder. If a frozen map was given,
             a new map is returned.
     """
+    style_sheet = make_highlight_style_sheet(layout_elements)
     if isinstance(map_, CellDesignerMap):
-        map_builder = builder_from_object(map_)
-    else:
-        map_builder = map_
+        return apply_style_sheet(map_, style_sheet, strict=False)
+    map_.layout = apply_style_sheet(map_.layout, style_sheet, strict=False)
+    return map_
+
+
+def make_highlight_style_sheet(
+    layout_elements: collections.abc.Iterable[LayoutElement | Builder],
+) -> StyleSheet:
+    """Make the stylesheet used to highlight specific layout elements.
+
+    The stylesheet grays out all layout elements except the given ones and
+    their descendants. It can be added as a top layer to another stylesheet,
+    e.g. with [LayeredStyleSheet.with_layer][momapy.styling.LayeredStyleSheet.with_layer],
+    to highlight elements of a styled map.
+
+    Args:
+        layout_elements: Layout elements to highlight.
+
+    Returns:
+        The highlight stylesheet.
+    """
     all_layout_elements = []
     for layout_element in layout_elements:
         all_layout_elements.append(layout_element)
@@ -230,12 +249,7 @@ def highlight_layout_elements(
             ),
         }
     )
-    map_builder.layout = apply_style_sheet(
-        map_builder.layout, style_sheet, strict=False
-    )
-    if isinstance(map_, CellDesignerMap):
-        return object_from_builder(map_builder)
-    return map_builder
+    return style_sheet
 
 
 def set_layout_to_fit_content(
@@ -57,6 +57,10 @@ Example:
     # List available style presets
     $ momapy list styles
 
+    # Serve read/render/export requests from a warm process
+    $ momapy serve --port 8765
+    $ momapy serve --socket /tmp/momapy.sock --workers 4
+
     # Piping between commands
     $ momapy export map.xml | momapy render -o output.svg
     $ momapy export map.xml | momapy tidy fit-nodes | momapy render -o output.svg
@@ -139,99 +143,6 @@ class _AppendStyleSource(argparse.Action):
         namespace.style_sources.append((self.const, values))
 
 
-def _translate_layout_element(layout_element, translation_x, translation_y):
-    """Recursively translate all positions in a layout element builder.
-
-    Walks the layout element tree and shifts all positional attributes
-    (node positions, text positions, arc segment points) by the given
-    translation amounts. Operates on builders in place.
-
-    Args:
-        layout_element: A layout element builder to translate.
-        translation_x: The horizontal translation amount.
-        translation_y: The vertical translation amount.
-    """
-    import momapy.core.layout
-    import momapy.geometry
-
-    if hasattr(layout_element, "position"):
-        layout_element.position = momapy.geometry.Point(
-            layout_element.position.x + translation_x,
-            layout_element.position.y + translation_y,
-        )
-    if hasattr(layout_element, "label") and layout_element.label is not None:
-        layout_element.label.position = momapy.geometry.Point(
-            layout_element.label.position.x + translation_x,
-            layout_element.label.position.y + translation_y,
-        )
-    if hasattr(layout_element, "segments"):
-        new_segments = []
-        for segment in layout_element.segments:
-            new_point_attributes = {}
-            for attribute_name in [
-                "p1",
-                "p2",
-                "control_point",
-                "control_point1",
-                "control_point2",
-            ]:
-                if hasattr(segment, attribute_name):
-                    point = getattr(segment, attribute_name)
-                    new_point_attributes[attribute_name] = momapy.geometry.Point(
-                        point.x + translation_x,
-                        point.y + translation_y,
-                    )
-            new_segments.append(dataclasses.replace(segment, **new_point_attributes))
-        layout_element.segments = new_segments
-    for child in layout_element.children():
-        if child is not None:
-            _translate_layout_element(child, translation_x, translation_y)
-
-
-def _move_map_to_top_left(map_):
-    """Translate all layout element positions so the layout starts at (0, 0).
-
-    Computes the layout bounding box, then translates all positions by
-    the negative of the top-left corner coordinates.
-
-    Args:
-        map_: The map object to translate.
-
-    Returns:
-        A new map with all layout positions translated to the top left.
-    """
-    import momapy.builder
-
-    bbox = map_.layout.bbox()
-    min_x = bbox.x - bbox.width / 2
-    min_y = bbox.y - bbox.height / 2
-    if min_x == 0 and min_y == 0:
-        return map_
-    map_builder = momapy.builder.builder_from_object(map_)
-    _translate_layout_element(map_builder.layout, -min_x, -min_y)
-    return momapy.builder.object_from_builder(map_builder)
-
-
-def _infer_writer(map_):
-    """Infer the writer name from the map type.
-
-    Args:
-        map_: The map object to infer the writer for.
-
-    Returns:
-        The name of the writer to use.
-
-    Raises:
-        ValueError: If the map type is not supported for export.
-    """
-    if isinstance(map_, CellDesignerMap):
-        return "celldesigner"
-    elif isinstance(map_, momapy.sbgn.SBGNMap):
-        return "sbgnml"
-    else:
-        raise ValueError(f"could not infer writer for map type {type(map_).__name__}")
-
-
 def _run_tidy_operation(map_, args):
     """Run a specific tidy operation on a map.
 
@@ -398,8 +309,8 @@ def _read_input(input_file_path):
 
     When ``input_file_path`` is ``None``, reads binary data from stdin,
     buffers it to a temporary file, and uses the standard
-    ``momapy.io.core.read()`` auto-detection (content-based
-    ``check_file()``) to identify the format.
+    ``momapy.io.core.read()`` auto-detection (from the file header, see
+    ``momapy.io.core.read_file_header()``) to identify the format.
 
     Args:
         input_file_path: Path to the input file, or ``None`` to read
@@ -469,7 +380,7 @@ def _write_output(map_, reader_result, output_file_path):
     """
     import momapy.io.core
 
-    writer = _infer_writer(map_)
+    writer = momapy.io.core.infer_writer(map_)
     if output_file_path:
         momapy.io.core.write(map_, output_file_path, writer=writer)
         return
@@ -483,10 +394,9 @@ def _write_output(map_, reader_result, output_file_path):
 def _build_layout_to_model_id_mapping(layout_model_mapping):
     """Build a dict mapping layout element IDs to model element IDs.
 
-    Iterates the layout-model mapping and extracts the ``id_`` of each
-    layout element and its corresponding model element. For frozenset keys,
-    each layout element in the set is mapped. For tuple values (child
-    elements), the child model element's ``id_`` is used.
+    For frozenset keys, only the anchor layout element is mapped; singleton
+    keys take precedence over anchors (see
+    [layout_to_model_table][momapy.core.mapping.LayoutModelMapping.layout_to_model_table]).
 
     Args:
         layout_model_mapping: The layout-model mapping from the map, or
@@ -498,32 +408,7 @@ def _build_layout_to_model_id_mapping(layout_model_mapping):
     """
     if layout_model_mapping is None:
         return {}
-    layout_id_to_model_id = {}
-    singleton_to_key = layout_model_mapping._singleton_to_key
-    # First pass: frozenset keys (processes, modulations).
-    # Only map the anchor element of each frozenset, not all
-    # participants, to avoid overwriting other elements' model IDs.
-    for key, value in layout_model_mapping.items():
-        if not isinstance(key, frozenset):
-            continue
-        if isinstance(value, tuple):
-            model_id = str(value[0].id_)
-        else:
-            model_id = str(value.id_)
-        for layout_element in key:
-            if singleton_to_key.get(layout_element) == key:
-                layout_id_to_model_id[str(layout_element.id_)] = model_id
-    # Second pass: singleton keys override frozenset entries,
-    # so each element gets its own model ID when available.
-    for key, value in layout_model_mapping.items():
-        if isinstance(key, frozenset):
-            continue
-        if isinstance(value, tuple):
-            model_id = str(value[0].id_)
-        else:
-            model_id = str(value.id_)
-        layout_id_to_model_id[str(key.id_)] = model_id
-    return layout_id_to_model_id
+    return layout_model_mapping.layout_to_model_table()
 
 
 def _extract_element_metadata(
@@ -618,13 +503,16 @@ def _render_svg_string(layout_element, style_sheet=None, to_top_left=False):
             style_sheets = [
                 (
                     momapy.styling.StyleSheet.from_file(single_style_sheet)
-                    if not isinstance(single_style_sheet, momapy.styling.StyleSheet)
+                    if not isinstance(
+                        single_style_sheet,
+                        (momapy.styling.StyleSheet, momapy.styling.LayeredStyleSheet),
+                    )
                     else single_style_sheet
                 )
                 for single_style_sheet in style_sheets
             ]
-            combined_style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-            momapy.styling.apply_style_sheet(layout_element, combined_style_sheet)
+            layered_style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
+            momapy.styling.apply_style_sheet(layout_element, layered_style_sheet)
         if to_top_left:
             min_x = bbox.x - bbox.width / 2
             min_y = bbox.y - bbox.height / 2
@@ -1215,10 +1103,7 @@ def run(args):
                 momapy.styling.StyleSheet.from_file(style_sheet_file_path)
                 for style_sheet_file_path in args.style_sheet_file_path
             ]
-            if len(style_sheets) > 1:
-                style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-            else:
-                style_sheet = style_sheets[0]
+            style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
         else:
             style_sheet = None
         layouts = []
@@ -1247,6 +1132,7 @@ def run(args):
     elif args.subcommand == "export":
         import momapy.builder
         import momapy.io.core
+        import momapy.positioning
         import momapy.styling
 
         reader_result = _read_input(args.input_file_path)
@@ -1256,10 +1142,7 @@ def run(args):
                 momapy.styling.StyleSheet.from_file(style_sheet_file_path)
                 for style_sheet_file_path in args.style_sheet_file_path
             ]
-            if len(style_sheets) > 1:
-                style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-            else:
-                style_sheet = style_sheets[0]
+            style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
             map_builder = momapy.builder.builder_from_object(map_)
             momapy.styling.apply_style_sheet(map_builder, style_sheet)
             map_ = map_builder.build()
@@ -1269,7 +1152,7 @@ def run(args):
             elif isinstance(map_, momapy.sbgn.SBGNMap):
                 map_ = momapy.sbgn.utils.tidy(map_)
         if args.to_top_left:
-            map_ = _move_map_to_top_left(map_)
+            map_ = momapy.positioning.move_map_to_top_left(map_)
         _write_output(map_, reader_result, args.output_file_path)
     elif args.subcommand == "info":
         import momapy.io.core
@@ -1387,10 +1270,7 @@ def run(args):
                 style_sheets.append(getattr(module, attribute_name))
             else:
                 style_sheets.append(momapy.styling.StyleSheet.from_file(value))
-        if len(style_sheets) > 1:
-            style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-        else:
-            style_sheet = style_sheets[0]
+        style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
         reader_result = _read_input(args.input_file_path)
         map_ = reader_result.obj
         map_builder = momapy.builder.builder_from_object(map_)
@@ -1408,10 +1288,7 @@ def run(args):
                 momapy.styling.StyleSheet.from_file(style_sheet_file_path)
                 for style_sheet_file_path in args.style_sheet_file_path
             ]
-            if len(style_sheets) > 1:
-                style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-            else:
-                style_sheet = style_sheets[0]
+            style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
             map_builder = momapy.builder.builder_from_object(map_)
             momapy.styling.apply_style_sheet(map_builder.layout, style_sheet)
             map_ = momapy.builder.object_from_builder(map_builder)
@@ -1425,6 +1302,18 @@ def run(args):
             input_file_path=args.input_file_path,
             to_top_left=args.to_top_left,
         )
+    elif args.subcommand == "serve":
+        import momapy.server
+
+        momapy.server.serve(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            workers=args.workers,
+            max_maps=args.max_maps,
+            max_style_sheets=args.max_style_sheets,
+            quiet=args.quiet,
+        )
     else:
         raise ValueError(f"subcommand {args.subcommand} not supported")
 
@@ -1756,6 +1645,61 @@ def main():
         default=[],
         help="style sheet file path",
     )
+    serve_parser = subparsers.add_parser(
+        "serve",
+        description=(
+            "Run a local server that reads, renders and exports maps on "
+            "request. Fonts, style sheets and recently read maps are kept in "
+            "memory, so only the first request pays the warm-up cost. The "
+            "server has no authentication: any local process that can connect "
+            "to it reads and writes files as the user running it, so prefer a "
+            "Unix socket (--socket) to a TCP port. Requests must have the "
+            "application/json content type, and requests with an Origin "
+            "header, as sent by web browsers, are rejected."
+        ),
+    )
+    serve_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="host to listen on (default: 127.0.0.1)",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="port to listen on (default: 8765)",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket path to listen on instead of a TCP port",
+    )
+    serve_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker threads",
+    )
+    serve_parser.add_argument(
+        "--max-maps",
+        type=int,
+        default=16,
+        help="maximum number of read maps kept in memory (default: 16)",
+    )
+    serve_parser.add_argument(
+        "--max-style-sheets",
+        type=int,
+        default=64,
+        help="maximum number of parsed style sheets kept in memory (default: 64)",
+    )
+    serve_parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        default=False,
+        help="do not log requests",
+    )
     args = parser.parse_args()
     try:
         run(args)
@@ -27,6 +27,8 @@ Examples:
 """
 
 import dataclasses
+import math
+
 import typing_extensions
 
 
@@ -283,6 +285,74 @@ class Color(object):
         return cls(red, green, blue, alpha)
 
 
+@dataclasses.dataclass(frozen=True)
+class Colormap(object):
+    """Represents a linear colormap, mapping numbers to colors.
+
+    The colors of the colormap are evenly spaced on [0, 1], and a number is
+    mapped to the color linearly interpolated between the two colors
+    surrounding it. Numbers out of [0, 1] are clamped. Non-finite numbers
+    (NaN and infinities) are mapped to the bad color, and raise a
+    `ValueError` if the colormap has none.
+
+    Attributes:
+        colors: The colors of the colormap, from 0 to 1.
+        bad: The color of non-finite numbers.
+
+    Examples:
+        ```python
+        colormap = Colormap((blue, white, red))
+        colormap(0.25)
+        ```
+    """
+
+    colors: tuple[Color, ...] = dataclasses.field(
+        metadata={"description": "The colors of the colormap, from 0 to 1"}
+    )
+    bad: Color | None = dataclasses.field(
+        default=None,
+        metadata={"description": "The color of non-finite numbers"},
+    )
+
+    def __post_init__(self):
+        if not self.colors:
+            raise ValueError("a colormap should have at least one color")
+
+    def __call__(self, value: float) -> Color:
+        """Return the color of a number.
+
+        Args:
+            value: The number, between 0 and 1.
+
+        Returns:
+            The interpolated color.
+
+        Raises:
+            ValueError: If the number is not finite and the colormap has no
+                bad color.
+        """
+        if not math.isfinite(value):
+            if self.bad is None:
+                raise ValueError(f"cannot map non-finite value {value} to a color")
+            return self.bad
+        last = len(self.colors) - 1
+        if last == 0 or value <= 0:
+            return self.colors[0]
+        if value >= 1:
+            return self.colors[last]
+        position = value * last
+        i = int(position)
+        t = position - i
+        start = self.colors[i]
+        end = self.colors[i + 1]
+        return Color(
+            round(start.red + (end.red - start.red) * t),
+            round(start.green + (end.green - start.green) * t),
+            round(start.blue + (end.blue - start.blue) * t),
+            start.alpha + (end.alpha - start.alpha) * t,
+        )
+
+
 def list_colors() -> list[tuple[str, Color]]:
     """Return a list of all available named colors.
 
@@ -15,6 +15,9 @@ from momapy.core.mapping import LayoutModelMapping as LayoutModelMapping
 from momapy.core.mapping import (
     LayoutModelMappingBuilder as LayoutModelMappingBuilder,
 )
+from momapy.core.mapping import (
+    CompactLayoutModelMapping as CompactLayoutModelMapping,
+)
 
 from momapy.core.layout import TextLayout as TextLayout
 from momapy.core.layout import Shape as Shape
@@ -39,6 +42,7 @@ __all__ = [
     "Map",
     "LayoutModelMapping",
     "LayoutModelMappingBuilder",
+    "CompactLayoutModelMapping",
     "TextLayout",
     "Shape",
     "GroupLayout",
@@ -6,6 +6,7 @@ import typing_extensions
 import enum
 import momapy.drawing
 import momapy.geometry
+import momapy.hashing
 import momapy.utils
 
 
@@ -146,6 +147,8 @@ class LayoutElement(MapElement, abc.ABC):
         if type(self) is type(other):
             if not flattened:
                 return self == other
+            elif momapy.hashing.have_same_content(self, other):
+                return True
             else:
                 if not unordered:
                     return self.flattened() == other.flattened()
@@ -0,0 +1,382 @@
+"""Graph index of the model elements of a model."""
+
+import collections
+import dataclasses
+import itertools
+import typing
+import weakref
+
+import numpy
+
+import momapy.core.elements
+import momapy.core.model
+
+
+class ModelGraph(object):
+    """Directed bipartite graph of the species and processes of a model.
+
+    Nodes are the entity pools, species, activities, processes, reactions
+    and logical operators of the model. Each edge is induced by a model
+    element, kept as the edge element:
+
+    - a reactant (or modifier) goes from its species to its process;
+    - a product goes from its process to its species;
+    - a modulation or influence goes from its source to its target;
+    - a logical operator input goes from its element to its operator.
+
+    Nodes are interned to integers and edges are stored as two index
+    arrays, with adjacency lists giving neighbourhood queries in
+    O(degree). The graph also keeps the elements of each collection of the
+    model (`model_collections`), to find the collection holding an element
+    with `get_field_name`. A graph is built from a frozen model and must not be
+    shared with a modified copy of it: use
+    [get_model_graph][momapy.core.graph.get_model_graph] or
+    `Model.get_graph`, which cache one graph per model.
+
+    Examples:
+        ```python
+        graph = model.get_graph()
+        # processes consuming a species
+        graph.get_successors(species, edge_cls=momapy.sbgn.pd.Reactant)
+        # modulators of a process
+        graph.get_predecessors(process, edge_cls=momapy.sbgn.pd.Modulation)
+        ```
+    """
+
+    def __init__(
+        self,
+        nodes: "tuple[momapy.core.elements.ModelElement, ...]",
+        sources: numpy.ndarray,
+        targets: numpy.ndarray,
+        edge_elements: "tuple[momapy.core.elements.ModelElement, ...]",
+        model_collections: "dict[str, tuple[momapy.core.elements.ModelElement, ...]] | None" = None,
+    ):
+        self.nodes = nodes
+        self.sources = sources
+        self.targets = targets
+        self.edge_elements = edge_elements
+        if model_collections is None:
+            model_collections = {}
+        self.model_collections = model_collections
+        self._element_id_to_field_name = {
+            id(element): field_name
+            for field_name, elements in model_collections.items()
+            for element in elements
+        }
+        self._node_id_to_index = {id(node): index for index, node in enumerate(nodes)}
+        self._source_indices = sources.tolist()
+        self._target_indices = targets.tolist()
+        self._out_edges = [[] for _ in nodes]
+        self._in_edges = [[] for _ in nodes]
+        for edge_index, (source, target) in enumerate(
+            zip(self._source_indices, self._target_indices)
+        ):
+            self._out_edges[source].append(edge_index)
+            self._in_edges[target].append(edge_index)
+
+    @classmethod
+    def from_model(cls, model: "momapy.core.model.Model") -> "ModelGraph":
+        """Build the graph of a model.
+
+        Args:
+            model: The model
+
+        Returns:
+            The graph of the model
+        """
+        nodes = []
+        node_id_to_index = {}
+
+        def _intern(element):
+            index = node_id_to_index.get(id(element))
+            if index is None:
+                index = len(nodes)
+                node_id_to_index[id(element)] = index
+                nodes.append(element)
+            return index
+
+        for node_field_name in _NODE_FIELD_NAMES:
+            for element in getattr(model, node_field_name, ()):
+                _intern(element)
+        sources = []
+        targets = []
+        edge_elements = []
+        for source, target, edge_element in _iter_edges(model):
+            sources.append(_intern(source))
+            targets.append(_intern(target))
+            edge_elements.append(edge_element)
+        return cls(
+            nodes=tuple(nodes),
+            sources=numpy.array(sources, dtype=numpy.int32),
+            targets=numpy.array(targets, dtype=numpy.int32),
+            edge_elements=tuple(edge_elements),
+            model_collections={
+                field.name: tuple(getattr(model, field.name))
+                for field in dataclasses.fields(model)
+                if isinstance(getattr(model, field.name), frozenset)
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, element) -> bool:
+        return id(element) in self._node_id_to_index
+
+    def get_node_index(self, element: "momapy.core.elements.ModelElement") -> int:
+        """Return the index of a node, by identity.
+
+        Raises:
+            KeyError: If the element is not a node of the graph
+        """
+        index = self._node_id_to_index.get(id(element))
+        if index is None:
+            raise KeyError(element)
+        return index
+
+    def get_field_name(
+        self, element: "momapy.core.elements.ModelElement"
+    ) -> str | None:
+        """Return the name of the collection of the model holding an element.
+
+        Args:
+            element: The element, looked up by identity
+
+        Returns:
+            The name of the `frozenset` field of the model that contains the
+            element, or `None` if no such field contains it
+        """
+        return self._element_id_to_field_name.get(id(element))
+
+    def get_out_edges(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        edge_cls: type | tuple[type, ...] | None = None,
+    ) -> "list[tuple[momapy.core.elements.ModelElement, momapy.core.elements.ModelElement]]":
+        """Return the edges going out of a node.
+
+        Args:
+            element: The node
+            edge_cls: If given, only the edges whose edge element is an
+                instance of `edge_cls` are returned
+
+        Returns:
+            The list of the (target, edge element) pairs of the edges
+        """
+        return self._get_edges(element, self._out_edges, self._target_indices, edge_cls)
+
+    def get_in_edges(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        edge_cls: type | tuple[type, ...] | None = None,
+    ) -> "list[tuple[momapy.core.elements.ModelElement, momapy.core.elements.ModelElement]]":
+        """Return the edges coming into a node.
+
+        Args:
+            element: The node
+            edge_cls: If given, only the edges whose edge element is an
+                instance of `edge_cls` are returned
+
+        Returns:
+            The list of the (source, edge element) pairs of the edges
+        """
+        return self._get_edges(element, self._in_edges, self._source_indices, edge_cls)
+
+    def get_successors(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        edge_cls: type | tuple[type, ...] | None = None,
+    ) -> "list[momapy.core.elements.ModelElement]":
+        """Return the targets of the edges going out of a node, without duplicates."""
+        return _unique(target for target, _ in self.get_out_edges(element, edge_cls))
+
+    def get_predecessors(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        edge_cls: type | tuple[type, ...] | None = None,
+    ) -> "list[momapy.core.elements.ModelElement]":
+        """Return the sources of the edges coming into a node, without duplicates."""
+        return _unique(source for source, _ in self.get_in_edges(element, edge_cls))
+
+    def get_neighbors(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        edge_cls: type | tuple[type, ...] | None = None,
+    ) -> "list[momapy.core.elements.ModelElement]":
+        """Return the predecessors and successors of a node, without duplicates."""
+        return _unique(
+            itertools.chain(
+                self.get_predecessors(element, edge_cls),
+                self.get_successors(element, edge_cls),
+            )
+        )
+
+    def get_neighborhood(
+        self,
+        element: "momapy.core.elements.ModelElement",
+        k: int = 1,
+        direction: typing.Literal["in", "out", "both"] = "both",
+    ) -> "list[momapy.core.elements.ModelElement]":
+        """Return the nodes at most `k` edges away from a node.
+
+        Args:
+            element: The node
+            k: The maximum number of edges
+            direction: Follow the edges going out of (`"out"`), coming into
+                (`"in"`) or both (`"both"`) the visited nodes
+
+        Returns:
+            The list of the nodes, in breadth-first order, starting with
+            `element`
+        """
+        if direction not in ("in", "out", "both"):
+            raise ValueError(f"invalid direction {direction!r}")
+        start = self.get_node_index(element)
+        distances = {start: 0}
+        queue = collections.deque([start])
+        while queue:
+            index = queue.popleft()
+            if distances[index] == k:
+                continue
+            next_indices = []
+            if direction != "in":
+                next_indices += [
+                    self._target_indices[edge_index]
+                    for edge_index in self._out_edges[index]
+                ]
+            if direction != "out":
+                next_indices += [
+                    self._source_indices[edge_index]
+                    for edge_index in self._in_edges[index]
+                ]
+            for next_index in next_indices:
+                if next_index not in distances:
+                    distances[next_index] = distances[index] + 1
+                    queue.append(next_index)
+        return [self.nodes[index] for index in distances]
+
+    def to_edge_arrays(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Return the source and target node indices of the edges.
+
+        Node indices are positions in `nodes`.
+        """
+        return self.sources.copy(), self.targets.copy()
+
+    def to_scipy_sparse(self):
+        """Return the adjacency matrix of the graph as a SciPy CSR array.
+
+        The entry `(i, j)` is the number of edges from `nodes[i]` to
+        `nodes[j]`.
+
+        Raises:
+            ImportError: If SciPy is not installed.
+        """
+        try:
+            import scipy.sparse
+        except ImportError as error:
+            raise ImportError(
+                "to_scipy_sparse() requires SciPy. Install it with 'pip install scipy'."
+            ) from error
+        return scipy.sparse.csr_array(
+            (
+                numpy.ones(len(self.sources), dtype=numpy.int32),
+                (self.sources, self.targets),
+            ),
+            shape=(len(self.nodes), len(self.nodes)),
+        )
+
+    def _get_edges(self, element, edges, other_ends, edge_cls):
+        index = self._node_id_to_index.get(id(element))
+        if index is None:
+            return []
+        return [
+            (self.nodes[other_ends[edge_index]], self.edge_elements[edge_index])
+            for edge_index in edges[index]
+            if edge_cls is None or isinstance(self.edge_elements[edge_index], edge_cls)
+        ]
+
+
+_NODE_FIELD_NAMES = [
+    "entity_pools",
+    "species",
+    "activities",
+    "processes",
+    "reactions",
+    "logical_operators",
+    "boolean_logic_gates",
+    "equivalence_operators",
+]
+
+_model_graphs: dict[int, ModelGraph] = {}
+
+
+def get_model_graph(model: "momapy.core.model.Model") -> ModelGraph:
+    """Return the graph of a model, built on first call and then cached.
+
+    The cache is keyed by the identity of the model, which is frozen, and
+    an entry is dropped when its model is garbage collected.
+
+    Args:
+        model: The model
+
+    Returns:
+        The graph of the model
+    """
+    graph = _model_graphs.get(id(model))
+    if graph is None:
+        graph = ModelGraph.from_model(model)
+        _model_graphs[id(model)] = graph
+        weakref.finalize(model, _model_graphs.pop, id(model), None)
+    return graph
+
+
+def _get_role_element(role):
+    element = getattr(role, "element", None)
+    if element is None:
+        element = getattr(role, "referred_species", None)
+    return element
+
+
+def _iter_edges(model):
+    # Roles and modulations missing one of their ends, e.g., a role without
+    # element, are not edges
+    for process in itertools.chain(
+        getattr(model, "processes", ()), getattr(model, "reactions", ())
+    ):
+        for role in itertools.chain(
+            getattr(process, "reactants", ()), getattr(process, "modifiers", ())
+        ):
+            element = _get_role_element(role)
+            if element is not None:
+                yield element, process, role
+        for role in getattr(process, "products", ()):
+            element = _get_role_element(role)
+            if element is not None:
+                yield process, element, role
+    for modulation in itertools.chain(
+        getattr(model, "modulations", ()), getattr(model, "influences", ())
+    ):
+        if modulation.source is not None and modulation.target is not None:
+            yield modulation.source, modulation.target, modulation
+    for operator in itertools.chain(
+        getattr(model, "logical_operators", ()),
+        getattr(model, "boolean_logic_gates", ()),
+        getattr(model, "equivalence_operators", ()),
+    ):
+        for role in operator.inputs:
+            element = _get_role_element(role)
+            if element is not None:
+                yield element, operator, role
+        output = getattr(operator, "output", None)
+        if output is not None and output.element is not None:
+            yield operator, output.element, output
+
+
+def _unique(elements):
+    element_ids = set()
+    unique_elements = []
+    for element in elements:
+        if id(element) not in element_ids:
+            element_ids.add(id(element))
+            unique_elements.append(element)
+    return unique_elements
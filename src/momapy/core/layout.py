@@ -16,6 +16,7 @@ from momapy.core.fonts import find_font
 import momapy.drawing
 import momapy.geometry
 import momapy.coloring
+import momapy.hashing
 import momapy.builder
 
 
@@ -486,7 +487,12 @@ class GroupLayout(LayoutElement):
         for child in self.children():
             if child is not None:
                 drawing_elements += child.drawing_elements()
-        group = momapy.drawing.Group(
+        return [self._make_group(drawing_elements)]
+
+    def _make_group(
+        self, drawing_elements: list[momapy.drawing.DrawingElement]
+    ) -> momapy.drawing.Group:
+        return momapy.drawing.Group(
             class_=f"{type(self).__name__}",
             elements=tuple(drawing_elements),
             id_=f"{self.id_}",
@@ -504,7 +510,6 @@ class GroupLayout(LayoutElement):
             text_anchor=self.group_text_anchor,
             transform=self.group_transform,
         )
-        return [group]
 
     def children(self) -> list[LayoutElement]:
         """Return the children of the group layout.
@@ -1529,6 +1534,8 @@ class Layout(Node):
                         return False
             return True
 
+        if momapy.hashing.have_same_content(self, other):
+            return True
         if self.childless() != other.childless():
             return False
         if flattened:
@@ -2,6 +2,7 @@
 
 import dataclasses
 
+import momapy.hashing
 from momapy.core.elements import MapElement
 from momapy.core.layout import Layout
 from momapy.core.mapping import LayoutModelMapping
@@ -31,6 +32,8 @@ class Map(MapElement):
             or self.layout_model_mapping is None
         ):
             return False
+        if momapy.hashing.have_same_content(self, other):
+            return True
         return (
             self.model.is_submodel(other.model)
             and self.layout.is_sublayout(other.layout)
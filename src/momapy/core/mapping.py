@@ -1,8 +1,11 @@
 """Layout-model mapping classes."""
 
+import collections.abc
 import typing
 import typing_extensions
 
+import numpy
+
 import momapy.utils
 import momapy.builder
 import momapy.core.elements
@@ -72,7 +75,7 @@ class LayoutModelMapping(momapy.utils.FrozenIdentitySurjectionDict):
         """
         if map_element in self:
             return self[map_element]
-        result = self.inverse.get(id(map_element))
+        result = self.keys_for_value(map_element)
         if result:
             return list(result)
         key = self._singleton_to_key.get(map_element)
@@ -80,6 +83,110 @@ class LayoutModelMapping(momapy.utils.FrozenIdentitySurjectionDict):
             return self[key]
         return None
 
+    def get_mappings(
+        self,
+        map_elements: "typing.Iterable[momapy.core.elements.MapElement]",
+    ) -> "list[momapy.core.elements.ModelElement | list[momapy.core.elements.LayoutElement] | None]":
+        """Return the mappings of several map elements at once.
+
+        Equivalent to calling
+        [get_mapping][momapy.core.mapping.LayoutModelMapping.get_mapping]
+        on each element, with the lookup tables bound once for the whole
+        batch.
+
+        Args:
+            map_elements: The map elements to look up
+
+        Returns:
+            The list of the results of `get_mapping`, in the order of
+            `map_elements`
+        """
+        get = self.get
+        keys_for_value = self.keys_for_value
+        singleton_to_key = self._singleton_to_key
+        mappings = []
+        for map_element in map_elements:
+            model_element = get(map_element)
+            if model_element is None:
+                keys = keys_for_value(map_element)
+                if keys:
+                    model_element = list(keys)
+                else:
+                    key = singleton_to_key.get(map_element)
+                    if key is not None:
+                        model_element = self[key]
+            mappings.append(model_element)
+        return mappings
+
+    def get_anchors(
+        self,
+        key: "momapy.core.elements.LayoutElement | frozenset[momapy.core.elements.LayoutElement]",
+    ) -> "frozenset[momapy.core.elements.LayoutElement]":
+        """Return the layout elements that stand for a key of the mapping.
+
+        The anchors of a frozenset key are the layout elements registered
+        for it through the ``anchor`` argument of
+        [add_mapping][momapy.core.mapping.LayoutModelMappingBuilder.add_mapping];
+        a singleton key stands for itself.
+
+        Args:
+            key: The singleton or frozenset key
+
+        Returns:
+            The ``frozenset`` of the anchors of the key, empty for a
+            frozenset key without anchors
+        """
+        if isinstance(key, frozenset):
+            return self._singleton_to_key.keys_for_value(key)
+        return frozenset([key])
+
+    def layout_to_model_table(self) -> dict[str, str]:
+        """Return a table from layout element ids to model element ids.
+
+        Each layout element key is mapped to the id of its model element.
+        Frozenset keys only contribute their anchor, so that participants
+        of a cluster keep their own model element; singleton keys take
+        precedence over anchors.
+
+        Returns:
+            A dict mapping layout element `id_`s to model element `id_`s
+        """
+        layout_to_model_table = {}
+        singleton_to_key = self._singleton_to_key
+        for key, model_element in self.items():
+            if isinstance(key, frozenset):
+                for anchor in singleton_to_key.keys_for_value(key):
+                    layout_to_model_table[str(anchor.id_)] = str(model_element.id_)
+        for key, model_element in self.items():
+            if not isinstance(key, frozenset):
+                layout_to_model_table[str(key.id_)] = str(model_element.id_)
+        return layout_to_model_table
+
+    def model_to_layouts_table(self) -> dict[str, list[str]]:
+        """Return a table from model element ids to layout element ids.
+
+        A model element is mapped to the ids of its singleton layout
+        element keys and of the anchors of its frozenset keys, as in
+        [get_child_layout_elements][momapy.core.mapping.LayoutModelMapping.get_child_layout_elements].
+
+        Returns:
+            A dict mapping model element `id_`s to the lists of the `id_`s
+            of the layout elements that represent them
+        """
+        model_to_layouts_table = {}
+        singleton_to_key = self._singleton_to_key
+        for key, model_element in self.items():
+            if isinstance(key, frozenset):
+                layout_elements = singleton_to_key.keys_for_value(key)
+                if not layout_elements:
+                    continue
+            else:
+                layout_elements = [key]
+            model_to_layouts_table.setdefault(str(model_element.id_), []).extend(
+                str(layout_element.id_) for layout_element in layout_elements
+            )
+        return model_to_layouts_table
+
     def get_child_layout_elements(
         self,
         child_model_element: "momapy.core.elements.ModelElement",
@@ -96,29 +203,114 @@ class LayoutModelMapping(momapy.utils.FrozenIdentitySurjectionDict):
           singleton layout mapped to the child, plus the anchors of each
           frozenset key mapped to the child.
 
+        The intersections for all pairs are computed once, on the first
+        call, and kept in an index keyed by the ids of the child and
+        parent model elements, so that writers querying every subunit or
+        modification do dictionary lookups.
+
         The inverse is identity-keyed, so two content-equal but id-distinct
         model instances are not aliased: layouts under one parent do not
         cross-pollute the result for the sibling instance.
         """
-        child_s2 = set()
-        for key in self.inverse.get(id(child_model_element), ()):
+        child_layout_elements_index = self.__dict__.get("_child_layout_elements_index")
+        if child_layout_elements_index is None:
+            child_layout_elements_index = self._make_child_layout_elements_index()
+            object.__setattr__(
+                self, "_child_layout_elements_index", child_layout_elements_index
+            )
+        return list(
+            child_layout_elements_index.get(
+                (id(child_model_element), id(parent_model_element)), ()
+            )
+        )
+
+    def _make_child_layout_elements_index(
+        self,
+    ) -> "dict[tuple[int, int], list[momapy.core.elements.LayoutElement]]":
+        """Return the index used by `get_child_layout_elements`.
+
+        Returns:
+            A dict mapping each pair of ids of a child model element and of
+            a parent model element to the layout elements that represent
+            the child under the parent
+        """
+        parent_to_s1 = {}
+        for key, parent_model_element in self.items():
             if isinstance(key, frozenset):
-                for anchor in self._singleton_to_key.inverse.get(key, []):
-                    child_s2.add(anchor)
+                children = key
+            elif hasattr(key, "layout_elements"):
+                children = key.layout_elements
             else:
-                child_s2.add(key)
-        parent_s1 = set()
-        for parent_layout in self.inverse.get(id(parent_model_element), ()):
-            if isinstance(parent_layout, frozenset):
-                parent_s1 |= parent_layout
-            elif hasattr(parent_layout, "layout_elements"):
-                parent_s1.update(parent_layout.layout_elements)
-        return list(parent_s1 & child_s2)
+                continue
+            parent_to_s1.setdefault(id(parent_model_element), set()).update(children)
+        child_layout_elements_index = {}
+        for parent_id, parent_s1 in parent_to_s1.items():
+            for layout_element in parent_s1:
+                child_model_element_ids = set()
+                child_model_element = self.get(layout_element)
+                if child_model_element is not None:
+                    child_model_element_ids.add(id(child_model_element))
+                key = self._singleton_to_key.get(layout_element)
+                if key is not None and key in self:
+                    child_model_element_ids.add(id(self[key]))
+                for child_id in child_model_element_ids:
+                    child_layout_elements_index.setdefault(
+                        (child_id, parent_id), []
+                    ).append(layout_element)
+        return child_layout_elements_index
 
     def is_submapping(self, other) -> bool:
         """Return `true` if the mapping is a submapping of another `LayoutModelMapping`, `false` otherwise"""
         return self.items() <= other.items()
 
+    def _replace_layout_elements(
+        self,
+        replacements: "dict[int, momapy.core.elements.LayoutElement]",
+    ) -> typing_extensions.Self:
+        """Return a copy of the mapping with some layout elements replaced.
+
+        Args:
+            replacements: The new layout elements, keyed by the id of the
+                layout elements they replace. A layout element may be mapped
+                to itself.
+
+        Returns:
+            The new mapping, or the mapping itself if no layout element of
+            the mapping is replaced
+        """
+
+        def _replace_key(key):
+            if isinstance(key, frozenset):
+                new_elements = [
+                    replacements.get(id(element), element) for element in key
+                ]
+                if all(
+                    new_element is element
+                    for new_element, element in zip(new_elements, key)
+                ):
+                    return key
+                return frozenset(new_elements)
+            return replacements.get(id(key), key)
+
+        items = []
+        has_replacements = False
+        for key, value in self.items():
+            new_key = _replace_key(key)
+            if new_key is not key:
+                has_replacements = True
+            items.append((new_key, value))
+        if not has_replacements:
+            return self
+        mapping = type(self)(items)
+        singleton_to_key = momapy.utils.FrozenSurjectionDict(
+            {
+                _replace_key(singleton): _replace_key(key)
+                for singleton, key in self._singleton_to_key.items()
+            }
+        )
+        object.__setattr__(mapping, "_singleton_to_key", singleton_to_key)
+        return mapping
+
     def __reduce__(self):
         """Pickle hook that preserves `_singleton_to_key` across round-trips.
 
@@ -155,7 +347,7 @@ class LayoutModelMappingBuilder(
     ):
         if map_element in self:
             return self[map_element]
-        result = self.inverse.get(id(map_element))
+        result = self.keys_for_value(map_element)
         if result:
             return list(result)
         return None
@@ -167,20 +359,33 @@ class LayoutModelMappingBuilder(
     ) -> "list[momapy.core.elements.LayoutElement]":
         """Return the layout elements representing ``child_model_element`` under ``parent_model_element``."""
         child_s2 = set()
-        for key in self.inverse.get(id(child_model_element), ()):
+        for key in self.keys_for_value(child_model_element):
             if isinstance(key, frozenset):
-                for anchor in self._singleton_to_key.inverse.get(key, []):
+                for anchor in self._singleton_to_key.keys_for_value(key):
                     child_s2.add(anchor)
             else:
                 child_s2.add(key)
         parent_s1 = set()
-        for parent_layout in self.inverse.get(id(parent_model_element), ()):
+        for parent_layout in self.keys_for_value(parent_model_element):
             if isinstance(parent_layout, frozenset):
                 parent_s1 |= parent_layout
             elif hasattr(parent_layout, "layout_elements"):
                 parent_s1.update(parent_layout.layout_elements)
         return list(parent_s1 & child_s2)
 
+    def get_anchors(
+        self,
+        key: "momapy.core.elements.LayoutElement | frozenset[momapy.core.elements.LayoutElement]",
+    ) -> "frozenset[momapy.core.elements.LayoutElement]":
+        """Return the layout elements that stand for a key of the mapping.
+
+        Same result as
+        [LayoutModelMapping.get_anchors][momapy.core.mapping.LayoutModelMapping.get_anchors].
+        """
+        if isinstance(key, frozenset):
+            return self._singleton_to_key.keys_for_value(key)
+        return frozenset([key])
+
     def add_mapping(
         self,
         layout_element: "momapy.core.elements.LayoutElement",
@@ -215,29 +420,59 @@ class LayoutModelMappingBuilder(
         self,
         builder_to_object: dict[int, typing.Any] | None = None,
     ):
-        mapping = self._cls_to_build(
-            {
-                momapy.builder.object_from_builder(
-                    key, builder_to_object=builder_to_object
-                ): momapy.builder.object_from_builder(
-                    value, builder_to_object=builder_to_object
-                )
-                for key, value in self.items()
-            }
+        if builder_to_object is None:
+            builder_to_object = {}
+        # The mapping the builder was made from is reused if all its items
+        # were built into the objects they were made from, in the same order
+        source = self.__dict__.get("_source")
+        items = self._build_items(self, source, builder_to_object)
+        singleton_to_key_items = self._build_items(
+            self._singleton_to_key,
+            source._singleton_to_key if source is not None else None,
+            builder_to_object,
         )
+        if (
+            items is None
+            and singleton_to_key_items is None
+            and not self.__dict__.get("_is_dirty", False)
+        ):
+            return source
+        if items is None:
+            items = list(source.items())
+        if singleton_to_key_items is None:
+            singleton_to_key_items = list(source._singleton_to_key.items())
+        mapping = self._cls_to_build(dict(items))
         singleton_to_key = momapy.utils.FrozenSurjectionDict(
-            {
-                momapy.builder.object_from_builder(
-                    singleton, builder_to_object=builder_to_object
-                ): momapy.builder.object_from_builder(
-                    key, builder_to_object=builder_to_object
-                )
-                for singleton, key in self._singleton_to_key.items()
-            }
+            dict(singleton_to_key_items)
         )
         object.__setattr__(mapping, "_singleton_to_key", singleton_to_key)
         return mapping
 
+    @staticmethod
+    def _build_items(items, source_items, builder_to_object):
+        # Returns None if the built items are the source items
+        new_items = []
+        is_unchanged = source_items is not None and len(source_items) == len(items)
+        if is_unchanged:
+            source_items = iter(source_items.items())
+        for key, value in items.items():
+            new_key = momapy.builder.object_from_builder(
+                key, builder_to_object=builder_to_object
+            )
+            new_value = momapy.builder.object_from_builder(
+                value, builder_to_object=builder_to_object
+            )
+            if is_unchanged:
+                source_key, source_value = next(source_items)
+                new_key = momapy.builder._reuse_unchanged(new_key, source_key)
+                new_value = momapy.builder._reuse_unchanged(new_value, source_value)
+                if new_key is not source_key or new_value is not source_value:
+                    is_unchanged = False
+            new_items.append((new_key, new_value))
+        if is_unchanged:
+            return None
+        return new_items
+
     def __reduce__(self):
         """Pickle hook that preserves `_singleton_to_key` across round-trips.
 
@@ -306,7 +541,347 @@ class LayoutModelMappingBuilder(
                 )
             singleton_to_key_items[new_singleton] = new_key
         builder._singleton_to_key = momapy.utils.SurjectionDict(singleton_to_key_items)
+        object.__setattr__(builder, "_source", obj)
         return builder
 
 
 momapy.builder.register_builder_cls(LayoutModelMappingBuilder)
+
+
+class CompactLayoutModelMapping(collections.abc.Mapping):
+    """Compact, read-only representation of a layout-model mapping.
+
+    Layout elements and model elements are interned to integers, and the
+    mapping is stored as NumPy index arrays: one pair of arrays for the
+    singleton keys, a CSR structure (`cluster_indptr` and
+    `cluster_layout_indices`) for the members of the frozenset keys, and a
+    pair of arrays for the anchors. It is cheaper to keep in memory and to
+    pickle than a [LayoutModelMapping][momapy.core.mapping.LayoutModelMapping],
+    whose frozenset keys must be hashed again on load.
+
+    The mapping keeps the read API of `LayoutModelMapping` on top of the
+    arrays. The tables used to look up keys, the keys of model elements and
+    anchors are only built on the first lookup that needs them.
+
+    Examples:
+        ```python
+        compact_mapping = CompactLayoutModelMapping.from_mapping(
+            map_.layout_model_mapping
+        )
+        compact_mapping.get_mapping(model_element)
+        layout_model_mapping = compact_mapping.to_mapping()
+        ```
+    """
+
+    def __init__(
+        self,
+        layout_elements: "tuple[momapy.core.elements.LayoutElement, ...]",
+        model_elements: "tuple[momapy.core.elements.ModelElement, ...]",
+        singleton_layout_indices: numpy.ndarray,
+        singleton_model_indices: numpy.ndarray,
+        cluster_indptr: numpy.ndarray,
+        cluster_layout_indices: numpy.ndarray,
+        cluster_model_indices: numpy.ndarray,
+        anchor_layout_indices: numpy.ndarray,
+        anchor_cluster_indices: numpy.ndarray,
+    ):
+        self.layout_elements = layout_elements
+        self.model_elements = model_elements
+        self.singleton_layout_indices = singleton_layout_indices
+        self.singleton_model_indices = singleton_model_indices
+        self.cluster_indptr = cluster_indptr
+        self.cluster_layout_indices = cluster_layout_indices
+        self.cluster_model_indices = cluster_model_indices
+        self.anchor_layout_indices = anchor_layout_indices
+        self.anchor_cluster_indices = anchor_cluster_indices
+        self._key_to_model_index = None
+        self._model_element_id_to_index = None
+        self._model_index_to_key_indices = None
+        self._anchor_id_to_cluster_index = None
+        self._cluster_index_to_anchor_layout_indices = None
+
+    @classmethod
+    def from_mapping(cls, mapping: LayoutModelMapping) -> typing_extensions.Self:
+        """Return the compact representation of a layout-model mapping.
+
+        Layout elements and model elements are interned by identity.
+        Anchors of frozenset keys that are not keys of the mapping are
+        dropped.
+
+        Args:
+            mapping: The layout-model mapping
+
+        Returns:
+            The compact layout-model mapping
+        """
+        layout_elements = []
+        layout_element_id_to_index = {}
+        model_elements = []
+        model_element_id_to_index = {}
+
+        def _intern(element, elements, element_id_to_index):
+            index = element_id_to_index.get(id(element))
+            if index is None:
+                index = len(elements)
+                element_id_to_index[id(element)] = index
+                elements.append(element)
+            return index
+
+        singleton_layout_indices = []
+        singleton_model_indices = []
+        cluster_indptr = [0]
+        cluster_layout_indices = []
+        cluster_model_indices = []
+        key_to_cluster_index = {}
+        for key, model_element in mapping.items():
+            model_index = _intern(
+                model_element, model_elements, model_element_id_to_index
+            )
+            if isinstance(key, frozenset):
+                key_to_cluster_index[key] = len(cluster_model_indices)
+                for layout_element in key:
+                    cluster_layout_indices.append(
+                        _intern(
+                            layout_element, layout_elements, layout_element_id_to_index
+                        )
+                    )
+                cluster_indptr.append(len(cluster_layout_indices))
+                cluster_model_indices.append(model_index)
+            else:
+                singleton_layout_indices.append(
+                    _intern(key, layout_elements, layout_element_id_to_index)
+                )
+                singleton_model_indices.append(model_index)
+        anchor_layout_indices = []
+        anchor_cluster_indices = []
+        for anchor, key in mapping._singleton_to_key.items():
+            cluster_index = key_to_cluster_index.get(key)
+            if cluster_index is not None:
+                anchor_layout_indices.append(
+                    _intern(anchor, layout_elements, layout_element_id_to_index)
+                )
+                anchor_cluster_indices.append(cluster_index)
+        return cls(
+            layout_elements=tuple(layout_elements),
+            model_elements=tuple(model_elements),
+            singleton_layout_indices=_make_index_array(singleton_layout_indices),
+            singleton_model_indices=_make_index_array(singleton_model_indices),
+            cluster_indptr=_make_index_array(cluster_indptr),
+            cluster_layout_indices=_make_index_array(cluster_layout_indices),
+            cluster_model_indices=_make_index_array(cluster_model_indices),
+            anchor_layout_indices=_make_index_array(anchor_layout_indices),
+            anchor_cluster_indices=_make_index_array(anchor_cluster_indices),
+        )
+
+    def to_mapping(self) -> LayoutModelMapping:
+        """Return the layout-model mapping represented by the compact mapping."""
+        mapping = LayoutModelMapping(self.items())
+        singleton_to_key = momapy.utils.FrozenSurjectionDict(
+            {
+                self.layout_elements[layout_index]: self._get_cluster(cluster_index)
+                for layout_index, cluster_index in zip(
+                    self.anchor_layout_indices.tolist(),
+                    self.anchor_cluster_indices.tolist(),
+                )
+            }
+        )
+        object.__setattr__(mapping, "_singleton_to_key", singleton_to_key)
+        return mapping
+
+    def _get_cluster(self, cluster_index: int) -> frozenset:
+        start, stop = self.cluster_indptr[cluster_index : cluster_index + 2].tolist()
+        return frozenset(
+            self.layout_elements[layout_index]
+            for layout_index in self.cluster_layout_indices[start:stop].tolist()
+        )
+
+    def _get_key_to_model_index(self) -> dict:
+        if self._key_to_model_index is None:
+            key_to_model_index = dict(
+                zip(
+                    (
+                        self.layout_elements[layout_index]
+                        for layout_index in self.singleton_layout_indices.tolist()
+                    ),
+                    self.singleton_model_indices.tolist(),
+                )
+            )
+            for cluster_index, model_index in enumerate(
+                self.cluster_model_indices.tolist()
+            ):
+                key_to_model_index[self._get_cluster(cluster_index)] = model_index
+            self._key_to_model_index = key_to_model_index
+        return self._key_to_model_index
+
+    def _get_model_index(self, model_element) -> int | None:
+        if self._model_element_id_to_index is None:
+            self._model_element_id_to_index = {
+                id(model_element): model_index
+                for model_index, model_element in enumerate(self.model_elements)
+            }
+        return self._model_element_id_to_index.get(id(model_element))
+
+    def _get_key_indices(self, model_index: int) -> tuple[list[int], list[int]]:
+        # Returns the layout indices of the singleton keys and the cluster
+        # indices of the frozenset keys mapped to a model element
+        if self._model_index_to_key_indices is None:
+            model_index_to_key_indices = {}
+            for layout_index, singleton_model_index in zip(
+                self.singleton_layout_indices.tolist(),
+                self.singleton_model_indices.tolist(),
+            ):
+                model_index_to_key_indices.setdefault(singleton_model_index, ([], []))[
+                    0
+                ].append(layout_index)
+            for cluster_index, cluster_model_index in enumerate(
+                self.cluster_model_indices.tolist()
+            ):
+                model_index_to_key_indices.setdefault(cluster_model_index, ([], []))[
+                    1
+                ].append(cluster_index)
+            self._model_index_to_key_indices = model_index_to_key_indices
+        return self._model_index_to_key_indices.get(model_index, ([], []))
+
+    def _get_anchor_cluster_index(self, layout_element) -> int | None:
+        if self._anchor_id_to_cluster_index is None:
+            self._anchor_id_to_cluster_index = {
+                id(self.layout_elements[layout_index]): cluster_index
+                for layout_index, cluster_index in zip(
+                    self.anchor_layout_indices.tolist(),
+                    self.anchor_cluster_indices.tolist(),
+                )
+            }
+        return self._anchor_id_to_cluster_index.get(id(layout_element))
+
+    def _get_anchor_layout_indices(self, cluster_index: int) -> list[int]:
+        if self._cluster_index_to_anchor_layout_indices is None:
+            cluster_index_to_anchor_layout_indices = {}
+            for layout_index, anchor_cluster_index in zip(
+                self.anchor_layout_indices.tolist(),
+                self.anchor_cluster_indices.tolist(),
+            ):
+                cluster_index_to_anchor_layout_indices.setdefault(
+                    anchor_cluster_index, []
+                ).append(layout_index)
+            self._cluster_index_to_anchor_layout_indices = (
+                cluster_index_to_anchor_layout_indices
+            )
+        return self._cluster_index_to_anchor_layout_indices.get(cluster_index, [])
+
+    def __getitem__(self, key):
+        return self.model_elements[self._get_key_to_model_index()[key]]
+
+    def __iter__(self):
+        for layout_index in self.singleton_layout_indices.tolist():
+            yield self.layout_elements[layout_index]
+        for cluster_index in range(len(self.cluster_model_indices)):
+            yield self._get_cluster(cluster_index)
+
+    def __len__(self) -> int:
+        return len(self.singleton_layout_indices) + len(self.cluster_model_indices)
+
+    def items(self):
+        """Return the (key, model element) pairs without looking up keys."""
+        model_elements = self.model_elements
+        model_indices = (
+            self.singleton_model_indices.tolist() + self.cluster_model_indices.tolist()
+        )
+        return [
+            (key, model_elements[model_index])
+            for key, model_index in zip(self, model_indices)
+        ]
+
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by identity).
+
+        Args:
+            value: The model element to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        model_index = self._get_model_index(value)
+        if model_index is None:
+            return frozenset()
+        layout_indices, cluster_indices = self._get_key_indices(model_index)
+        keys = [self.layout_elements[layout_index] for layout_index in layout_indices]
+        for cluster_index in cluster_indices:
+            keys.append(self._get_cluster(cluster_index))
+        return frozenset(keys)
+
+    def get_mapping(
+        self,
+        map_element: "momapy.core.elements.MapElement",
+    ) -> "momapy.core.elements.ModelElement | list[momapy.core.elements.LayoutElement]":
+        """Return the model element or layout elements mapped to `map_element`.
+
+        Same lookup order as
+        [LayoutModelMapping.get_mapping][momapy.core.mapping.LayoutModelMapping.get_mapping].
+        """
+        model_index = self._get_key_to_model_index().get(map_element)
+        if model_index is not None:
+            return self.model_elements[model_index]
+        keys = self.keys_for_value(map_element)
+        if keys:
+            return list(keys)
+        cluster_index = self._get_anchor_cluster_index(map_element)
+        if cluster_index is not None:
+            return self.model_elements[self.cluster_model_indices[cluster_index]]
+        return None
+
+    def get_child_layout_elements(
+        self,
+        child_model_element: "momapy.core.elements.ModelElement",
+        parent_model_element: "momapy.core.elements.ModelElement",
+    ) -> "list[momapy.core.elements.LayoutElement]":
+        """Return the layout elements representing ``child_model_element`` under ``parent_model_element``.
+
+        Same result as
+        [LayoutModelMapping.get_child_layout_elements][momapy.core.mapping.LayoutModelMapping.get_child_layout_elements],
+        computed on the indices of the keys of the two model elements.
+        """
+        child_index = self._get_model_index(child_model_element)
+        parent_index = self._get_model_index(parent_model_element)
+        if child_index is None or parent_index is None:
+            return []
+        child_layout_indices, child_cluster_indices = self._get_key_indices(child_index)
+        child_s2 = set(child_layout_indices)
+        for cluster_index in child_cluster_indices:
+            child_s2.update(self._get_anchor_layout_indices(cluster_index))
+        parent_layout_indices, parent_cluster_indices = self._get_key_indices(
+            parent_index
+        )
+        parent_s1 = set()
+        for cluster_index in parent_cluster_indices:
+            parent_s1 |= self._get_cluster(cluster_index)
+        for layout_index in parent_layout_indices:
+            parent_layout = self.layout_elements[layout_index]
+            if hasattr(parent_layout, "layout_elements"):
+                parent_s1.update(parent_layout.layout_elements)
+        child_layout_elements = []
+        for layout_index in sorted(child_s2):
+            layout_element = self.layout_elements[layout_index]
+            if layout_element in parent_s1:
+                child_layout_elements.append(layout_element)
+        return child_layout_elements
+
+    def __reduce__(self):
+        """Pickle hook that only serializes the elements and the arrays."""
+        return (
+            type(self),
+            (
+                self.layout_elements,
+                self.model_elements,
+                self.singleton_layout_indices,
+                self.singleton_model_indices,
+                self.cluster_indptr,
+                self.cluster_layout_indices,
+                self.cluster_model_indices,
+                self.anchor_layout_indices,
+                self.anchor_cluster_indices,
+            ),
+        )
+
+
+def _make_index_array(indices: list[int]) -> numpy.ndarray:
+    return numpy.array(indices, dtype=numpy.int32)
@@ -3,6 +3,7 @@
 import abc
 import dataclasses
 
+import momapy.core.graph
 from momapy.core.elements import MapElement, ModelElement, _walk_model_graph
 
 
@@ -30,3 +31,14 @@ class Model(MapElement):
         for field in dataclasses.fields(type(self)):
             _walk_model_graph(getattr(self, field.name), seen, result)
         return result
+
+    def get_graph(self) -> "momapy.core.graph.ModelGraph":
+        """Return the graph of the species and processes of the model.
+
+        The graph is built on the first call and then cached for the model
+        (see [get_model_graph][momapy.core.graph.get_model_graph]).
+
+        Returns:
+            The graph of the model
+        """
+        return momapy.core.graph.get_model_graph(self)
@@ -0,0 +1,371 @@
+"""Structural diff of two maps.
+
+The diff of two maps lists the model and layout elements that were added,
+removed or modified from one map to the other. Unchanged subtrees are
+pruned using their content hashes (see [momapy.hashing][]): the collections
+of the model and the layout elements of the layout whose hashes did not
+change are skipped, so that the cost of a diff is linear in the size of the
+maps and mostly spent on the parts that changed. Elements are matched by
+their source ids when the maps come with a
+[ReaderResult][momapy.io.core.ReaderResult], and by their ids otherwise.
+
+Examples:
+    ```python
+    from momapy.diff import diff_maps, make_diff_overlay
+    from momapy.io.core import read
+    from momapy.rendering.core import render_map
+
+    old_result = read("map_v1.xml")
+    new_result = read("map_v2.xml")
+    map_diff = diff_maps(old_result, new_result)
+    for change in map_diff.modified_model_elements:
+        print(change.key, change.changed_fields)
+    overlay = make_diff_overlay(new_result.obj, map_diff)
+    render_map(new_result.obj, "diff.svg", style_sheet=overlay.to_style_resolver())
+    ```
+"""
+
+import collections.abc
+import dataclasses
+
+import momapy.coloring
+import momapy.core.elements
+import momapy.core.map
+import momapy.hashing
+import momapy.io.core
+import momapy.styling.overlay
+
+
+@dataclasses.dataclass(frozen=True)
+class ElementChange(object):
+    """A model or layout element modified from one map to the other.
+
+    Attributes:
+        key: The key the two elements were matched on (a source id or an
+            element id)
+        old_element: The element of the old map
+        new_element: The element of the new map
+        changed_fields: The names of the fields whose content changed
+    """
+
+    key: str = dataclasses.field(
+        metadata={"description": "The key the two elements were matched on"}
+    )
+    old_element: momapy.core.elements.MapElement = dataclasses.field(
+        metadata={"description": "The element of the old map"}
+    )
+    new_element: momapy.core.elements.MapElement = dataclasses.field(
+        metadata={"description": "The element of the new map"}
+    )
+    changed_fields: tuple[str, ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={"description": "The names of the fields whose content changed"},
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class MapDiff(object):
+    """The changes from one map to another.
+
+    Model elements are the elements of the collections of the models (e.g.,
+    species, reactions, modulations); layout elements are the top-level
+    layout elements of the layouts. Changes to nested elements are reported
+    on their top-level element, through its changed fields.
+
+    Attributes:
+        added_model_elements: The model elements of the new map only
+        removed_model_elements: The model elements of the old map only
+        modified_model_elements: The model elements of both maps whose
+            content changed
+        added_layout_elements: The layout elements of the new map only
+        removed_layout_elements: The layout elements of the old map only
+        modified_layout_elements: The layout elements of both maps whose
+            content changed
+    """
+
+    added_model_elements: tuple[momapy.core.elements.ModelElement, ...] = (
+        dataclasses.field(
+            default_factory=tuple,
+            metadata={"description": "The model elements of the new map only"},
+        )
+    )
+    removed_model_elements: tuple[momapy.core.elements.ModelElement, ...] = (
+        dataclasses.field(
+            default_factory=tuple,
+            metadata={"description": "The model elements of the old map only"},
+        )
+    )
+    modified_model_elements: tuple[ElementChange, ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={
+            "description": "The model elements of both maps whose content changed"
+        },
+    )
+    added_layout_elements: tuple[momapy.core.elements.LayoutElement, ...] = (
+        dataclasses.field(
+            default_factory=tuple,
+            metadata={"description": "The layout elements of the new map only"},
+        )
+    )
+    removed_layout_elements: tuple[momapy.core.elements.LayoutElement, ...] = (
+        dataclasses.field(
+            default_factory=tuple,
+            metadata={"description": "The layout elements of the old map only"},
+        )
+    )
+    modified_layout_elements: tuple[ElementChange, ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={
+            "description": "The layout elements of both maps whose content changed"
+        },
+    )
+
+    def is_empty(self) -> bool:
+        """Return `True` if the diff has no change, and `False` otherwise."""
+        return not any(getattr(self, field.name) for field in dataclasses.fields(self))
+
+
+def diff_maps(
+    old: "momapy.core.map.Map | momapy.io.core.ReaderResult",
+    new: "momapy.core.map.Map | momapy.io.core.ReaderResult",
+) -> MapDiff:
+    """Return the diff of two maps.
+
+    Elements are first matched by key, and then the remaining elements with
+    the same content are matched together (e.g., an element whose id
+    changed). The key of an element is its smallest source id if the map
+    is given as a reader result that has source ids for it, and its id
+    otherwise. Matched elements of different types are reported as removed
+    and added.
+
+    Args:
+        old: The old map, or the result of reading it
+        new: The new map, or the result of reading it
+
+    Returns:
+        The diff
+    """
+    old_map, old_model_source_ids, old_layout_source_ids = _get_map_and_source_ids(old)
+    new_map, new_model_source_ids, new_layout_source_ids = _get_map_and_source_ids(new)
+    if momapy.hashing.have_same_content(old_map, new_map):
+        return MapDiff()
+    added_model_elements = []
+    removed_model_elements = []
+    modified_model_elements = []
+    old_model = old_map.model
+    new_model = new_map.model
+    if not momapy.hashing.have_same_content(old_model, new_model):
+        for field_name in _get_collection_field_names(old_model, new_model):
+            old_elements = getattr(old_model, field_name, frozenset())
+            new_elements = getattr(new_model, field_name, frozenset())
+            if momapy.hashing.have_same_content(old_elements, new_elements):
+                continue
+            added, removed, modified = _diff_elements(
+                old_elements,
+                new_elements,
+                old_model_source_ids,
+                new_model_source_ids,
+            )
+            added_model_elements += added
+            removed_model_elements += removed
+            modified_model_elements += modified
+    added_layout_elements = []
+    removed_layout_elements = []
+    modified_layout_elements = []
+    old_layout = old_map.layout
+    new_layout = new_map.layout
+    if not momapy.hashing.have_same_content(old_layout, new_layout):
+        added_layout_elements, removed_layout_elements, modified_layout_elements = (
+            _diff_elements(
+                old_layout.layout_elements,
+                new_layout.layout_elements,
+                old_layout_source_ids,
+                new_layout_source_ids,
+            )
+        )
+    return MapDiff(
+        added_model_elements=tuple(added_model_elements),
+        removed_model_elements=tuple(removed_model_elements),
+        modified_model_elements=tuple(modified_model_elements),
+        added_layout_elements=tuple(added_layout_elements),
+        removed_layout_elements=tuple(removed_layout_elements),
+        modified_layout_elements=tuple(modified_layout_elements),
+    )
+
+
+def make_diff_overlay(
+    map_: momapy.core.map.Map,
+    map_diff: MapDiff,
+    added_color: momapy.coloring.Color = momapy.coloring.green,
+    modified_color: momapy.coloring.Color = momapy.coloring.darkorange,
+    attributes: collections.abc.Iterable[str] = ("stroke", "path_stroke"),
+) -> momapy.styling.overlay.Overlay:
+    """Make an overlay highlighting the added and modified elements of a map.
+
+    The layout elements of the new map of a diff that were added or
+    modified are highlighted, as well as the layout elements representing
+    the model elements that were added or modified (the anchor only, for a
+    model element represented by a cluster of layout elements). Removed
+    elements are not part of the new map and are not highlighted.
+
+    Args:
+        map_: The new map of the diff
+        map_diff: The diff
+        added_color: The color of added elements
+        modified_color: The color of modified elements
+        attributes: The attributes set to the color, when the layout
+            element has them
+
+    Returns:
+        The overlay
+    """
+    attributes = tuple(attributes)
+    layout_model_mapping = map_.layout_model_mapping
+    colored_layout_elements = []
+    for model_elements, color in (
+        (
+            [change.new_element for change in map_diff.modified_model_elements],
+            modified_color,
+        ),
+        (map_diff.added_model_elements, added_color),
+    ):
+        for model_element in model_elements:
+            if layout_model_mapping is None:
+                break
+            for key in layout_model_mapping.keys_for_value(model_element):
+                for layout_element in layout_model_mapping.get_anchors(key):
+                    colored_layout_elements.append((layout_element, color))
+    for change in map_diff.modified_layout_elements:
+        colored_layout_elements.append((change.new_element, modified_color))
+    for layout_element in map_diff.added_layout_elements:
+        colored_layout_elements.append((layout_element, added_color))
+    styles = {}
+    for layout_element, color in colored_layout_elements:
+        style = {
+            attribute: color
+            for attribute in attributes
+            if hasattr(layout_element, attribute)
+        }
+        if style:
+            styles[layout_element.id_] = style
+    return momapy.styling.overlay.Overlay(styles)
+
+
+def _get_map_and_source_ids(map_or_result):
+    if isinstance(map_or_result, momapy.io.core.ReaderResult):
+        return (
+            map_or_result.obj,
+            map_or_result.source_id_to_model_element,
+            map_or_result.source_id_to_layout_element,
+        )
+    return map_or_result, None, None
+
+
+def _get_collection_field_names(old_model, new_model):
+    field_names = []
+    for model in (old_model, new_model):
+        for field in dataclasses.fields(model):
+            if (
+                isinstance(getattr(model, field.name), frozenset)
+                and field.name not in field_names
+            ):
+                field_names.append(field.name)
+    return field_names
+
+
+def _get_key(element, source_ids):
+    if source_ids is not None:
+        element_source_ids = source_ids.keys_for_value(element)
+        if element_source_ids:
+            return min(element_source_ids)
+    return element.id_
+
+
+def _group_by_key(elements, source_ids):
+    key_to_elements = {}
+    for element in elements:
+        key_to_elements.setdefault(_get_key(element, source_ids), []).append(element)
+    return key_to_elements
+
+
+def _get_changed_fields(old_element, new_element):
+    return tuple(
+        field.name
+        for field in dataclasses.fields(old_element)
+        if field.compare
+        and not momapy.hashing.have_same_content(
+            getattr(old_element, field.name), getattr(new_element, field.name)
+        )
+    )
+
+
+def _diff_elements(old_elements, new_elements, old_source_ids, new_source_ids):
+    old_key_to_elements = _group_by_key(old_elements, old_source_ids)
+    new_key_to_elements = _group_by_key(new_elements, new_source_ids)
+    unmatched_old_elements = []
+    unmatched_new_elements = []
+    modified = []
+    for key, old_key_elements in old_key_to_elements.items():
+        new_key_elements = new_key_to_elements.get(key, [])
+        # Elements sharing a key, such as the variants of a CellDesigner
+        # species, are first matched by content and then in order
+        new_hash_to_elements = {}
+        for new_element in new_key_elements:
+            new_hash_to_elements.setdefault(
+                momapy.hashing.content_hash(new_element), []
+            ).append(new_element)
+        remaining_old_elements = []
+        for old_element in old_key_elements:
+            same_elements = new_hash_to_elements.get(
+                momapy.hashing.content_hash(old_element)
+            )
+            if same_elements:
+                same_elements.pop()
+            else:
+                remaining_old_elements.append(old_element)
+        remaining_new_elements = [
+            new_element
+            for new_elements in new_hash_to_elements.values()
+            for new_element in new_elements
+        ]
+        for old_element, new_element in zip(
+            remaining_old_elements, remaining_new_elements
+        ):
+            if type(old_element) is type(new_element):
+                modified.append(
+                    ElementChange(
+                        key=key,
+                        old_element=old_element,
+                        new_element=new_element,
+                        changed_fields=_get_changed_fields(old_element, new_element),
+                    )
+                )
+            else:
+                unmatched_old_elements.append(old_element)
+                unmatched_new_elements.append(new_element)
+        unmatched_old_elements += remaining_old_elements[len(remaining_new_elements) :]
+        unmatched_new_elements += remaining_new_elements[len(remaining_old_elements) :]
+    for key, new_key_elements in new_key_to_elements.items():
+        if key not in old_key_to_elements:
+            unmatched_new_elements += new_key_elements
+    # Match the remaining elements with the same content, whose keys changed
+    new_hash_to_elements = {}
+    for new_element in unmatched_new_elements:
+        new_hash_to_elements.setdefault(
+            momapy.hashing.content_hash(new_element), []
+        ).append(new_element)
+    removed = []
+    for old_element in unmatched_old_elements:
+        same_elements = new_hash_to_elements.get(
+            momapy.hashing.content_hash(old_element)
+        )
+        if same_elements:
+            same_elements.pop()
+        else:
+            removed.append(old_element)
+    added = [
+        new_element
+        for new_elements in new_hash_to_elements.values()
+        for new_element in new_elements
+    ]
+    return added, removed, modified
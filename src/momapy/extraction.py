@@ -0,0 +1,142 @@
+"""Extraction of submaps around model elements."""
+
+import collections.abc
+import dataclasses
+
+import momapy.core.elements
+import momapy.core.map
+import momapy.core.mapping
+import momapy.positioning
+import momapy.utils
+
+
+def extract_submap(
+    map_: momapy.core.map.Map,
+    seeds: collections.abc.Iterable[momapy.core.elements.ModelElement],
+    hops: int = 1,
+    crop: bool = True,
+    xsep: float = 10.0,
+    ysep: float = 10.0,
+) -> momapy.core.map.Map:
+    """Return the submap made of the neighbourhood of some model elements.
+
+    The model elements within `hops` edges of a seed in the graph of the
+    model (see [ModelGraph][momapy.core.graph.ModelGraph]) are selected,
+    together with the elements they reference (the participants of a
+    selected process, the compartment of a selected species), and the
+    modulations whose source and target are both selected. The layout
+    elements mapped to the selected model elements are kept, as well as
+    the entries of the layout-model mapping for the selected model
+    elements and their descendants.
+
+    Selected model and layout elements are shared with the original map,
+    not copied, and the work done is proportional to the size of the
+    submap, apart from a pass over the top-level layout elements to keep
+    their order.
+
+    Args:
+        map_: The map
+        seeds: The model elements around which the submap is extracted.
+            They must be elements of a collection of the model
+        hops: The maximum number of edges between a seed and a selected
+            model element
+        crop: Whether to fit the layout of the submap to its layout
+            elements, excluding compartments
+        xsep: The horizontal margin of the cropped layout
+        ysep: The vertical margin of the cropped layout
+
+    Returns:
+        The submap
+
+    Raises:
+        ValueError: If a seed is not an element of a collection of the model
+    """
+    model = map_.model
+    graph = model.get_graph()
+    selected_elements = {}
+    for seed in seeds:
+        if seed in graph:
+            for element in graph.get_neighborhood(seed, k=hops):
+                selected_elements[id(element)] = element
+        elif graph.get_field_name(seed) is not None:
+            selected_elements[id(seed)] = seed
+        else:
+            raise ValueError(f"{seed!r} is not an element of the model")
+    # Add referenced elements (process participants, compartments)
+    # and the descendants whose layout elements are kept in the mapping
+    mapped_elements = dict(selected_elements)
+    for element in list(selected_elements.values()):
+        for descendant in element.descendants():
+            if id(descendant) in mapped_elements:
+                continue
+            mapped_elements[id(descendant)] = descendant
+            if graph.get_field_name(descendant) is not None:
+                selected_elements[id(descendant)] = descendant
+    # Add modulations and influences between selected elements
+    for element in list(selected_elements.values()):
+        if element not in graph:
+            continue
+        for target, edge_element in graph.get_out_edges(element):
+            if (
+                id(target) in selected_elements
+                and graph.get_field_name(edge_element) is not None
+            ):
+                selected_elements[id(edge_element)] = edge_element
+                mapped_elements[id(edge_element)] = edge_element
+    field_name_to_elements = {}
+    for element in selected_elements.values():
+        field_name_to_elements.setdefault(graph.get_field_name(element), []).append(
+            element
+        )
+    new_model = dataclasses.replace(
+        model,
+        **{
+            field.name: frozenset(field_name_to_elements.get(field.name, ()))
+            for field in dataclasses.fields(model)
+            if isinstance(getattr(model, field.name), frozenset)
+        },
+    )
+    mapping = map_.layout_model_mapping
+    mapping_items = []
+    singleton_to_key = {}
+    layout_element_ids = set()
+    crop_layout_elements = []
+    for element in mapped_elements.values():
+        for key in mapping.keys_for_value(element):
+            mapping_items.append((key, element))
+            if isinstance(key, frozenset):
+                layout_elements = key
+                for anchor in mapping._singleton_to_key.keys_for_value(key):
+                    singleton_to_key[anchor] = key
+            else:
+                layout_elements = [key]
+            for layout_element in layout_elements:
+                if id(layout_element) not in layout_element_ids:
+                    layout_element_ids.add(id(layout_element))
+                    if graph.get_field_name(element) != "compartments":
+                        crop_layout_elements.append(layout_element)
+    new_mapping = momapy.core.mapping.LayoutModelMapping(mapping_items)
+    object.__setattr__(
+        new_mapping,
+        "_singleton_to_key",
+        momapy.utils.FrozenSurjectionDict(singleton_to_key),
+    )
+    layout = map_.layout
+    layout_elements = tuple(
+        layout_element
+        for layout_element in layout.layout_elements
+        if id(layout_element) in layout_element_ids
+    )
+    layout_changes = {"layout_elements": layout_elements}
+    if crop and crop_layout_elements:
+        bbox = momapy.positioning.fit(crop_layout_elements, xsep, ysep)
+        layout_changes["position"] = bbox.position
+        layout_changes["width"] = bbox.width
+        layout_changes["height"] = bbox.height
+    new_layout = dataclasses.replace(layout, **layout_changes)
+    return dataclasses.replace(
+        map_,
+        model=new_model,
+        layout=new_layout,
+        layout_model_mapping=new_mapping,
+    )
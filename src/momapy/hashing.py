@@ -0,0 +1,150 @@
+"""Content hashing of maps, models, layouts and their elements.
+
+The content hash of an object is a BLAKE2 digest of a canonical encoding
+of its content, computed bottom-up: the hash of a dataclass is computed
+from the hashes of its fields, which are memoized on frozen dataclasses.
+Fields that are not compared (such as `id_`) are not hashed, so that two
+objects that are equal have the same content hash. Unlike the built-in
+`hash`, content hashes are stable across processes, and can be used as
+cache keys, as a fast equality pre-check or to find changed subtrees.
+
+Examples:
+    ```python
+    import momapy.hashing
+
+    momapy.hashing.content_hash(map_) == momapy.hashing.content_hash(other_map)
+    momapy.hashing.content_hexdigest(map_.layout)
+    ```
+"""
+
+import collections.abc
+import dataclasses
+import enum
+import functools
+import hashlib
+import typing
+
+import frozendict
+
+import momapy.drawing
+
+DIGEST_SIZE = 16
+"""The size of content hashes, in bytes"""
+
+
+def content_hash(obj: typing.Any) -> bytes:
+    """Return the content hash of an object.
+
+    Supported objects are `None`, `momapy.drawing.NoneValue`, booleans,
+    numbers, strings, bytes, enum members, tuples, lists, sets, mappings and
+    dataclasses whose fields are supported. The hash of a frozen dataclass
+    or of a [LayoutModelMapping][momapy.core.mapping.LayoutModelMapping]
+    is memoized on the object.
+
+    Args:
+        obj: The object
+
+    Returns:
+        The content hash, of `DIGEST_SIZE` bytes
+
+    Raises:
+        TypeError: If the object, or one of its descendants, is not supported
+    """
+    memo = getattr(obj, "__dict__", None)
+    if memo is not None:
+        digest = memo.get("_content_hash")
+        if digest is not None:
+            return digest
+    digest = _make_content_hash(obj)
+    if memo is not None and _is_frozen(obj):
+        object.__setattr__(obj, "_content_hash", digest)
+    return digest
+
+
+def content_hexdigest(obj: typing.Any) -> str:
+    """Return the content hash of an object as a hexadecimal string."""
+    return content_hash(obj).hex()
+
+
+def have_same_content(obj: typing.Any, other: typing.Any) -> bool:
+    """Return `True` if two objects have the same content hash.
+
+    Meant as a fast equality pre-check: equal objects have the same content
+    hash (for example `1` and `1.0`), and objects with the same content
+    hash are equal, except for NaN values: all NaNs have the same content
+    hash, so that content hashes are stable, but are not equal to one
+    another. `False` is also returned if the content hash of an object
+    cannot be computed, even for equal objects (for example
+    `fractions.Fraction(1, 2)` and `0.5`), so it is only conclusive for
+    supported objects.
+
+    Args:
+        obj: The first object
+        other: The second object
+
+    Returns:
+        `True` if the objects have the same content hash, `False` otherwise
+    """
+    try:
+        return content_hash(obj) == content_hash(other)
+    except TypeError:
+        return False
+
+
+def _is_frozen(obj) -> bool:
+    if dataclasses.is_dataclass(obj):
+        return obj.__dataclass_params__.frozen
+    return isinstance(obj, frozendict.frozendict)
+
+
+def _hash(*parts: bytes) -> bytes:
+    return hashlib.blake2b(b"".join(parts), digest_size=DIGEST_SIZE).digest()
+
+
+@functools.cache
+def _get_compared_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls) if field.compare)
+
+
+def _get_cls_name(cls: type) -> bytes:
+    return f"{cls.__module__}:{cls.__qualname__}".encode()
+
+
+def _make_content_hash(obj) -> bytes:
+    if obj is None:
+        return _hash(b"n")
+    if isinstance(obj, momapy.drawing.NoneValueType):
+        return _hash(b"v")
+    if isinstance(obj, enum.Enum):
+        return _hash(b"e", _get_cls_name(type(obj)), obj.name.encode())
+    if isinstance(obj, int):
+        return _hash(b"i", str(int(obj)).encode())
+    if isinstance(obj, float):
+        # Equal numbers have the same hash, as with the built-in hash
+        if obj.is_integer():
+            return _hash(b"i", str(int(obj)).encode())
+        return _hash(b"f", repr(obj).encode())
+    if isinstance(obj, str):
+        return _hash(b"s", obj.encode())
+    if isinstance(obj, bytes):
+        return _hash(b"y", obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        parts = [b"d", _get_cls_name(type(obj))]
+        for field_name in _get_compared_field_names(type(obj)):
+            parts.append(field_name.encode())
+            parts.append(content_hash(getattr(obj, field_name)))
+        return _hash(*parts)
+    if isinstance(obj, tuple):
+        return _hash(b"t", *[content_hash(element) for element in obj])
+    if isinstance(obj, list):
+        return _hash(b"l", *[content_hash(element) for element in obj])
+    if isinstance(obj, (frozenset, set)):
+        return _hash(b"u", *sorted(content_hash(element) for element in obj))
+    if isinstance(obj, collections.abc.Mapping):
+        return _hash(
+            b"m",
+            *sorted(
+                content_hash(key) + content_hash(value) for key, value in obj.items()
+            ),
+        )
+    raise TypeError(f"cannot compute the content hash of {type(obj)}")
@@ -11,11 +11,15 @@ Examples:
     ```
 """
 
+from momapy.io.core import FileHeader as FileHeader
+from momapy.io.core import FileSignature as FileSignature
 from momapy.io.core import get_reader as get_reader
 from momapy.io.core import get_writer as get_writer
+from momapy.io.core import infer_writer as infer_writer
 from momapy.io.core import list_readers as list_readers
 from momapy.io.core import list_writers as list_writers
 from momapy.io.core import read as read
+from momapy.io.core import read_file_header as read_file_header
 from momapy.io.core import reader_registry as reader_registry
 from momapy.io.core import ReaderResult as ReaderResult
 from momapy.io.core import register_lazy_reader as register_lazy_reader
@@ -25,14 +29,23 @@ from momapy.io.core import register_writer as register_writer
 from momapy.io.core import write as write
 from momapy.io.core import writer_registry as writer_registry
 from momapy.io.core import WriterResult as WriterResult
+from momapy.io.signatures import CELLDESIGNER_SIGNATURE
+from momapy.io.signatures import PICKLE_SIGNATURE
+from momapy.io.signatures import SBGNML_0_2_SIGNATURE
+from momapy.io.signatures import SBGNML_0_3_SIGNATURE
+from momapy.io.signatures import SBML_SIGNATURE
 
 
 __all__ = [
+    "FileHeader",
+    "FileSignature",
     "get_reader",
     "get_writer",
+    "infer_writer",
     "list_readers",
     "list_writers",
     "read",
+    "read_file_header",
     "reader_registry",
     "ReaderResult",
     "register_lazy_reader",
@@ -45,15 +58,27 @@ __all__ = [
 ]
 
 
-for name, import_path in [
-    ("sbgnml", "momapy.sbgn.io.sbgnml.reader:SBGNML0_3Reader"),
-    ("sbgnml-0.2", "momapy.sbgn.io.sbgnml.reader:SBGNML0_2Reader"),
-    ("sbgnml-0.3", "momapy.sbgn.io.sbgnml.reader:SBGNML0_3Reader"),
-    ("celldesigner", "momapy.celldesigner.io.celldesigner.reader:CellDesignerReader"),
-    ("sbml", "momapy.sbml.io.sbml:SBMLReader"),
-    ("pickle", "momapy.io.pickle:PickleReader"),
+for name, import_path, signature in [
+    ("sbgnml", "momapy.sbgn.io.sbgnml.reader:SBGNML0_3Reader", SBGNML_0_3_SIGNATURE),
+    (
+        "sbgnml-0.2",
+        "momapy.sbgn.io.sbgnml.reader:SBGNML0_2Reader",
+        SBGNML_0_2_SIGNATURE,
+    ),
+    (
+        "sbgnml-0.3",
+        "momapy.sbgn.io.sbgnml.reader:SBGNML0_3Reader",
+        SBGNML_0_3_SIGNATURE,
+    ),
+    (
+        "celldesigner",
+        "momapy.celldesigner.io.celldesigner.reader:CellDesignerReader",
+        CELLDESIGNER_SIGNATURE,
+    ),
+    ("sbml", "momapy.sbml.io.sbml:SBMLReader", SBML_SIGNATURE),
+    ("pickle", "momapy.io.pickle:PickleReader", PICKLE_SIGNATURE),
 ]:
-    register_lazy_reader(name, import_path)
+    register_lazy_reader(name, import_path, signature)
 
 for name, import_path in [
     ("sbgnml", "momapy.sbgn.io.sbgnml.writer:SBGNML0_3Writer"),
@@ -15,6 +15,7 @@ import os
 import dataclasses
 import abc
 import typing
+import xml.etree.ElementTree
 
 import frozendict
 
@@ -24,6 +25,9 @@ import momapy.utils
 
 reader_registry = momapy.plugins.core.PluginRegistry(entry_point_group="momapy.readers")
 writer_registry = momapy.plugins.core.PluginRegistry(entry_point_group="momapy.writers")
+reader_signatures: dict[str, "FileSignature"] = {}
+"""File signatures of the readers, by name, used to detect the format of a
+file without importing the readers"""
 
 
 def get_reader(name: str) -> type["Reader"]:
@@ -56,24 +60,38 @@ def list_readers() -> list[str]:
     return reader_registry.list_available()
 
 
-def register_reader(name: str, cls: type["Reader"]) -> None:
+def register_reader(
+    name: str, cls: type["Reader"], signature: "FileSignature | None" = None
+) -> None:
     """Register a reader class.
 
     Args:
         name: Name to register the reader under.
         cls: Reader class (must inherit from Reader).
+        signature: The file signature of the reader. If None, the
+            `signature` of the reader class is used.
     """
     reader_registry.register(name, cls)
+    if signature is None:
+        signature = getattr(cls, "signature", None)
+    if signature is not None:
+        reader_signatures[name] = signature
 
 
-def register_lazy_reader(name: str, import_path: str) -> None:
+def register_lazy_reader(
+    name: str, import_path: str, signature: "FileSignature | None" = None
+) -> None:
     """Register a reader for lazy loading.
 
     Args:
         name: Name to register the reader under.
         import_path: Import path in format "module.path:ClassName".
+        signature: The file signature of the reader. If given, format
+            detection uses it and does not import the reader.
     """
     reader_registry.register_lazy(name, import_path)
+    if signature is not None:
+        reader_signatures[name] = signature
 
 
 def get_writer(name: str) -> type["Writer"]:
@@ -126,6 +144,93 @@ def register_lazy_writer(name: str, import_path: str) -> None:
     writer_registry.register_lazy(name, import_path)
 
 
+HEADER_SIZE = 65536
+"""The number of bytes read from a file to detect its format"""
+
+
+@dataclasses.dataclass(frozen=True)
+class FileHeader:
+    """The beginning of a file, read once to detect its format.
+
+    Attributes:
+        data: The first bytes of the file.
+        root_tag: The tag of the root element, as `{namespace}name`, if
+            the file is an XML document, and None otherwise.
+        namespaces: The namespaces declared in the first bytes of the file,
+            if it is an XML document.
+    """
+
+    data: bytes = b""
+    root_tag: str | None = None
+    namespaces: frozenset[str] = frozenset()
+
+
+@dataclasses.dataclass(frozen=True)
+class FileSignature:
+    """Criteria that the header of a file of a given format meets.
+
+    A header matches a signature if it meets all the criteria of the
+    signature that are not None.
+
+    Attributes:
+        magic: The bytes the file starts with.
+        root_name: The name of the root element, without its namespace.
+        namespace: A namespace declared in the header.
+    """
+
+    magic: bytes | None = None
+    root_name: str | None = None
+    namespace: str | None = None
+
+    def matches(self, header: FileHeader) -> bool:
+        """Return `True` if a file header matches the signature, `False` otherwise."""
+        if self.magic is not None and not header.data.startswith(self.magic):
+            return False
+        if self.root_name is not None and (
+            header.root_tag is None
+            or header.root_tag.rpartition("}")[2] != self.root_name
+        ):
+            return False
+        return self.namespace is None or self.namespace in header.namespaces
+
+
+def read_file_header(
+    file_path: str | os.PathLike, size: int = HEADER_SIZE
+) -> FileHeader:
+    """Read the header of a file.
+
+    At most `size` bytes are read. If they start an XML document, they
+    are parsed incrementally to find the root element and the declared
+    namespaces; a document truncated by the bound is not an error.
+
+    Args:
+        file_path: Path of the file.
+        size: The maximum number of bytes to read.
+
+    Returns:
+        The header of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(size)
+    root_tag = None
+    namespaces = set()
+    if not data.startswith(b"\x80"):  # pickle protocol 2 or later
+        parser = xml.etree.ElementTree.XMLPullParser(events=("start", "start-ns"))
+        try:
+            parser.feed(data)
+            for event, value in parser.read_events():
+                if event == "start-ns":
+                    namespaces.add(value[1])
+                elif root_tag is None:
+                    root_tag = value.tag
+        except xml.etree.ElementTree.ParseError:
+            pass
+    return FileHeader(data=data, root_tag=root_tag, namespaces=frozenset(namespaces))
+
+
 @dataclasses.dataclass
 class IOResult:
     """Base class for I/O results."""
@@ -203,9 +308,13 @@ def read(
 ) -> ReaderResult:
     """Read a map file.
 
-    If reader is specified, uses that reader. Otherwise, checks all registered
-    readers to find one that supports the file format using their check_file
-    method. Uses the first matching reader found.
+    If reader is specified, uses that reader. Otherwise, finds the first
+    registered reader that supports the file format. The header of the file
+    is read once and matched against the file signatures of the readers
+    (see [read_file_header][momapy.io.core.read_file_header]), so that
+    detection reads a bounded number of bytes and only imports the matching
+    reader. Readers without a file signature are checked with their
+    check_file method.
 
     Args:
         file_path: Path of the file to read.
@@ -217,7 +326,8 @@ def read(
         ReaderResult containing the read object and metadata.
 
     Raises:
-        ValueError: If no suitable reader is found.
+        ValueError: If no suitable reader is found, including when the
+            file cannot be read.
 
     Examples:
         ```python
@@ -230,11 +340,24 @@ def read(
         reader_cls = get_reader(reader)
     else:
         reader_cls = None
+        header = None
         for name in reader_registry.list_available():
-            candidate_cls = get_reader(name)
-            if candidate_cls.check_file(file_path):
-                reader_cls = candidate_cls
-                break
+            signature = reader_signatures.get(name)
+            if signature is not None:
+                if header is None:
+                    try:
+                        header = read_file_header(file_path)
+                    except OSError:
+                        # A file that cannot be read matches no signature
+                        header = FileHeader()
+                if signature.matches(header):
+                    reader_cls = get_reader(name)
+                    break
+            else:
+                candidate_cls = get_reader(name)
+                if candidate_cls.check_file(file_path):
+                    reader_cls = candidate_cls
+                    break
         if reader_cls is None:
             raise ValueError(
                 f"could not find a suitable registered reader for file '{file_path}'"
@@ -274,14 +397,56 @@ def write(
     return result
 
 
+def infer_writer(obj: typing.Any) -> str:
+    """Return the name of the registered writer for an object, from its type.
+
+    Args:
+        obj: The object to write (a CellDesigner or an SBGN map).
+
+    Returns:
+        The name of the writer to use.
+
+    Raises:
+        ValueError: If no writer can be inferred for the type of the object.
+
+    Examples:
+        ```python
+        from momapy.io.core import infer_writer, write
+        write(map_obj, "output.xml", writer=infer_writer(map_obj))
+        ```
+    """
+    import momapy.celldesigner.map
+    import momapy.sbgn.map
+
+    for map_cls, writer in (
+        (momapy.celldesigner.map.CellDesignerMap, "celldesigner"),
+        (momapy.sbgn.map.SBGNMap, "sbgnml"),
+    ):
+        if isinstance(obj, map_cls):
+            return writer
+    raise ValueError(f"could not infer writer for map type {type(obj).__name__}")
+
+
 class Reader(abc.ABC):
     """Abstract base class for map readers.
 
-    Implementations must override read() and check_file() methods.
+    Implementations must override the read() method, and either define a
+    `signature`, matched against the header of a file to detect its format,
+    or override the check_file() method.
 
     Examples:
         ```python
         class MyFormatReader(Reader):
+            signature = FileSignature(namespace="http://example.org/myfmt")
+
+            @classmethod
+            def read(cls, file_path, **options):
+
+                # Implementation
+                pass
+
+
+        class MyOtherFormatReader(Reader):
             @classmethod
             def read(cls, file_path, **options):
 
@@ -294,6 +459,8 @@ class Reader(abc.ABC):
         ```
     """
 
+    signature: typing.ClassVar[FileSignature | None] = None
+
     @classmethod
     @abc.abstractmethod
     def read(cls, file_path: str | os.PathLike, **options: typing.Any) -> ReaderResult:
@@ -309,17 +476,25 @@ class Reader(abc.ABC):
         pass
 
     @classmethod
-    @abc.abstractmethod
     def check_file(cls, file_path: str | os.PathLike) -> bool:
         """Check if this reader supports the given file.
 
+        By default, matches the header of the file against the signature
+        of the reader.
+
         Args:
             file_path: Path of the file to check.
 
         Returns:
             True if the file is supported by this reader.
         """
-        pass
+        if cls.signature is None:
+            return False
+        try:
+            header = read_file_header(file_path)
+        except OSError:
+            return False
+        return cls.signature.matches(header)
 
 
 class Writer(abc.ABC):
@@ -14,6 +14,7 @@ import momapy.builder
 import momapy.core.elements
 import momapy.core.map
 import momapy.io.core
+import momapy.io.signatures
 import momapy.utils
 
 
@@ -58,17 +59,13 @@ def _filter_annotation_mappings(
 
 
 class PickleReader(momapy.io.core.Reader):
-    """Reader for pickled maps."""
+    """Reader for pickled maps.
 
-    @classmethod
-    def check_file(cls, file_path: str | os.PathLike) -> bool:
-        """Return True if `file_path` contains a valid pickle stream."""
-        with open(file_path, "rb") as f:
-            try:
-                pickle.load(f)
-            except Exception:
-                return False
-            return True
+    Pickles of protocol 2 or later, which start with the PROTO opcode, are
+    detected from their first byte, without being unpickled.
+    """
+
+    signature = momapy.io.signatures.PICKLE_SIGNATURE
 
     @classmethod
     def read(
@@ -101,7 +98,7 @@ class PickleReader(momapy.io.core.Reader):
                 include_classes=[momapy.core.elements.LayoutElement],
             )
         elif not with_model or not with_layout:
-            map_builder = momapy.builder.builder_from_object(obj)
+            map_builder = momapy.builder.builder_from_object(obj, lazy=True)
             if not with_model:
                 map_builder.model = None
                 _filter_annotation_mappings(
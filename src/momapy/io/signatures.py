@@ -0,0 +1,16 @@
+"""File signatures of the built-in readers.
+
+The signatures are shared by the reader classes and the registration of
+the lazy readers, so that the format of a file is detected without
+importing the module of its reader.
+"""
+
+from momapy.io.core import FileSignature
+
+SBGNML_0_2_SIGNATURE = FileSignature(namespace="http://sbgn.org/libsbgn/0.2")
+SBGNML_0_3_SIGNATURE = FileSignature(namespace="http://sbgn.org/libsbgn/0.3")
+CELLDESIGNER_SIGNATURE = FileSignature(
+    namespace="http://www.sbml.org/2001/ns/celldesigner"
+)
+SBML_SIGNATURE = FileSignature(root_name="sbml")
+PICKLE_SIGNATURE = FileSignature(magic=b"\x80")
@@ -14,6 +14,7 @@ import momapy.core.elements
 import momapy.core.layout
 import momapy.core.map
 import momapy.core.model
+import momapy.hashing
 import momapy.utils
 
 
@@ -134,9 +135,20 @@ class ReadingContext:
     layout_model_mapping: typing.Any = None
     with_annotations: bool = True
     with_notes: bool = True
-    model_element_cache: dict[
-        momapy.core.elements.ModelElement, momapy.core.elements.ModelElement
+    model_element_cache: dict[bytes, momapy.core.elements.ModelElement] = (
+        dataclasses.field(default_factory=dict)
+    )
+    """Maps the content hash of a registered model element to the
+    surviving element with that content.  Content hashes are memoized on
+    frozen elements, so that deduplication neither hashes nor compares
+    whole element trees."""
+    interned_model_elements: dict[
+        tuple[bytes, str], momapy.core.elements.ModelElement
     ] = dataclasses.field(default_factory=dict)
+    """Hash-consing table: maps the content hash and id of a frozen model
+    element to the canonical element with that content and id.  The
+    descendants of registered elements are interned bottom-up, so that
+    repeated subtrees are the same object and compare by identity."""
     model_element_remap: momapy.utils.IdentitySurjectionDict = dataclasses.field(
         default_factory=momapy.utils.IdentitySurjectionDict
     )
@@ -284,8 +296,8 @@ def remap_model_element(
     # Chain: if earlier A→B and now B→C, update A→C.
     # Uses the remap's identity inverse to find all entries whose
     # surviving element is the current evicted element.
-    for evicted_id in list(
-        reading_context.model_element_remap.inverse.get(id(evicted_element), ())
+    for evicted_id in reading_context.model_element_remap.keys_for_value(
+        evicted_element
     ):
         reading_context.model_element_remap[evicted_id] = surviving_element
     # Record this eviction.
@@ -377,6 +389,70 @@ def apply_remap_to_layout_model_mapping(
                 layout_model_mapping[layout_element] = new_model_element_key
 
 
+def intern_model_element(
+    reading_context: ReadingContext,
+    model_element: momapy.core.elements.ModelElement,
+) -> momapy.core.elements.ModelElement:
+    """Return the canonical element equal to a frozen model element.
+
+    Elements are interned by content hash and id, so that interning
+    never merges elements with different ids.  The model element
+    descendants of the element are interned first, so that an element
+    whose children were replaced by their canonical elements is rebuilt.
+    Replaced elements are remapped to their canonical elements.
+
+    Args:
+        reading_context: The reading context holding the hash-consing table.
+        model_element: The frozen element to intern.
+
+    Returns:
+        The canonical element: a previously interned element equal to
+        `model_element`, or `model_element` (possibly rebuilt) itself.
+    """
+    key = (momapy.hashing.content_hash(model_element), model_element.id_)
+    interned_element = reading_context.interned_model_elements.get(key)
+    if interned_element is None:
+        interned_element = _intern_children(reading_context, model_element)
+        reading_context.interned_model_elements[key] = interned_element
+    elif interned_element is not model_element:
+        remap_model_element(reading_context, model_element, interned_element)
+    return interned_element
+
+
+def _intern_children(reading_context, model_element):
+    changes = {}
+    for field in dataclasses.fields(model_element):
+        if not field.compare:
+            continue
+        value = getattr(model_element, field.name)
+        if isinstance(value, momapy.core.elements.ModelElement):
+            interned_value = intern_model_element(reading_context, value)
+        elif isinstance(value, (frozenset, tuple)) and any(
+            isinstance(element, momapy.core.elements.ModelElement) for element in value
+        ):
+            interned_elements = [
+                intern_model_element(reading_context, element)
+                if isinstance(element, momapy.core.elements.ModelElement)
+                else element
+                for element in value
+            ]
+            if all(
+                interned_element is element
+                for interned_element, element in zip(interned_elements, value)
+            ):
+                continue
+            interned_value = type(value)(interned_elements)
+        else:
+            continue
+        if interned_value is not value:
+            changes[field.name] = interned_value
+    if not changes:
+        return model_element
+    interned_element = dataclasses.replace(model_element, **changes)
+    remap_model_element(reading_context, model_element, interned_element)
+    return interned_element
+
+
 def register_model_element(
     reading_context: ReadingContext,
     model_element: momapy.core.elements.ModelElement,
@@ -385,8 +461,11 @@ def register_model_element(
 ) -> momapy.core.elements.ModelElement:
     """Register a model element with incremental deduplication.
 
-    If an equal element already exists in the collection, keeps the
-    one with the smallest id_ and remaps stale references.
+    The model element descendants of the element are interned (see
+    `intern_model_element`).  If an equal element was already
+    registered, keeps the one with the smallest id_ and remaps stale
+    references.  Equal elements are found by content hash, so
+    that deduplication does not compare or hash whole element trees.
     Accumulates a remap for the final layout_model_mapping pass.
 
     Args:
@@ -399,19 +478,21 @@ def register_model_element(
         The surviving element (either the new one or the previously
         registered one, whichever has the smallest id_).
     """
-    existing_element = reading_context.model_element_cache.get(model_element)
-    surviving_element = momapy.utils.add_or_replace_element_in_set(
-        model_element,
-        collection,
-        func=lambda new, old: new.id_ < old.id_,
-        cache=reading_context.model_element_cache,
-    )
+    content_hash = momapy.hashing.content_hash(model_element)
+    existing_element = reading_context.model_element_cache.get(content_hash)
+    if existing_element is None or existing_element is model_element:
+        surviving_element = _intern_children(reading_context, model_element)
+        evicted_element = None
+    elif model_element.id_ < existing_element.id_:
+        surviving_element = _intern_children(reading_context, model_element)
+        evicted_element = existing_element
+        collection.discard(existing_element)
+    else:
+        surviving_element = existing_element
+        evicted_element = model_element
+    collection.add(surviving_element)
+    reading_context.model_element_cache[content_hash] = surviving_element
     reading_context.xml_id_to_model_element.add(id_, surviving_element)
-    if existing_element is not None:
-        evicted_element = (
-            model_element
-            if model_element is not surviving_element
-            else existing_element
-        )
+    if evicted_element is not None:
         remap_model_element(reading_context, evicted_element, surviving_element)
     return surviving_element
@@ -17,12 +17,15 @@ Examples:
     ```
 """
 
+import contextlib
 import dataclasses
+import threading
 import typing
 import abc
 
 _registered_object_callbacks = {}
 _registered_attribute_callbacks = {}
+_batch_state = threading.local()
 
 
 @dataclasses.dataclass(frozen=True)
@@ -157,6 +160,10 @@ def trigger_event(event):
         trigger_event(ChangedEvent(my_obj, "value"))
         ```
     """
+    batched_events = getattr(_batch_state, "events", None)
+    if batched_events is not None:
+        batched_events.setdefault((type(event), id(event.obj), event.attr_name), event)
+        return
     if event.attr_name is None:
         if (
             id(event.obj) in _registered_object_callbacks
@@ -202,4 +209,39 @@ class Monitored:
 
     def __setattr__(self, name, value):
         super().__setattr__(name, value)
-        trigger_event(SetEvent(self, name))
+        # Set events are only dispatched to attribute callbacks, so that no
+        # event is made for objects without any
+        if id(self) in _registered_attribute_callbacks:
+            trigger_event(SetEvent(self, name))
+
+
+@contextlib.contextmanager
+def batch():
+    """Return a context manager that coalesces the events triggered in it.
+
+    The events triggered in the context by the current thread are not
+    dispatched immediately, but when the outermost batch exits, in the order
+    they were first triggered. Events of the same type on the same object
+    and attribute are dispatched only once. If the context exits with an
+    exception, its events are discarded.
+
+    Examples:
+        ```python
+        with batch():
+            obj.x = 1
+            obj.x = 2  # the callbacks on x are called once, on exit
+        ```
+    """
+    if getattr(_batch_state, "events", None) is not None:
+        yield
+        return
+    _batch_state.events = {}
+    try:
+        yield
+    except BaseException:
+        _batch_state.events = None
+        raise
+    events = _batch_state.events
+    _batch_state.events = None
+    for event in events.values():
+        trigger_event(event)
@@ -15,6 +15,7 @@ Examples:
 """
 
 import collections.abc
+import dataclasses
 
 import momapy.core
 import momapy.core.elements
@@ -915,3 +916,75 @@ def set_cross_vh_of(
     """
     position = cross_vh_of(obj2, obj3)
     set_position(obj1, position, anchor)
+
+
+def move_map_to_top_left(map_: "momapy.core.map.Map") -> "momapy.core.map.Map":
+    """Translate all layout element positions so the layout starts at (0, 0).
+
+    Computes the layout bounding box, then translates all positions by
+    the negative of the top-left corner coordinates.
+
+    Args:
+        map_: The map object to translate.
+
+    Returns:
+        A new map with all layout positions translated to the top left.
+    """
+    bbox = map_.layout.bbox()
+    min_x = bbox.x - bbox.width / 2
+    min_y = bbox.y - bbox.height / 2
+    if min_x == 0 and min_y == 0:
+        return map_
+    map_builder = momapy.builder.builder_from_object(map_)
+    _translate_layout_element_builder(map_builder.layout, -min_x, -min_y)
+    return momapy.builder.object_from_builder(map_builder)
+
+
+def _translate_layout_element_builder(layout_element, translation_x, translation_y):
+    """Recursively translate all positions in a layout element builder.
+
+    Walks the layout element tree and shifts all positional attributes
+    (node positions, text positions, arc segment points) by the given
+    translation amounts. Operates on builders in place.
+
+    Args:
+        layout_element: A layout element builder to translate.
+        translation_x: The horizontal translation amount.
+        translation_y: The vertical translation amount.
+    """
+    if hasattr(layout_element, "position"):
+        layout_element.position = momapy.geometry.Point(
+            layout_element.position.x + translation_x,
+            layout_element.position.y + translation_y,
+        )
+    children = layout_element.children()
+    # The label is usually also a child, and must only be translated once
+    if getattr(layout_element, "label", None) is not None and not any(
+        child is layout_element.label for child in children
+    ):
+        layout_element.label.position = momapy.geometry.Point(
+            layout_element.label.position.x + translation_x,
+            layout_element.label.position.y + translation_y,
+        )
+    if hasattr(layout_element, "segments"):
+        new_segments = []
+        for segment in layout_element.segments:
+            new_point_attributes = {}
+            for attribute_name in [
+                "p1",
+                "p2",
+                "control_point",
+                "control_point1",
+                "control_point2",
+            ]:
+                if hasattr(segment, attribute_name):
+                    point = getattr(segment, attribute_name)
+                    new_point_attributes[attribute_name] = momapy.geometry.Point(
+                        point.x + translation_x,
+                        point.y + translation_y,
+                    )
+            new_segments.append(dataclasses.replace(segment, **new_point_attributes))
+        layout_element.segments = new_segments
+    for child in children:
+        if child is not None:
+            _translate_layout_element_builder(child, translation_x, translation_y)
@@ -15,6 +15,7 @@ from momapy.rendering.core import get_renderer as get_renderer
 from momapy.rendering.core import list_renderers as list_renderers
 from momapy.rendering.core import register_lazy_renderer as register_lazy_renderer
 from momapy.rendering.core import register_renderer as register_renderer
+from momapy.rendering.core import RenderProfiler as RenderProfiler
 from momapy.rendering.core import render_layout_element as render_layout_element
 from momapy.rendering.core import render_layout_elements as render_layout_elements
 from momapy.rendering.core import render_map as render_map
@@ -23,6 +24,7 @@ from momapy.rendering.core import renderer_registry as renderer_registry
 
 
 __all__ = [
+    "RenderProfiler",
     "get_renderer",
     "list_renderers",
     "register_lazy_renderer",
@@ -5,8 +5,11 @@ import copy
 import abc
 import typing
 import collections.abc
+import contextlib
+import json
 import os
 import pathlib
+import time
 
 import momapy.drawing
 import momapy.plugins.core
@@ -85,6 +88,12 @@ def _detect_renderer(format_: str) -> str:
     raise ValueError(f"No renderer available for format '{format_}'")
 
 
+def _measure_phase(profiler: "RenderProfiler | None", phase: str):
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.measure("phase", phase)
+
+
 def render_layout_element(
     layout_element: momapy.core.elements.LayoutElement,
     file_path: str | os.PathLike,
@@ -92,6 +101,7 @@ def render_layout_element(
     renderer: str | None = None,
     style_sheet: momapy.styling.StyleSheet | None = None,
     to_top_left: bool = False,
+    profiler: "RenderProfiler | None" = None,
 ):
     """Render a layout element to a file in the given format with the given registered renderer
 
@@ -102,6 +112,7 @@ def render_layout_element(
         renderer: The registered renderer to use. If None, auto-detected based on format.
         style_sheet: An optional style sheet to apply before rendering
         to_top_left: Whether to move the layout element to the top left or not before rendering
+        profiler: An optional profiler recording the time spent in each rendering phase
     """
     render_layout_elements(
         layout_elements=[layout_element],
@@ -110,6 +121,7 @@ def render_layout_element(
         renderer=renderer,
         style_sheet=style_sheet,
         to_top_left=to_top_left,
+        profiler=profiler,
     )
 
 
@@ -121,6 +133,7 @@ def render_layout_elements(
     style_sheet: momapy.styling.StyleSheet | None = None,
     to_top_left: bool = False,
     multi_pages: bool = True,
+    profiler: "RenderProfiler | None" = None,
 ):
     """Render a collection of layout elements to a file in the given format with the given registered renderer.
 
@@ -129,9 +142,16 @@ def render_layout_elements(
         file_path: The output file path
         format_: The output format. If None, inferred from file extension.
         renderer: The registered renderer to use. If None, auto-detected based on format.
-        style_sheet: An optional style sheet to apply before rendering
+        style_sheet: An optional style sheet or style resolver to apply.
+            Layout elements are styled at render time, without being copied,
+            unless the style sheet may change their geometry (see
+            [StyleResolver.changes_geometry][momapy.styling.StyleResolver.changes_geometry]):
+            they are then styled before being rendered, so that arcs are
+            drawn against their styled source and target.
         to_top_left: Whether to move the layout elements to the top left before rendering
         multi_pages: Whether to render each layout element on a separate page
+        profiler: An optional profiler recording the time spent in each
+            rendering phase, layout element class and drawing element type
     """
     if format_ is None:
         file_path_obj = pathlib.Path(file_path)
@@ -143,86 +163,136 @@ def render_layout_elements(
     if renderer is None:
         renderer = _detect_renderer(format_)
 
-    def _prepare_layout_elements(layout_elements, style_sheet=None, to_top_left=False):
+    style_resolver = None
+    if isinstance(style_sheet, momapy.styling.StyleResolver):
+        style_resolver = style_sheet
+    elif style_sheet is not None:
+        if (
+            not isinstance(style_sheet, collections.abc.Collection)
+            or isinstance(style_sheet, str)
+            or isinstance(style_sheet, momapy.styling.StyleSheet)
+        ):
+            style_sheets = [style_sheet]
+        else:
+            style_sheets = style_sheet
+        style_sheets = [
+            (
+                momapy.styling.StyleSheet.from_file(style_sheet)
+                if not isinstance(
+                    style_sheet,
+                    (
+                        momapy.styling.StyleSheet,
+                        momapy.styling.LayeredStyleSheet,
+                    ),
+                )
+                else style_sheet
+            )
+            for style_sheet in style_sheets
+        ]
+        style_sheet = momapy.styling.LayeredStyleSheet(tuple(style_sheets))
+        with _measure_phase(profiler, "style"):
+            style_resolver = momapy.styling.StyleResolver.from_style_sheet(style_sheet)
+    resolve_at_render_time = (
+        style_resolver is not None and not style_resolver.changes_geometry()
+    )
+
+    def _prepare_layout_elements(layout_elements):
+        # Layout elements are styled at render time by the style resolver
+        # when possible, and only their root is copied to move it to the top
+        # left
         bboxes = [layout_element.bbox() for layout_element in layout_elements]
         bbox = momapy.positioning.fit(bboxes)
         max_x = bbox.x + bbox.width / 2
         max_y = bbox.y + bbox.height / 2
-        if style_sheet is not None or to_top_left:
-            new_layout_elements = []
-            for layout_element in layout_elements:
-                if isinstance(layout_element, momapy.core.elements.LayoutElement):
-                    new_layout_elements.append(
-                        momapy.builder.builder_from_object(layout_element)
-                    )
-                elif isinstance(layout_element, momapy.builder.Builder):
-                    new_layout_elements.append(copy.deepcopy(layout_element))
-            layout_elements = new_layout_elements
-        if style_sheet is not None:
-            if (
-                not isinstance(style_sheet, collections.abc.Collection)
-                or isinstance(style_sheet, str)
-                or isinstance(style_sheet, momapy.styling.StyleSheet)
-            ):
-                style_sheets = [style_sheet]
-            else:
-                style_sheets = style_sheet
-            style_sheets = [
-                (
-                    momapy.styling.StyleSheet.from_file(style_sheet)
-                    if not isinstance(style_sheet, momapy.styling.StyleSheet)
-                    else style_sheet
-                )
-                for style_sheet in style_sheets
-            ]
-            style_sheet = momapy.styling.combine_style_sheets(style_sheets)
-            for layout_element in layout_elements:
-                momapy.styling.apply_style_sheet(layout_element, style_sheet)
         if to_top_left:
             min_x = bbox.x - bbox.width / 2
             min_y = bbox.y - bbox.height / 2
             max_x -= min_x
             max_y -= min_y
             translation = momapy.geometry.Translation(-min_x, -min_y)
-            for layout_element in layout_elements:
-                for attr_name in ["group_transform", "transform"]:
-                    if hasattr(layout_element, attr_name):
-                        if getattr(layout_element, attr_name) is None:
-                            setattr(layout_element, attr_name, [])
-                        getattr(layout_element, attr_name).append(translation)
-                        break
-        return layout_elements, max_x, max_y
+        new_layout_elements = []
+        for layout_element in layout_elements:
+            if isinstance(layout_element, momapy.builder.Builder):
+                if style_resolver is not None:
+                    layout_element = momapy.builder.object_from_builder(layout_element)
+                elif to_top_left:
+                    layout_element = copy.deepcopy(layout_element)
+            if style_resolver is not None and not resolve_at_render_time:
+                layout_element = style_resolver.apply(layout_element)
+            if to_top_left:
+                layout_element = _translate_layout_element(layout_element, translation)
+            new_layout_elements.append(layout_element)
+        return new_layout_elements, max_x, max_y
+
+    def _render_prepared_layout_element(renderer_instance, layout_element):
+        if not resolve_at_render_time:
+            renderer_instance.render_layout_element(layout_element)
+        else:
+            renderer_instance.render_styled_layout_element(
+                layout_element, style_resolver
+            )
 
     renderer_cls = get_renderer(renderer)
     if not multi_pages:
-        prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
-            layout_elements, style_sheet, to_top_left
-        )
+        with _measure_phase(profiler, "prepare"):
+            prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
+                layout_elements
+            )
         renderer_instance = renderer_cls.from_file(file_path, max_x, max_y, format_)
+        if profiler is not None:
+            renderer_instance.enable_profiling(profiler)
         renderer_instance.begin_session()
         for prepared_layout_element in prepared_layout_elements:
-            renderer_instance.render_layout_element(prepared_layout_element)
+            _render_prepared_layout_element(renderer_instance, prepared_layout_element)
         renderer_instance.end_session()
     else:
         if layout_elements:
             layout_element = layout_elements[0]
-            prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
-                [layout_element], style_sheet, to_top_left
-            )
+            with _measure_phase(profiler, "prepare"):
+                prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
+                    [layout_element]
+                )
             renderer_instance = renderer_cls.from_file(file_path, max_x, max_y, format_)
+            if profiler is not None:
+                renderer_instance.enable_profiling(profiler)
             renderer_instance.begin_session()
-            renderer_instance.render_layout_element(prepared_layout_elements[0])
+            _render_prepared_layout_element(
+                renderer_instance, prepared_layout_elements[0]
+            )
             for layout_element in layout_elements[1:]:
-                prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
-                    [layout_element], style_sheet, to_top_left
-                )
+                with _measure_phase(profiler, "prepare"):
+                    prepared_layout_elements, max_x, max_y = _prepare_layout_elements(
+                        [layout_element]
+                    )
                 renderer_instance.new_page(max_x, max_y)
-                renderer_instance.render_layout_element(prepared_layout_elements[0])
+                _render_prepared_layout_element(
+                    renderer_instance, prepared_layout_elements[0]
+                )
         else:
             renderer_instance = renderer_cls.from_file(file_path, 0, 0, format_)
+            if profiler is not None:
+                renderer_instance.enable_profiling(profiler)
         renderer_instance.end_session()
 
 
+def _translate_layout_element(layout_element, translation):
+    for attr_name in ["group_transform", "transform"]:
+        if hasattr(layout_element, attr_name):
+            transform = getattr(layout_element, attr_name)
+            if isinstance(layout_element, momapy.builder.Builder):
+                if transform is None:
+                    setattr(layout_element, attr_name, [])
+                getattr(layout_element, attr_name).append(translation)
+            else:
+                if transform is None:
+                    transform = ()
+                layout_element = dataclasses.replace(
+                    layout_element, **{attr_name: tuple(transform) + (translation,)}
+                )
+            break
+    return layout_element
+
+
 def render_map(
     map_: momapy.core.map.Map,
     file_path: str | os.PathLike,
@@ -230,6 +300,7 @@ def render_map(
     renderer: str | None = None,
     style_sheet: momapy.styling.StyleSheet | None = None,
     to_top_left: bool = False,
+    profiler: "RenderProfiler | None" = None,
 ):
     """Render a map to a file in the given format with the given registered renderer.
 
@@ -240,6 +311,7 @@ def render_map(
         renderer: The registered renderer to use. If None, auto-detected based on format.
         style_sheet: An optional style sheet to apply before rendering
         to_top_left: Whether to move the map to the top left before rendering
+        profiler: An optional profiler recording the time spent in each rendering phase
 
     Examples:
         ```python
@@ -254,7 +326,15 @@ def render_map(
         render_map(sbgn_map, "output.svg")
         ```
     """
-    render_maps([map_], file_path, format_, renderer, style_sheet, to_top_left)
+    render_maps(
+        [map_],
+        file_path,
+        format_,
+        renderer,
+        style_sheet,
+        to_top_left,
+        profiler=profiler,
+    )
 
 
 def render_maps(
@@ -265,6 +345,7 @@ def render_maps(
     style_sheet: momapy.styling.StyleSheet | None = None,
     to_top_left: bool = False,
     multi_pages: bool = True,
+    profiler: "RenderProfiler | None" = None,
 ):
     """Render a collection of maps to a file in the given format with the given registered renderer.
 
@@ -276,6 +357,7 @@ def render_maps(
         style_sheet: An optional style sheet to apply before rendering
         to_top_left: Whether to move the maps to the top left before rendering
         multi_pages: Whether to render each map on a separate page
+        profiler: An optional profiler recording the time spent in each rendering phase
 
     Examples:
         ```python
@@ -301,9 +383,213 @@ def render_maps(
         style_sheet=style_sheet,
         to_top_left=to_top_left,
         multi_pages=multi_pages,
+        profiler=profiler,
     )
 
 
+@dataclasses.dataclass
+class RenderProfiler:
+    """Class for collecting cumulative timings of rendering runs.
+
+    Records the total time and number of calls per category and name. The
+    categories are:
+
+    - ``phase``: one of ``prepare`` (which includes ``style``), ``style``,
+      ``compile`` (computing the drawing elements of layout elements),
+      ``draw`` (backend draw calls) and ``encode`` (writing the output)
+    - ``layout_element``: per layout element class
+    - ``drawing_element``: per drawing element type
+    - ``filter``: per filter, named after its effect types
+
+    A profiler is attached to a renderer instance with
+    [Renderer.enable_profiling][momapy.rendering.core.Renderer.enable_profiling],
+    which wraps the methods of that instance only: renderers without a
+    profiler run unchanged code and pay no overhead.
+
+    Examples:
+        ```python
+        profiler = RenderProfiler()
+        render_map(map_, "output.svg", profiler=profiler)
+        profiler.to_json("profile.json")
+        ```
+    """
+
+    _stats: dict[tuple[str, str], list] = dataclasses.field(default_factory=dict)
+    _stacks: dict[tuple[str, ...], float] = dataclasses.field(default_factory=dict)
+    _frames: list[str] = dataclasses.field(default_factory=list)
+    _children_times: list[float] = dataclasses.field(default_factory=list)
+
+    @contextlib.contextmanager
+    def measure(self, category: str, name: str):
+        """Return a context manager recording the time spent in its body.
+
+        Measures can be nested: the nesting is kept to produce
+        flamegraph-compatible stacks.
+
+        Args:
+            category: The category of the measure
+            name: The name of the measure within its category
+        """
+        self._frames.append(name)
+        self._children_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            children_time = self._children_times.pop()
+            stack = tuple(self._frames)
+            self._stacks[stack] = self._stacks.get(stack, 0.0) + max(
+                duration - children_time, 0.0
+            )
+            self._frames.pop()
+            if self._children_times:
+                self._children_times[-1] += duration
+            self.record(category, name, duration)
+
+    def record(self, category: str, name: str, duration: float, calls: int = 1):
+        """Add a duration (in seconds) and a number of calls to a measure"""
+        stat = self._stats.get((category, name))
+        if stat is None:
+            self._stats[(category, name)] = [duration, calls]
+        else:
+            stat[0] += duration
+            stat[1] += calls
+
+    def get_time(self, category: str, name: str) -> float:
+        """Return the cumulative time (in seconds) recorded for a measure"""
+        stat = self._stats.get((category, name))
+        if stat is None:
+            return 0.0
+        return stat[0]
+
+    def get_calls(self, category: str, name: str) -> int:
+        """Return the number of calls recorded for a measure"""
+        stat = self._stats.get((category, name))
+        if stat is None:
+            return 0
+        return stat[1]
+
+    def reset(self):
+        """Discard all recorded measures"""
+        self._stats.clear()
+        self._stacks.clear()
+        self._frames.clear()
+        self._children_times.clear()
+
+    def attach(self, renderer: "Renderer"):
+        """Instrument a renderer instance so that its rendering is recorded.
+
+        Wraps the `render_layout_element`, `render_styled_layout_element`,
+        `render_drawing_element` and `end_session` methods of the given
+        instance. The time spent in a
+        layout element that is not spent drawing its drawing elements is
+        recorded as its `compile` time.
+
+        Args:
+            renderer: The renderer to instrument
+        """
+        render_drawing_element = renderer.render_drawing_element
+        end_session = renderer.end_session
+        draw_depth = [0]
+
+        def _profile_render_layout_element(render_layout_element):
+            def _profiled_render_layout_element(layout_element, *args):
+                draw_time = self.get_time("phase", "draw")
+                start = time.perf_counter()
+                with self.measure("layout_element", _get_class_name(layout_element)):
+                    render_layout_element(layout_element, *args)
+                duration = time.perf_counter() - start
+                self.record(
+                    "phase",
+                    "compile",
+                    max(duration - (self.get_time("phase", "draw") - draw_time), 0.0),
+                )
+
+            return _profiled_render_layout_element
+
+        def _profiled_render_drawing_element(drawing_element):
+            draw_depth[0] += 1
+            start = time.perf_counter()
+            try:
+                with self.measure("drawing_element", _get_class_name(drawing_element)):
+                    render_drawing_element(drawing_element)
+            finally:
+                draw_depth[0] -= 1
+            duration = time.perf_counter() - start
+            filter_ = getattr(drawing_element, "filter", None)
+            if filter_ is not None and filter_ is not momapy.drawing.NoneValue:
+                filter_name = "+".join(
+                    [_get_class_name(effect) for effect in filter_.effects]
+                )
+                self.record("filter", filter_name, duration)
+            if draw_depth[0] == 0:
+                self.record("phase", "draw", duration)
+
+        def _profiled_end_session():
+            with self.measure("phase", "encode"):
+                end_session()
+
+        renderer.render_layout_element = _profile_render_layout_element(
+            renderer.render_layout_element
+        )
+        renderer.render_styled_layout_element = _profile_render_layout_element(
+            renderer.render_styled_layout_element
+        )
+        renderer.render_drawing_element = _profiled_render_drawing_element
+        renderer.end_session = _profiled_end_session
+
+    def get_report(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """Return the recorded measures, grouped by category.
+
+        Returns:
+            A dictionary mapping each category to a dictionary mapping each
+            name to its cumulative `time` (in seconds) and number of `calls`,
+            sorted by decreasing time
+        """
+        report = {}
+        for (category, name), (duration, calls) in sorted(
+            self._stats.items(), key=lambda item: -item[1][0]
+        ):
+            report.setdefault(category, {})[name] = {
+                "time": duration,
+                "calls": calls,
+            }
+        return report
+
+    def to_json(self, file_path: str | os.PathLike | None = None) -> str:
+        """Return the report as a JSON string, optionally writing it to a file"""
+        s = json.dumps(self.get_report(), indent=2)
+        if file_path is not None:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(s)
+        return s
+
+    def to_collapsed_stacks(self, file_path: str | os.PathLike | None = None) -> str:
+        """Return the recorded stacks in the collapsed stack format.
+
+        Each line is a semicolon-separated stack followed by its self time in
+        microseconds, the input format of `flamegraph.pl`, speedscope and
+        similar flamegraph tools.
+        """
+        lines = [
+            f"{';'.join(stack)} {round(duration * 1e6)}"
+            for stack, duration in self._stacks.items()
+        ]
+        s = "\n".join(lines)
+        if file_path is not None:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(s)
+        return s
+
+
+def _get_class_name(obj):
+    cls = type(obj)
+    if issubclass(cls, momapy.builder.Builder):
+        cls = cls._cls_to_build
+    return cls.__name__
+
+
 @dataclasses.dataclass
 class Renderer(abc.ABC):
     """Base class for renderers"""
@@ -317,6 +603,22 @@ class Renderer(abc.ABC):
         momapy.drawing.FontWeight.BOLD: 700,
     }
 
+    def enable_profiling(
+        self, profiler: RenderProfiler | None = None
+    ) -> RenderProfiler:
+        """Record the rendering of the renderer with a profiler and return it.
+
+        Args:
+            profiler: The profiler to use. If None, a new profiler is made.
+
+        Returns:
+            The profiler recording the rendering
+        """
+        if profiler is None:
+            profiler = RenderProfiler()
+        profiler.attach(self)
+        return profiler
+
     @abc.abstractmethod
     def begin_session(self):
         """Begin a session"""
@@ -347,6 +649,21 @@ class Renderer(abc.ABC):
         """Render a drawing element"""
         pass
 
+    def render_styled_layout_element(
+        self,
+        layout_element: momapy.core.elements.LayoutElement,
+        style_resolver: momapy.styling.StyleResolver,
+    ):
+        """Render a layout element styled at render time by a style resolver.
+
+        Args:
+            layout_element: The layout element to render
+            style_resolver: The style resolver computing the style of the
+                layout element and of its descendants
+        """
+        for drawing_element in style_resolver.drawing_elements(layout_element):
+            self.render_drawing_element(drawing_element)
+
     @classmethod
     def get_lighter_font_weight(
         cls, font_weight: momapy.drawing.FontWeight | float
@@ -1,6 +1,7 @@
 """Class for rendering with Skia"""
 
 import dataclasses
+import itertools
 import typing
 import typing_extensions
 import math
@@ -29,8 +30,18 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
     JPEG, and WebP. It provides hardware-accelerated rendering capabilities
     and advanced features like filters and effects.
 
+    Compiled filter graphs are cached by filter and by size of the filter
+    region, so that a filter shared by many drawing elements of the same
+    size, such as a drop shadow set by a style sheet on all glyphs of a map,
+    is only compiled once.
+
     Attributes:
         canvas: The Skia canvas used for rendering
+        batch_filters: Whether to render consecutive sibling drawing elements
+            sharing the same filter in a single filtered pass. This is faster
+            when many elements carry the same filter, but the filter is then
+            applied to the elements as a whole: e.g., the shadow of an element
+            is not drawn over the previous siblings anymore.
 
     Examples:
         ```python
@@ -106,9 +117,17 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
         momapy.drawing.FontStyle.OBLIQUE: skia.FontStyle.Slant.kOblique_Slant,
     }
     canvas: skia.Canvas = dataclasses.field(metadata={"description": "A skia canvas"})
+    batch_filters: bool = dataclasses.field(
+        default=False,
+        metadata={
+            "description": "Whether to render consecutive sibling drawing"
+            " elements sharing the same filter in a single filtered pass"
+        },
+    )
     _config: dict = dataclasses.field(default_factory=dict)
     _skia_typefaces: dict = dataclasses.field(default_factory=dict)
     _skia_fonts: dict = dataclasses.field(default_factory=dict)
+    _skia_filters: dict = dataclasses.field(default_factory=dict)
 
     @classmethod
     def from_file(
@@ -254,29 +273,46 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
         de_func = getattr(self, self._de_class_func_mapping[class_])
         filter = self.get_current_value("filter")
         if filter is not momapy.drawing.NoneValue:
-            bbox = drawing_element.bbox()
-            saved_canvas = self.canvas
-            recorder = skia.PictureRecorder()
-            canvas = recorder.beginRecording(
-                skia.Rect.MakeXYWH(
-                    bbox.north_west().x,
-                    bbox.north_west().y,
-                    bbox.width,
-                    bbox.height,
-                )
-            )
-            self.canvas = canvas
-            de_func(drawing_element)
-            picture = recorder.finishRecordingAsPicture()
-            skia_paint = self._make_filter_paint(
-                filter, drawing_element.get_filter_region()
+            self._render_with_filter(
+                lambda: de_func(drawing_element),
+                filter,
+                drawing_element.bbox(),
+                drawing_element.get_filter_region(),
             )
-            self.canvas = saved_canvas
-            self.canvas.drawPicture(picture, paint=skia_paint)
         else:
             de_func(drawing_element)
         self.restore()
 
+    def _render_with_filter(self, render_func, filter_, bbox, filter_region):
+        # The drawing is recorded and filtered in a frame whose origin is the
+        # north west corner of the filter region, so that the compiled filter
+        # only depends on the size of the filter region and can be reused for
+        # elements at other positions of the same size. The drawing is moved
+        # back by the exact offset.
+        north_west = filter_region.north_west()
+        dx = north_west.x
+        dy = north_west.y
+        saved_canvas = self.canvas
+        recorder = skia.PictureRecorder()
+        canvas = recorder.beginRecording(
+            skia.Rect.MakeXYWH(
+                bbox.north_west().x - dx,
+                bbox.north_west().y - dy,
+                bbox.width,
+                bbox.height,
+            )
+        )
+        canvas.translate(-dx, -dy)
+        self.canvas = canvas
+        render_func()
+        picture = recorder.finishRecordingAsPicture()
+        skia_paint = self._get_or_make_filter_paint(filter_, filter_region)
+        self.canvas = saved_canvas
+        self.canvas.save()
+        self.canvas.translate(dx, dy)
+        self.canvas.drawPicture(picture, paint=skia_paint)
+        self.canvas.restore()
+
     def self_save(self):
         """Save the Skia canvas state.
 
@@ -322,6 +358,23 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
         )
         return skia_paint
 
+    def _get_or_make_filter_paint(self, filter_, filter_region):
+        # The paint is built from and cached by the exact size of the
+        # region, so that it is never built for a slightly different region
+        width = filter_region.width
+        height = filter_region.height
+        local_filter_region = momapy.geometry.Bbox(
+            momapy.geometry.Point(width / 2, height / 2), width, height
+        )
+        if isinstance(filter_, momapy.builder.Builder):
+            return self._make_filter_paint(filter_, local_filter_region)
+        key = (filter_, width, height)
+        skia_paint = self._skia_filters.get(key)
+        if skia_paint is None:
+            skia_paint = self._make_filter_paint(filter_, local_filter_region)
+            self._skia_filters[key] = skia_paint
+        return skia_paint
+
     def _make_filter_paint(self, filter_, filter_region):
         dskia_filters = {}
         for filter_effect in filter_.effects:
@@ -336,11 +389,16 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
         return skia_paint
 
     def _make_crop_rect_from_filter_region(self, filter_region):
-        crop_rect = skia.IRect.MakeXYWH(
-            round(filter_region.north_west().x),
-            round(filter_region.north_west().y),
-            round(filter_region.width),
-            round(filter_region.height),
+        # Skia crops filters to integer rectangles: the rectangle is rounded
+        # outwards, so that the filter is never clipped inside its region,
+        # and may extend past it by less than a unit
+        north_west = filter_region.north_west()
+        south_east = filter_region.south_east()
+        crop_rect = skia.IRect.MakeLTRB(
+            math.floor(north_west.x),
+            math.floor(north_west.y),
+            math.ceil(south_east.x),
+            math.ceil(south_east.y),
         )
         return crop_rect
 
@@ -459,8 +517,51 @@ class SkiaRenderer(momapy.rendering.core.StatefulRenderer):
         return tr_func(transformation)
 
     def _render_group(self, group):
-        for drawing_element in group.elements:
-            self.render_drawing_element(drawing_element)
+        if not self.batch_filters:
+            for drawing_element in group.elements:
+                self.render_drawing_element(drawing_element)
+            return
+        for filter_, drawing_elements in itertools.groupby(
+            group.elements, key=self._get_batch_filter
+        ):
+            drawing_elements = list(drawing_elements)
+            if filter_ is None or len(drawing_elements) == 1:
+                for drawing_element in drawing_elements:
+                    self.render_drawing_element(drawing_element)
+            else:
+                self._render_drawing_elements_with_filter(drawing_elements, filter_)
+
+    @staticmethod
+    def _get_batch_filter(drawing_element):
+        # Only untransformed elements are batched, so that their filter
+        # regions are all expressed in the frame of their parent
+        filter_ = drawing_element.filter
+        if filter_ is None or filter_ is momapy.drawing.NoneValue:
+            return None
+        transform = drawing_element.transform
+        if transform is not None and transform is not momapy.drawing.NoneValue:
+            return None
+        return filter_
+
+    def _render_drawing_elements_with_filter(self, drawing_elements, filter_):
+        def _render_func():
+            for drawing_element in drawing_elements:
+                self.render_drawing_element(
+                    dataclasses.replace(
+                        drawing_element, filter=momapy.drawing.NoneValue
+                    )
+                )
+
+        bbox = momapy.geometry.Bbox.union(
+            [drawing_element.bbox() for drawing_element in drawing_elements]
+        )
+        filter_region = momapy.geometry.Bbox.union(
+            [
+                drawing_element.get_filter_region()
+                for drawing_element in drawing_elements
+            ]
+        )
+        self._render_with_filter(_render_func, filter_, bbox, filter_region)
 
     def _add_path_action_to_skia_path(self, skia_path, path_action):
         class_ = type(path_action)
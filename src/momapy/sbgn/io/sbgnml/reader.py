@@ -37,6 +37,7 @@ import momapy.core.mapping
 import momapy.core.elements
 import momapy.core.layout
 import momapy.io.core
+import momapy.io.signatures
 import momapy.io.utils
 import momapy.coloring
 import momapy.positioning
@@ -1789,6 +1790,8 @@ class _SBGNMLReader(momapy.io.core.Reader):
 class SBGNML0_2Reader(_SBGNMLReader):
     """Class for SBGN-ML 0.2 reader objects"""
 
+    signature = momapy.io.signatures.SBGNML_0_2_SIGNATURE
+
     @classmethod
     def _get_map_key(cls, sbgnml_map):
         key = momapy.sbgn.io.sbgnml._reading_parsing.transform_class(
@@ -1796,22 +1799,12 @@ class SBGNML0_2Reader(_SBGNMLReader):
         )
         return key
 
-    @classmethod
-    def check_file(cls, file_path):
-        """Return `true` if the given file is an SBGN-ML 0.2 document, `false` otherwise"""
-        try:
-            with open(file_path) as f:
-                for line in f:
-                    if "http://sbgn.org/libsbgn/0.2" in line:
-                        return True
-            return False
-        except Exception:
-            return False
-
 
 class SBGNML0_3Reader(_SBGNMLReader):
     """Class for SBGN-ML 0.3 reader objects"""
 
+    signature = momapy.io.signatures.SBGNML_0_3_SIGNATURE
+
     @classmethod
     def _get_map_key(cls, sbgnml_map):
         sbgnml_version = sbgnml_map.get("version")
@@ -1824,15 +1817,3 @@ class SBGNML0_3Reader(_SBGNMLReader):
                 return "ENTITY_RELATIONSHIP"
         else:
             return SBGNML0_2Reader._get_map_key(sbgnml_map)
-
-    @classmethod
-    def check_file(cls, file_path):
-        """Return `true` if the given file is an SBGN-ML 0.3 document, `false` otherwise"""
-        try:
-            with open(file_path) as f:
-                for line in f:
-                    if "http://sbgn.org/libsbgn/0.3" in line:
-                        return True
-            return False
-        except Exception:
-            return False
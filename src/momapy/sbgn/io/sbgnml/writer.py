@@ -105,7 +105,7 @@ def _get_layout_elements(writing_context, model_element):
     seen = set()
     for item in result:
         if isinstance(item, frozenset):
-            for anchor in mapping._singleton_to_key.inverse.get(item, []):
+            for anchor in mapping._singleton_to_key.keys_for_value(item):
                 if anchor not in seen:
                     seen.add(anchor)
                     layout_elements.append(anchor)
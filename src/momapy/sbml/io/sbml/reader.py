@@ -9,8 +9,9 @@ import frozendict
 import lxml.objectify
 
 import momapy.builder
-import momapy.utils
+import momapy.hashing
 import momapy.io.core
+import momapy.io.signatures
 import momapy.sbml.io.sbml._parsing
 import momapy.sbml.io.sbml._model
 
@@ -26,35 +27,35 @@ class ReadingContext:
     map_element_to_ids: dict
     with_annotations: bool
     with_notes: bool
+    model_element_cache: dict = dataclasses.field(default_factory=dict)
 
 
 class SBMLReader(momapy.io.core.Reader):
+    signature = momapy.io.signatures.SBML_SIGNATURE
+
     @staticmethod
     def _register_model_element(
         model_element,
         collection,
         id_,
         id_to_model_element,
+        model_element_cache,
     ):
-        model_element = momapy.utils.add_or_replace_element_in_set(
-            model_element,
-            collection,
-            func=lambda element, existing_element: element.id_ < existing_element.id_,
-        )
+        # Equal elements are found by their (memoized) content hash
+        content_hash = momapy.hashing.content_hash(model_element)
+        existing_element = model_element_cache.get(content_hash)
+        if existing_element is None:
+            collection.add(model_element)
+            model_element_cache[content_hash] = model_element
+        elif model_element.id_ < existing_element.id_:
+            collection.remove(existing_element)
+            collection.add(model_element)
+            model_element_cache[content_hash] = model_element
+        else:
+            model_element = existing_element
         id_to_model_element[id_] = model_element
         return model_element
 
-    @classmethod
-    def check_file(cls, file_path: str | os.PathLike):
-        try:
-            with open(file_path) as f:
-                for line in f:
-                    if "<sbml " in line:
-                        return True
-            return False
-        except Exception:
-            return False
-
     @classmethod
     def read(
         cls,
@@ -143,6 +144,7 @@ class SBMLReader(momapy.io.core.Reader):
             ctx.model.compartments,
             sbml_compartment.get("id"),
             ctx.sbml_id_to_model_element,
+            ctx.model_element_cache,
         )
         ctx.map_element_to_ids[model_element].add(sbml_compartment.get("id"))
         if ctx.with_annotations:
@@ -167,6 +169,7 @@ class SBMLReader(momapy.io.core.Reader):
             ctx.model.species,
             sbml_species.get("id"),
             ctx.sbml_id_to_model_element,
+            ctx.model_element_cache,
         )
         if ctx.with_annotations:
             annotations = momapy.sbml.io.sbml._model.make_annotations_from_element(
@@ -196,6 +199,7 @@ class SBMLReader(momapy.io.core.Reader):
             ctx.model.reactions,
             sbml_reaction.get("id"),
             ctx.sbml_id_to_model_element,
+            ctx.model_element_cache,
         )
         ctx.map_element_to_ids[model_element].add(sbml_reaction.get("id"))
         if ctx.with_annotations:
@@ -0,0 +1,433 @@
+"""Local server for reading, rendering and exporting maps with a warm process.
+
+Starting Python, importing momapy, scanning the system fonts and parsing
+style sheets costs seconds, which dominates the cost of rendering a single
+map from the command line. The render server pays these costs once: it keeps
+the font cache, the parsed style sheets and the most recently read maps in
+memory, and serves requests over HTTP, either on a TCP port or on a Unix
+socket. Requests are processed concurrently by a pool of worker threads.
+
+Each request is a `POST` to `/<command>` with a JSON object as body, where
+`<command>` is one of `read`, `render` or `export`. The response is a JSON
+object whose `status` is either `ok` or `error`. A `GET` to `/health`
+returns the state of the caches.
+
+The server is meant for local callers and has no authentication: any
+process that can connect to it reads and writes files with the rights of
+the user running it. Listening on a Unix socket, whose access is governed
+by file permissions, is safer than on a TCP port. To keep web pages open
+in a browser from sending requests to a server listening on a TCP port,
+requests must have the `application/json` content type, which a page
+cannot send to another origin without a CORS preflight that the server
+does not answer, and requests with an `Origin` header are rejected.
+
+Examples:
+    ```bash
+    $ momapy serve --port 8765
+    $ curl -X POST localhost:8765/render \\
+        -H "Content-Type: application/json" \\
+        -d '{"input_file_path": "map.sbgn", "output_file_path": "map.svg"}'
+    ```
+
+    ```python
+    from momapy.server import make_server
+
+    server = make_server(port=8765)
+    server.serve_forever()
+    ```
+"""
+
+import collections
+import collections.abc
+import concurrent.futures
+import dataclasses
+import http.server
+import json
+import os
+import pathlib
+import socketserver
+import threading
+import typing
+
+import momapy.core.fonts
+import momapy.io.core
+import momapy.positioning
+import momapy.rendering.core
+import momapy.styling
+
+
+def _make_file_key(file_path: str | os.PathLike) -> tuple[str, int, int]:
+    path = pathlib.Path(file_path).resolve()
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _as_list(value: typing.Any) -> list:
+    if value is None:
+        return []
+    if isinstance(value, (str, os.PathLike)):
+        return [value]
+    return list(value)
+
+
+@dataclasses.dataclass
+class RenderServerState:
+    """Class for the warm state shared by the requests of a render server.
+
+    Read maps and parsed style sheets are cached by resolved file path,
+    modification time and size, so that a file modified on disk is read
+    again. At most `max_maps` maps and `max_style_sheets` style sheets are
+    kept, the least recently used being evicted first.
+
+    Attributes:
+        max_maps: The maximum number of read maps kept in memory
+        max_style_sheets: The maximum number of parsed style sheets kept in
+            memory
+    """
+
+    max_maps: int = 16
+    max_style_sheets: int = 64
+    _maps: collections.OrderedDict = dataclasses.field(
+        default_factory=collections.OrderedDict
+    )
+    _style_sheets: collections.OrderedDict = dataclasses.field(
+        default_factory=collections.OrderedDict
+    )
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def warm_up(self):
+        """Scan the system fonts so that the first request does not pay for it"""
+        momapy.core.fonts._get_or_make_font_cache()
+
+    def read(self, file_path: str | os.PathLike) -> momapy.io.core.ReaderResult:
+        """Return the reader result of a file, reading it only if needed"""
+        key = _make_file_key(file_path)
+        reader_result = self._get_cached(self._maps, key)
+        if reader_result is None:
+            reader_result = momapy.io.core.read(key[0])
+            self._set_cached(self._maps, key, reader_result, self.max_maps)
+        return reader_result
+
+    def get_style_sheet(
+        self, file_paths: collections.abc.Iterable[str | os.PathLike]
+    ) -> momapy.styling.LayeredStyleSheet | None:
+        """Return the style sheets of the given files, layered in order"""
+        style_sheets = []
+        for file_path in file_paths:
+            key = _make_file_key(file_path)
+            style_sheet = self._get_cached(self._style_sheets, key)
+            if style_sheet is None:
+                # The style sheet is only cached by the state, whose size is
+                # bounded
+                style_sheet = momapy.styling.StyleSheet.from_file(
+                    key[0], use_cache=False
+                )
+                self._set_cached(
+                    self._style_sheets, key, style_sheet, self.max_style_sheets
+                )
+            style_sheets.append(style_sheet)
+        if not style_sheets:
+            return None
+        return momapy.styling.LayeredStyleSheet(tuple(style_sheets))
+
+    def _get_cached(self, cache, key):
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _set_cached(self, cache, key, value, max_size):
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def clear(self):
+        """Empty the map and style sheet caches"""
+        with self._lock:
+            self._maps.clear()
+            self._style_sheets.clear()
+
+    def get_info(self) -> dict[str, typing.Any]:
+        """Return the state of the caches"""
+        with self._lock:
+            return {
+                "maps": [key[0] for key in self._maps],
+                "style_sheets": [key[0] for key in self._style_sheets],
+            }
+
+    def handle(self, command: str, params: dict[str, typing.Any]) -> dict:
+        """Execute a command and return its JSON-serializable result.
+
+        Args:
+            command: One of `read`, `render` or `export`
+            params: The parameters of the command
+
+        Returns:
+            The result of the command
+
+        Raises:
+            ValueError: If the command is not supported
+        """
+        if command == "read":
+            return self._handle_read(params)
+        if command == "render":
+            return self._handle_render(params)
+        if command == "export":
+            return self._handle_export(params)
+        raise ValueError(f"command {command} not supported")
+
+    def _prepare_map(self, map_, params, style_sheet=None):
+        import momapy.celldesigner.map
+        import momapy.celldesigner.utils
+        import momapy.sbgn
+        import momapy.sbgn.utils
+
+        if style_sheet is not None:
+            map_ = momapy.styling.apply_style_sheet(map_, style_sheet)
+        if params.get("tidy", False):
+            if isinstance(map_, momapy.celldesigner.map.CellDesignerMap):
+                map_ = momapy.celldesigner.utils.tidy(map_)
+            elif isinstance(map_, momapy.sbgn.SBGNMap):
+                map_ = momapy.sbgn.utils.tidy(map_)
+        return map_
+
+    def _handle_read(self, params):
+        import momapy.celldesigner.map
+        import momapy.celldesigner.utils
+        import momapy.sbgn
+        import momapy.sbgn.utils
+
+        input_file_path = params["input_file_path"]
+        map_ = self.read(input_file_path).obj
+        if isinstance(map_, momapy.celldesigner.map.CellDesignerMap):
+            info = momapy.celldesigner.utils.get_info(map_)
+        elif isinstance(map_, momapy.sbgn.SBGNMap):
+            info = momapy.sbgn.utils.get_info(map_)
+        else:
+            raise ValueError(f"unsupported map type: {type(map_).__name__}")
+        info["file"] = str(input_file_path)
+        return info
+
+    def _handle_render(self, params):
+        input_file_paths = _as_list(params.get("input_file_path"))
+        if not input_file_paths:
+            raise ValueError("at least one input file path is required")
+        style_sheet = self.get_style_sheet(
+            _as_list(params.get("style_sheet_file_path"))
+        )
+        # Without tidying, the style sheet is resolved at render time so
+        # that the cached maps are rendered without being copied
+        tidy = params.get("tidy", False)
+        layouts = []
+        for input_file_path in input_file_paths:
+            map_ = self.read(input_file_path).obj
+            map_ = self._prepare_map(map_, params, style_sheet if tidy else None)
+            layouts.append(map_.layout)
+        output_file_path = params["output_file_path"]
+        momapy.rendering.core.render_layout_elements(
+            layout_elements=layouts,
+            file_path=output_file_path,
+            format_=params.get("format"),
+            renderer=params.get("renderer"),
+            style_sheet=None if tidy else style_sheet,
+            to_top_left=params.get("to_top_left", False),
+            multi_pages=params.get("multi_pages", False),
+        )
+        return {"output_file_path": str(output_file_path)}
+
+    def _handle_export(self, params):
+        input_file_path = params["input_file_path"]
+        map_ = self.read(input_file_path).obj
+        style_sheet = self.get_style_sheet(
+            _as_list(params.get("style_sheet_file_path"))
+        )
+        map_ = self._prepare_map(map_, params, style_sheet)
+        if params.get("to_top_left", False):
+            map_ = momapy.positioning.move_map_to_top_left(map_)
+        output_file_path = params["output_file_path"]
+        writer = params.get("writer")
+        if writer is None:
+            writer = momapy.io.core.infer_writer(map_)
+        momapy.io.core.write(map_, output_file_path, writer=writer)
+        return {"output_file_path": str(output_file_path)}
+
+
+class _RenderRequestHandler(http.server.BaseHTTPRequestHandler):
+    def _send_json(self, code, obj):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, code, exception):
+        self._send_json(
+            code,
+            {"status": "error", "error": f"{type(exception).__name__}: {exception}"},
+        )
+
+    def do_GET(self):
+        if self.path.strip("/") == "health":
+            self._send_json(200, {"status": "ok", **self.server.state.get_info()})
+        else:
+            self._send_json(404, {"status": "error", "error": "not found"})
+
+    def do_POST(self):
+        command = self.path.strip("/")
+        # Browsers send an Origin header with cross-origin requests, which
+        # local clients have no reason to send
+        if self.headers.get("Origin") is not None:
+            self._send_json(
+                403,
+                {"status": "error", "error": "cross-origin requests are rejected"},
+            )
+            return
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.split(";")[0].strip().lower() != "application/json":
+            self._send_json(
+                415,
+                {"status": "error", "error": "content type must be application/json"},
+            )
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length) or b"{}")
+            future = self.server.executor.submit(
+                self.server.state.handle, command, params
+            )
+            result = future.result()
+        except (ValueError, KeyError, OSError) as exception:
+            self._send_error(400, exception)
+        except Exception as exception:
+            # The error is reported to the client, and then to the server
+            # with its traceback
+            self._send_error(500, exception)
+            raise
+        else:
+            self._send_json(200, {"status": "ok", **result})
+
+    def address_string(self):
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return str(self.server.server_address)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class _RenderServerMixin:
+    def _init_render_server(self, state, workers, quiet):
+        self.state = state
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self.quiet = quiet
+
+    def handle_error(self, request, client_address):
+        if not self.quiet:
+            super().handle_error(request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+class RenderServer(_RenderServerMixin, http.server.ThreadingHTTPServer):
+    """Class for render servers listening on a TCP port"""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, state, workers=None, quiet=False):
+        super().__init__(server_address, _RenderRequestHandler)
+        self._init_render_server(state, workers, quiet)
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class UnixRenderServer(
+        _RenderServerMixin,
+        socketserver.ThreadingMixIn,
+        socketserver.UnixStreamServer,
+    ):
+        """Class for render servers listening on a Unix socket"""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path, state, workers=None, quiet=False):
+            super().__init__(str(socket_path), _RenderRequestHandler)
+            self._init_render_server(state, workers, quiet)
+
+        def server_close(self):
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.remove(self.server_address)
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | os.PathLike | None = None,
+    workers: int | None = None,
+    max_maps: int = 16,
+    max_style_sheets: int = 64,
+    warm_up: bool = True,
+    quiet: bool = False,
+) -> "RenderServer | UnixRenderServer":
+    """Make a render server, ready to serve requests with `serve_forever()`.
+
+    Args:
+        host: The host to listen on, when `socket_path` is None
+        port: The port to listen on, when `socket_path` is None. If 0, a
+            free port is chosen.
+        socket_path: The path of a Unix socket to listen on instead of a
+            TCP port
+        workers: The number of worker threads. If None, chosen by
+            `concurrent.futures.ThreadPoolExecutor`.
+        max_maps: The maximum number of read maps kept in memory
+        max_style_sheets: The maximum number of parsed style sheets kept in
+            memory
+        warm_up: Whether to scan the system fonts before serving
+        quiet: Whether to silence the request log and the server errors
+
+    Returns:
+        The render server
+    """
+    state = RenderServerState(max_maps=max_maps, max_style_sheets=max_style_sheets)
+    if warm_up:
+        state.warm_up()
+    if socket_path is not None:
+        return UnixRenderServer(socket_path, state, workers=workers, quiet=quiet)
+    return RenderServer((host, port), state, workers=workers, quiet=quiet)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | os.PathLike | None = None,
+    workers: int | None = None,
+    max_maps: int = 16,
+    max_style_sheets: int = 64,
+    quiet: bool = False,
+):
+    """Run a render server until interrupted.
+
+    See [make_server][momapy.server.make_server] for the arguments.
+    """
+    server = make_server(
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        workers=workers,
+        max_maps=max_maps,
+        max_style_sheets=max_style_sheets,
+        quiet=quiet,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -7,6 +7,7 @@ supporting:
 - Style collections that group related style properties
 - CSS parsing from files or strings
 - Style application to layout elements
+- Data overlays coloring layout elements from values of model elements
 
 Examples:
     ```python
@@ -19,6 +20,9 @@ Examples:
 
 from momapy.styling.core import StyleCollection as StyleCollection
 from momapy.styling.core import StyleSheet as StyleSheet
+from momapy.styling.core import LayeredStyleSheet as LayeredStyleSheet
+from momapy.styling.core import CompiledStyleSheet as CompiledStyleSheet
+from momapy.styling.core import StyleResolver as StyleResolver
 from momapy.styling.core import Selector as Selector
 from momapy.styling.core import TypeSelector as TypeSelector
 from momapy.styling.core import ClassSelector as ClassSelector
@@ -32,10 +36,21 @@ from momapy.styling.core import combine_style_sheets as combine_style_sheets
 from momapy.styling.core import apply_style_collection as apply_style_collection
 from momapy.styling.core import apply_style_sheet as apply_style_sheet
 from momapy.styling.core import get_stylable_attributes as get_stylable_attributes
+from momapy.styling.core import set_style_sheet_cache_dir as set_style_sheet_cache_dir
+from momapy.styling.core import (
+    set_style_sheet_cache_size as set_style_sheet_cache_size,
+)
+from momapy.styling.core import clear_style_sheet_cache as clear_style_sheet_cache
+from momapy.styling.overlay import Overlay as Overlay
+from momapy.styling.overlay import make_overlay as make_overlay
+from momapy.styling.overlay import apply_overlay as apply_overlay
 
 __all__ = [
     "StyleCollection",
     "StyleSheet",
+    "LayeredStyleSheet",
+    "CompiledStyleSheet",
+    "StyleResolver",
     "Selector",
     "TypeSelector",
     "ClassSelector",
@@ -49,4 +64,10 @@ __all__ = [
     "apply_style_collection",
     "apply_style_sheet",
     "get_stylable_attributes",
+    "set_style_sheet_cache_dir",
+    "set_style_sheet_cache_size",
+    "clear_style_sheet_cache",
+    "Overlay",
+    "make_overlay",
+    "apply_overlay",
 ]
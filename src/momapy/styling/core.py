@@ -5,12 +5,21 @@ docstring for usage examples.
 """
 
 import abc
+import collections
 import collections.abc
 import dataclasses
+import functools
+import hashlib
+import hmac
+import importlib.metadata
 import os
 import pathlib
+import pickle
 import pyparsing
+import secrets
+import threading
 import copy
+import typing
 
 
 import momapy.builder
@@ -18,6 +27,7 @@ import momapy.coloring
 import momapy.drawing
 import momapy.core
 import momapy.core.elements
+import momapy.core.layout
 import momapy.core.map
 
 
@@ -66,16 +76,35 @@ class StyleSheet(dict):
     def __ior__(self, other):
         return self.__or__(other)
 
+    def compile(self) -> "CompiledStyleSheet":
+        """Return a compiled version of the style sheet, indexed for matching.
+
+        Returns:
+            A CompiledStyleSheet with the rules of the style sheet.
+        """
+        return CompiledStyleSheet.from_style_sheet(self)
+
     @classmethod
-    def from_file(cls, file_path: str | os.PathLike) -> "StyleSheet":
+    def from_file(
+        cls, file_path: str | os.PathLike, use_cache: bool = True
+    ) -> "StyleSheet":
         """Parse and return a StyleSheet from a CSS file.
 
         Relative ``@import`` paths inside the CSS file are resolved against
         the directory of ``file_path``, not against the process working
         directory.
 
+        Parsed style sheets are cached in memory, up to the size set with
+        [set_style_sheet_cache_size][momapy.styling.set_style_sheet_cache_size],
+        and on disk if a cache directory is set with
+        [set_style_sheet_cache_dir][momapy.styling.set_style_sheet_cache_dir].
+        A cached style sheet is reused as long as neither the file nor the
+        files it imports have changed, as determined by their modification
+        time, size and content hash.
+
         Args:
             file_path: Path to the CSS file to parse.
+            use_cache: Whether to use the cache of parsed style sheets.
 
         Returns:
             A StyleSheet containing the parsed selectors and style collections.
@@ -84,14 +113,18 @@ class StyleSheet(dict):
             pyparsing.ParseException: If the CSS file is malformed.
         """
         path = pathlib.Path(file_path).resolve()
-        doc_parser = _make_document_parser(path.parent)
-        style_sheet = doc_parser.parse_file(str(path), parse_all=True)[0]
+        style_sheet, _ = _get_or_parse_style_sheet_file(path, use_cache)
+        if use_cache:
+            style_sheet = copy.deepcopy(style_sheet)
         return style_sheet
 
     @classmethod
     def from_string(cls, s: str) -> "StyleSheet":
         """Parse and return a StyleSheet from a CSS string.
 
+        Relative ``@import`` paths are resolved against the process working
+        directory.
+
         Args:
             s: CSS string to parse.
 
@@ -107,7 +140,10 @@ class StyleSheet(dict):
             ss = StyleSheet.from_string(css)
             ```
         """
-        style_sheet = _css_document.parse_string(s, parse_all=True)[0]
+        results = _css_document.parse_string(s, parse_all=True)
+        style_sheet, _ = _make_style_sheet_from_results(
+            results, pathlib.Path.cwd(), use_cache=True
+        )
         return style_sheet
 
     @classmethod
@@ -141,12 +177,89 @@ def combine_style_sheets(
     """
     if not style_sheets:
         return None
-    output_style_sheet = style_sheets[0]
-    for style_sheet in style_sheets[1:]:
-        output_style_sheet |= style_sheet
+    style_sheets = list(style_sheets)
+    if len(style_sheets) == 1:
+        return style_sheets[0]
+    # Each style collection is copied once, instead of copying the whole
+    # merged style sheet for each additional style sheet
+    output_style_sheet = StyleSheet()
+    for style_sheet in style_sheets:
+        for key, value in style_sheet.items():
+            value = copy.deepcopy(value)
+            if key in output_style_sheet:
+                output_style_sheet[key] |= value
+            else:
+                output_style_sheet[key] = value
     return output_style_sheet
 
 
+@dataclasses.dataclass(frozen=True)
+class LayeredStyleSheet(object):
+    """A stylesheet made of layers of stylesheets, without merging them.
+
+    Layers are kept as they are and are not copied: a layer should hence not
+    be modified once added. Precedence is resolved when matching, as for CSS
+    cascade layers: the rules of a layer take precedence over the rules of
+    the layers below it, and, within a layer, later rules take precedence
+    over earlier ones. Applying a layered stylesheet is hence equivalent to
+    applying its layers one after the other. Note that this differs from
+    merging stylesheets with `|`, where a rule whose selector is already in
+    the first stylesheet keeps the position of the first occurrence.
+
+    Attributes:
+        layers: The stylesheets, from lowest to highest precedence.
+
+    Examples:
+        ```python
+        layered_style_sheet = LayeredStyleSheet((base_style_sheet,))
+        highlighted_style_sheet = layered_style_sheet.with_layer(highlight_style_sheet)
+        styled_element = apply_style_sheet(element, highlighted_style_sheet)
+        ```
+    """
+
+    layers: tuple[StyleSheet, ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={"description": "The layers, from lowest to highest precedence"},
+    )
+
+    def with_layer(
+        self, style_sheet: "StyleSheet | LayeredStyleSheet"
+    ) -> "LayeredStyleSheet":
+        """Return a new layered stylesheet with an additional top layer.
+
+        Args:
+            style_sheet: The stylesheet to add on top of the layers. If it
+                is a layered stylesheet, its layers are added.
+
+        Returns:
+            The new layered stylesheet. Layers are shared with the current one.
+        """
+        if isinstance(style_sheet, LayeredStyleSheet):
+            return LayeredStyleSheet(self.layers + style_sheet.layers)
+        return LayeredStyleSheet(self.layers + (style_sheet,))
+
+    def items(self) -> "collections.abc.Iterator[tuple[Selector, StyleCollection]]":
+        """Return an iterator over the rules of all layers, in order"""
+        for layer in self.layers:
+            yield from layer.items()
+
+    def compile(self) -> "CompiledStyleSheet":
+        """Return a compiled version of the layered stylesheet.
+
+        Returns:
+            A CompiledStyleSheet with the rules of all layers, in order.
+        """
+        return CompiledStyleSheet.from_style_sheet(self)
+
+    def to_style_sheet(self) -> StyleSheet:
+        """Return the stylesheet obtained by merging the layers.
+
+        Returns:
+            The merged stylesheet, or None if there are no layers.
+        """
+        return combine_style_sheets(self.layers)
+
+
 def apply_style_collection(
     layout_element: (momapy.core.elements.LayoutElement | momapy.builder.Builder),
     style_collection: StyleCollection,
@@ -167,10 +280,12 @@ def apply_style_collection(
         AttributeError: If strict=True and an attribute doesn't exist on the element.
     """
     if not isinstance(layout_element, momapy.builder.Builder):
-        layout_element = momapy.builder.builder_from_object(layout_element)
-        is_builder = False
-    else:
-        is_builder = True
+        changes = _get_style_changes(layout_element, [style_collection], strict)
+        if not changes:
+            return layout_element
+        return dataclasses.replace(
+            layout_element, **_get_frozen_style_values(changes, {})
+        )
     for attribute, value in style_collection.items():
         if hasattr(layout_element, attribute):
             setattr(layout_element, attribute, value)
@@ -179,9 +294,119 @@ def apply_style_collection(
                 raise AttributeError(
                     f"{type(layout_element)} object has no attribute '{attribute}'"
                 )
-    if is_builder:
-        return layout_element
-    return momapy.builder.object_from_builder(layout_element)
+    return layout_element
+
+
+def _get_style_changes(layout_element, style_collections, strict):
+    changes = {}
+    for style_collection in style_collections:
+        for attribute, value in style_collection.items():
+            if hasattr(layout_element, attribute):
+                changes[attribute] = value
+            elif strict:
+                raise AttributeError(
+                    f"{type(layout_element)} object has no attribute '{attribute}'"
+                )
+    return changes
+
+
+def _get_frozen_style_values(changes, frozen_values):
+    # Style values may be builders (e.g., filters); they are built once per
+    # value and shared by all the styled elements
+    frozen_changes = {}
+    for attribute, value in changes.items():
+        frozen_value = frozen_values.get(id(value))
+        if frozen_value is None:
+            frozen_value = momapy.builder.object_from_builder(value)
+            frozen_values[id(value)] = frozen_value
+        frozen_changes[attribute] = frozen_value
+    return frozen_changes
+
+
+def _collect_style_changes(
+    layout_element, style_sheet, strict, ancestors, changes_by_element
+):
+    changes = _get_style_changes(
+        layout_element, style_sheet.select(layout_element, ancestors), strict
+    )
+    if changes:
+        element_changes = changes_by_element.setdefault(
+            id(layout_element), (layout_element, {})
+        )[1]
+        element_changes.update(changes)
+    child_ancestors = ancestors.push(layout_element)
+    for child in layout_element.children():
+        _collect_style_changes(
+            child, style_sheet, strict, child_ancestors, changes_by_element
+        )
+
+
+def _rebuild_with_style_changes(obj, changes_by_element, frozen_values, rebuilt):
+    """Return a copy of an object with the style changes applied.
+
+    The object is only copied if its style changes or if one of the layout
+    elements it references is copied, so that untouched subtrees are reused
+    by reference. References to a same layout element, e.g., a node and the
+    target of an arc, are all replaced by the same copy. Copies are
+    registered in `rebuilt`, keyed by the id of the original object.
+    """
+    if isinstance(obj, (tuple, list, frozenset)):
+        new_elements = [
+            _rebuild_with_style_changes(
+                element, changes_by_element, frozen_values, rebuilt
+            )
+            for element in obj
+        ]
+        if all(
+            new_element is element for new_element, element in zip(new_elements, obj)
+        ):
+            return obj
+        return type(obj)(new_elements)
+    if not isinstance(obj, momapy.core.elements.LayoutElement):
+        return obj
+    if id(obj) in rebuilt:
+        return rebuilt[id(obj)]
+    changes = changes_by_element.get(id(obj))
+    if changes is not None:
+        changes = _get_frozen_style_values(changes[1], frozen_values)
+    else:
+        changes = {}
+    for field in dataclasses.fields(obj):
+        if field.name in changes:
+            continue
+        value = getattr(obj, field.name)
+        new_value = _rebuild_with_style_changes(
+            value, changes_by_element, frozen_values, rebuilt
+        )
+        if new_value is not value:
+            changes[field.name] = new_value
+    if changes:
+        new_obj = dataclasses.replace(obj, **changes)
+    else:
+        new_obj = obj
+    rebuilt[id(obj)] = new_obj
+    return new_obj
+
+
+def _apply_style_changes(map_or_layout_element, changes_by_element):
+    if not changes_by_element:
+        return map_or_layout_element
+    if isinstance(map_or_layout_element, momapy.core.map.Map):
+        layout = map_or_layout_element.layout
+    else:
+        layout = map_or_layout_element
+    rebuilt = {}
+    new_layout = _rebuild_with_style_changes(layout, changes_by_element, {}, rebuilt)
+    if not isinstance(map_or_layout_element, momapy.core.map.Map):
+        return new_layout
+    layout_model_mapping = map_or_layout_element.layout_model_mapping
+    if layout_model_mapping is not None:
+        layout_model_mapping = layout_model_mapping._replace_layout_elements(rebuilt)
+    return dataclasses.replace(
+        map_or_layout_element,
+        layout=new_layout,
+        layout_model_mapping=layout_model_mapping,
+    )
 
 
 def apply_style_sheet(
@@ -190,7 +415,7 @@ def apply_style_sheet(
         | momapy.core.elements.LayoutElement
         | momapy.builder.Builder
     ),
-    style_sheet: StyleSheet,
+    style_sheet: "StyleSheet | LayeredStyleSheet | CompiledStyleSheet",
     strict: bool = True,
     ancestors: collections.abc.Collection[
         momapy.core.elements.LayoutElement | momapy.builder.Builder
@@ -200,35 +425,51 @@ def apply_style_sheet(
 
     Args:
         map_or_layout_element: The map, element, or builder to style.
-        style_sheet: The stylesheet to apply.
+        style_sheet: The stylesheet to apply. It is compiled first if it is
+            not already a CompiledStyleSheet.
         strict: If True, raises errors for invalid attributes.
         ancestors: Internal list of ancestor elements for selector matching.
 
     Returns:
         The modified map, layout element, or builder.
+
+    Frozen maps and layout elements are not converted to builders: only the
+    elements whose style changes and their ancestors are rebuilt, and the
+    untouched subtrees are shared with the input.
     """
     if not isinstance(map_or_layout_element, momapy.builder.Builder):
-        map_or_layout_element = momapy.builder.builder_from_object(
-            map_or_layout_element
+        if style_sheet is None:
+            return map_or_layout_element
+        if not isinstance(style_sheet, CompiledStyleSheet):
+            style_sheet = CompiledStyleSheet.from_style_sheet(style_sheet)
+        if isinstance(map_or_layout_element, momapy.core.map.Map):
+            layout = map_or_layout_element.layout
+        else:
+            layout = map_or_layout_element
+        changes_by_element = {}
+        _collect_style_changes(
+            layout,
+            style_sheet,
+            strict,
+            _as_ancestor_chain(ancestors),
+            changes_by_element,
         )
-        is_builder = False
-    else:
-        is_builder = True
+        return _apply_style_changes(map_or_layout_element, changes_by_element)
     if momapy.builder.isinstance_or_builder(map_or_layout_element, momapy.core.map.Map):
         layout_element = map_or_layout_element.layout
     else:
         layout_element = map_or_layout_element
     if style_sheet is not None:
-        if ancestors is None:
-            ancestors = []
-        for selector, style_collection in style_sheet.items():
-            if selector.select(layout_element, ancestors):
-                apply_style_collection(
-                    layout_element=layout_element,
-                    style_collection=style_collection,
-                    strict=strict,
-                )
-        ancestors = ancestors + [layout_element]
+        if not isinstance(style_sheet, CompiledStyleSheet):
+            style_sheet = CompiledStyleSheet.from_style_sheet(style_sheet)
+        ancestors = _as_ancestor_chain(ancestors)
+        for style_collection in style_sheet.select(layout_element, ancestors):
+            apply_style_collection(
+                layout_element=layout_element,
+                style_collection=style_collection,
+                strict=strict,
+            )
+        ancestors = ancestors.push(layout_element)
         for child in layout_element.children():
             apply_style_sheet(
                 map_or_layout_element=child,
@@ -236,9 +477,79 @@ def apply_style_sheet(
                 strict=strict,
                 ancestors=ancestors,
             )
-    if is_builder:
-        return map_or_layout_element
-    return momapy.builder.object_from_builder(map_or_layout_element)
+    return map_or_layout_element
+
+
+class _AncestorChain(collections.abc.Sequence):
+    """Persistent linked list of the ancestors of an element, root first.
+
+    Pushing an element returns a new chain sharing its ancestors with the
+    current one, and `chain[:-1]` and `chain[-1]` are constant time, so that
+    selectors can walk up the ancestors without copying them. Each chain also
+    memoizes whether its last element, with the rest of the chain as
+    ancestors, is selected by a given selector: when styling a layout, the
+    ancestor part of child and descendant selectors is hence evaluated once
+    per ancestor rather than once per descendant.
+    """
+
+    __slots__ = ("_length", "_matches", "element", "parent")
+
+    def __init__(self, element=None, parent=None):
+        self.element = element
+        self.parent = parent
+        self._length = 0 if parent is None else len(parent) + 1
+        self._matches = {}
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if start == 0 and step == 1:
+                return self._get_ancestor_chain(max(stop, 0))
+            return tuple(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ancestor chain index out of range")
+        return self._get_ancestor_chain(index + 1).element
+
+    def __iter__(self):
+        elements = []
+        chain = self
+        while chain._length:
+            elements.append(chain.element)
+            chain = chain.parent
+        return reversed(elements)
+
+    def _get_ancestor_chain(self, length):
+        chain = self
+        while chain._length > length:
+            chain = chain.parent
+        return chain
+
+    def push(self, element):
+        """Return a new chain with the given element as last element"""
+        return _AncestorChain(element, self)
+
+    def is_selected_by(self, selector):
+        """Return whether the last element of the chain is selected"""
+        is_selected = self._matches.get(selector)
+        if is_selected is None:
+            is_selected = selector.select(self.element, self.parent)
+            self._matches[selector] = is_selected
+        return is_selected
+
+
+def _as_ancestor_chain(ancestors):
+    if isinstance(ancestors, _AncestorChain):
+        return ancestors
+    chain = _AncestorChain()
+    if ancestors is not None:
+        for ancestor in ancestors:
+            chain = chain.push(ancestor)
+    return chain
 
 
 @dataclasses.dataclass(frozen=True)
@@ -303,11 +614,7 @@ class TypeSelector(Selector):
         Returns:
             True if the object's class name or builder name matches.
         """
-        obj_cls_name = type(obj).__name__
-        return (
-            obj_cls_name == self.class_name
-            or obj_cls_name == f"{self.class_name}Builder"
-        )
+        return self.class_name in _get_type_names(type(obj))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -344,11 +651,7 @@ class ClassSelector(Selector):
         Returns:
             True if the object is an instance of class_name or its subclasses.
         """
-        for cls in type(obj).__mro__:
-            cls_name = cls.__name__
-            if cls_name == self.class_name or cls_name == f"{self.class_name}Builder":
-                return True
-        return False
+        return self.class_name in _get_class_names(type(obj))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -427,9 +730,10 @@ class ChildSelector(Selector):
         """
         if not ancestors:
             return False
-        return self.child_selector.select(
-            obj, ancestors
-        ) and self.parent_selector.select(ancestors[-1], ancestors[:-1])
+        ancestors = _as_ancestor_chain(ancestors)
+        return self.child_selector.select(obj, ancestors) and ancestors.is_selected_by(
+            self.parent_selector
+        )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -473,12 +777,14 @@ class DescendantSelector(Selector):
         """
         if not ancestors:
             return False
-        return self.descendant_selector.select(obj, ancestors) and any(
-            [
-                self.ancestor_selector.select(ancestor, ancestors[:i])
-                for i, ancestor in enumerate(ancestors)
-            ]
-        )
+        ancestors = _as_ancestor_chain(ancestors)
+        if not self.descendant_selector.select(obj, ancestors):
+            return False
+        while ancestors:
+            if ancestors.is_selected_by(self.ancestor_selector):
+                return True
+            ancestors = ancestors.parent
+        return False
 
 
 @dataclasses.dataclass(frozen=True)
@@ -515,7 +821,7 @@ class OrSelector(Selector):
         Returns:
             True if any selector matches the object.
         """
-        return any([selector.select(obj, ancestors) for selector in self.selectors])
+        return any(selector.select(obj, ancestors) for selector in self.selectors)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -552,7 +858,7 @@ class CompoundSelector(Selector):
         Returns:
             True if all selectors match the object.
         """
-        return all([selector.select(obj, ancestors) for selector in self.selectors])
+        return all(selector.select(obj, ancestors) for selector in self.selectors)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -589,7 +895,435 @@ class NotSelector(Selector):
         Returns:
             True if no selector matches the object.
         """
-        return not any([selector.select(obj, ancestors) for selector in self.selectors])
+        return not any(selector.select(obj, ancestors) for selector in self.selectors)
+
+
+def _get_names_from_cls_name(cls_name: str) -> set[str]:
+    # A builder class matches the selectors of the class it builds
+    if cls_name.endswith("Builder"):
+        return {cls_name, cls_name.removesuffix("Builder")}
+    return {cls_name}
+
+
+@functools.cache
+def _get_type_names(cls: type) -> frozenset[str]:
+    """Return the names a TypeSelector can use to select instances of a class"""
+    return frozenset(_get_names_from_cls_name(cls.__name__))
+
+
+@functools.cache
+def _get_class_names(cls: type) -> frozenset[str]:
+    """Return the names a ClassSelector can use to select instances of a class"""
+    class_names = set()
+    for mro_cls in cls.__mro__:
+        class_names |= _get_names_from_cls_name(mro_cls.__name__)
+    return frozenset(class_names)
+
+
+def _get_selector_keys(selector: Selector) -> list[tuple[str, str]] | None:
+    """Return the index keys of the rightmost part of a selector.
+
+    An element can only be selected by the selector if it has one of the
+    returned keys. None is returned if no such keys can be determined, in
+    which case the selector must be tested against all elements.
+    """
+    if isinstance(selector, TypeSelector):
+        return [("type", selector.class_name)]
+    if isinstance(selector, ClassSelector):
+        return [("class", selector.class_name)]
+    if isinstance(selector, IdSelector):
+        return [("id", selector.id_)]
+    if isinstance(selector, ChildSelector):
+        return _get_selector_keys(selector.child_selector)
+    if isinstance(selector, DescendantSelector):
+        return _get_selector_keys(selector.descendant_selector)
+    if isinstance(selector, CompoundSelector):
+        for conjunct_selector in selector.selectors:
+            selector_keys = _get_selector_keys(conjunct_selector)
+            if selector_keys is not None:
+                return selector_keys
+        return None
+    if isinstance(selector, OrSelector):
+        selector_keys = []
+        for disjunct_selector in selector.selectors:
+            disjunct_selector_keys = _get_selector_keys(disjunct_selector)
+            if disjunct_selector_keys is None:
+                return None
+            selector_keys += disjunct_selector_keys
+        return selector_keys
+    return None
+
+
+def _get_element_keys(
+    obj: momapy.core.elements.LayoutElement | momapy.builder.Builder,
+) -> list[tuple[str, str]]:
+    """Return the index keys of an element"""
+    cls = type(obj)
+    element_keys = [("type", name) for name in _get_type_names(cls)]
+    element_keys += [("class", name) for name in _get_class_names(cls)]
+    id_ = getattr(obj, "id_", None)
+    if id_ is not None:
+        element_keys.append(("id", id_))
+    return element_keys
+
+
+@dataclasses.dataclass
+class CompiledStyleSheet(object):
+    """A stylesheet compiled for fast matching against layout elements.
+
+    Rules are indexed by the type, class or id of the rightmost part of their
+    selector, so that only the rules that can select a given element are
+    tested against it. Matching rules are returned in the order of the
+    original stylesheet, so that later rules take precedence over earlier
+    ones.
+
+    Attributes:
+        rules: The (selector, style collection) rules, in order.
+
+    Examples:
+        ```python
+        compiled_style_sheet = style_sheet.compile()
+        styled_element = apply_style_sheet(element, compiled_style_sheet)
+        ```
+    """
+
+    rules: tuple[tuple[Selector, StyleCollection], ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={"description": "The rules of the style sheet, in order"},
+    )
+    _index: dict[tuple[str, str], list[int]] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    _unindexed_rules: list[int] = dataclasses.field(
+        init=False, repr=False, default_factory=list
+    )
+
+    def __post_init__(self):
+        for i, (selector, _) in enumerate(self.rules):
+            selector_keys = _get_selector_keys(selector)
+            if selector_keys is None:
+                self._unindexed_rules.append(i)
+            else:
+                for selector_key in set(selector_keys):
+                    self._index.setdefault(selector_key, []).append(i)
+
+    @classmethod
+    def from_style_sheet(
+        cls, style_sheet: StyleSheet | LayeredStyleSheet
+    ) -> "CompiledStyleSheet":
+        """Compile a stylesheet.
+
+        Args:
+            style_sheet: The stylesheet to compile.
+
+        Returns:
+            The compiled stylesheet.
+        """
+        return cls(rules=tuple(style_sheet.items()))
+
+    def get_candidate_rules(
+        self, obj: momapy.core.elements.LayoutElement | momapy.builder.Builder
+    ) -> list[tuple[Selector, StyleCollection]]:
+        """Return the rules that may select an element, in order.
+
+        Args:
+            obj: The layout element or builder.
+
+        Returns:
+            The rules whose selector may select the element.
+        """
+        return [self.rules[i] for i in self._get_candidate_rule_indices(obj)]
+
+    def _get_candidate_rule_indices(self, obj):
+        rule_indices = set(self._unindexed_rules)
+        for element_key in _get_element_keys(obj):
+            element_rule_indices = self._index.get(element_key)
+            if element_rule_indices is not None:
+                rule_indices.update(element_rule_indices)
+        return sorted(rule_indices)
+
+    def _select_rule_indices(self, obj, ancestors):
+        return tuple(
+            i
+            for i in self._get_candidate_rule_indices(obj)
+            if self.rules[i][0].select(obj, ancestors)
+        )
+
+    def select(
+        self,
+        obj: momapy.core.elements.LayoutElement | momapy.builder.Builder,
+        ancestors: collections.abc.Collection[
+            momapy.core.elements.LayoutElement | momapy.builder.Builder
+        ],
+    ) -> list[StyleCollection]:
+        """Return the style collections of the rules that select an element.
+
+        Args:
+            obj: The layout element or builder to test.
+            ancestors: List of ancestor elements.
+
+        Returns:
+            The style collections of the matching rules, in order.
+        """
+        return [
+            style_collection
+            for selector, style_collection in self.get_candidate_rules(obj)
+            if selector.select(obj, ancestors)
+        ]
+
+
+@dataclasses.dataclass
+class StyleResolver(object):
+    """A resolver computing the style of layout elements at render time.
+
+    Instead of making a styled copy of a layout before rendering it, the
+    resolver computes the effective style of each element while walking the
+    layout to make its drawing elements. The computed style only depends on
+    the class of the element and on the rules that select it, and is hence
+    memoized on these, so that elements styled alike share it. Styled
+    elements are drawn through a transient shallow copy holding the computed
+    style, that is discarded as soon as its drawing elements are made: the
+    input layout is left untouched and no styled layout is kept.
+
+    Styles are resolved element by element: arcs are drawn against their
+    unstyled source and target. Resolvers that may change the geometry of
+    nodes (e.g., their size), as told by
+    [changes_geometry][momapy.styling.StyleResolver.changes_geometry],
+    should hence be applied to the layout with
+    [apply][momapy.styling.StyleResolver.apply] before it is drawn, which
+    [render_layout_elements][momapy.rendering.core.render_layout_elements]
+    does.
+
+    Attributes:
+        style_sheet: The compiled stylesheet to resolve styles from.
+        strict: If True, raises AttributeError for invalid attributes.
+        overrides: Style values set on top of the stylesheet, by layout
+            element id, e.g., to overlay data on a map.
+
+    Examples:
+        ```python
+        style_resolver = StyleResolver.from_style_sheet(style_sheet)
+        drawing_elements = style_resolver.drawing_elements(map_.layout)
+        ```
+    """
+
+    style_sheet: CompiledStyleSheet = dataclasses.field(
+        metadata={"description": "The compiled stylesheet to resolve styles from"}
+    )
+    strict: bool = dataclasses.field(
+        default=True,
+        metadata={"description": "Whether to raise errors for invalid attributes"},
+    )
+    overrides: dict[str, dict[str, typing.Any]] = dataclasses.field(
+        default_factory=dict,
+        metadata={
+            "description": "Style values set on top of the stylesheet, by layout element id"
+        },
+    )
+    _computed_styles: dict = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    _frozen_values: dict = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    @classmethod
+    def from_style_sheet(
+        cls,
+        style_sheet: "StyleSheet | LayeredStyleSheet | CompiledStyleSheet | None",
+        strict: bool = True,
+        overrides: dict[str, dict[str, typing.Any]] | None = None,
+    ) -> "StyleResolver":
+        """Make a style resolver from a stylesheet.
+
+        Args:
+            style_sheet: The stylesheet. It is compiled first if it is not
+                already a CompiledStyleSheet. If None, only the overrides
+                are applied.
+            strict: If True, raises AttributeError for invalid attributes.
+            overrides: Style values set on top of the stylesheet, by layout
+                element id.
+
+        Returns:
+            The style resolver.
+        """
+        if style_sheet is None:
+            style_sheet = CompiledStyleSheet()
+        elif not isinstance(style_sheet, CompiledStyleSheet):
+            style_sheet = CompiledStyleSheet.from_style_sheet(style_sheet)
+        if overrides is None:
+            overrides = {}
+        return cls(style_sheet=style_sheet, strict=strict, overrides=overrides)
+
+    def changes_geometry(self) -> bool:
+        """Return `True` if the resolver may change the geometry of layout elements.
+
+        The geometry of layout elements may change if the stylesheet or the
+        overrides set attributes other than presentation attributes (e.g.,
+        the position or the size of nodes).
+        """
+        style_collections = [
+            style_collection for _, style_collection in self.style_sheet.rules
+        ] + list(self.overrides.values())
+        return any(
+            not _is_presentation_attribute(attribute)
+            for style_collection in style_collections
+            for attribute in style_collection
+        )
+
+    def apply(
+        self,
+        map_or_layout_element: momapy.core.map.Map | momapy.core.elements.LayoutElement,
+    ) -> momapy.core.map.Map | momapy.core.elements.LayoutElement:
+        """Return a styled copy of a map or layout element.
+
+        The stylesheet and then the overrides are applied with
+        [apply_style_sheet][momapy.styling.apply_style_sheet], so that the
+        untouched subtrees are shared with the input.
+
+        Args:
+            map_or_layout_element: The map or layout element to style.
+
+        Returns:
+            The styled map or layout element.
+        """
+        style_sheet = self.style_sheet
+        if self.overrides:
+            style_sheet = CompiledStyleSheet(
+                rules=style_sheet.rules
+                + tuple(
+                    (IdSelector(id_), StyleCollection(override))
+                    for id_, override in self.overrides.items()
+                )
+            )
+        return apply_style_sheet(map_or_layout_element, style_sheet, strict=self.strict)
+
+    def get_computed_style(
+        self,
+        layout_element: momapy.core.elements.LayoutElement,
+        ancestors: collections.abc.Collection[momapy.core.elements.LayoutElement]
+        | None = None,
+    ) -> dict[str, typing.Any]:
+        """Return the style computed for a layout element.
+
+        Args:
+            layout_element: The layout element.
+            ancestors: The ancestors of the layout element, root first.
+
+        Returns:
+            The values of the attributes set by the stylesheet, by
+            attribute name. The returned dictionary is shared and should
+            not be modified.
+
+        Raises:
+            AttributeError: If strict=True and a selected attribute doesn't
+                exist on the element.
+        """
+        rule_indices = self.style_sheet._select_rule_indices(
+            layout_element, _as_ancestor_chain(ancestors)
+        )
+        if not rule_indices:
+            computed_style = {}
+        else:
+            key = (type(layout_element), rule_indices)
+            computed_style = self._computed_styles.get(key)
+            if computed_style is None:
+                changes = _get_style_changes(
+                    layout_element,
+                    [self.style_sheet.rules[i][1] for i in rule_indices],
+                    self.strict,
+                )
+                computed_style = _get_frozen_style_values(changes, self._frozen_values)
+                self._computed_styles[key] = computed_style
+        if self.overrides:
+            override = self.overrides.get(getattr(layout_element, "id_", None))
+            if override:
+                computed_style = computed_style | override
+        return computed_style
+
+    def drawing_elements(
+        self,
+        layout_element: momapy.core.elements.LayoutElement,
+        ancestors: collections.abc.Collection[momapy.core.elements.LayoutElement]
+        | None = None,
+    ) -> list[momapy.drawing.DrawingElement]:
+        """Return the drawing elements of a layout element styled by the stylesheet.
+
+        Args:
+            layout_element: The layout element.
+            ancestors: The ancestors of the layout element, root first.
+
+        Returns:
+            The drawing elements, as the `drawing_elements` method of the
+            styled layout element would return them.
+        """
+        ancestors = _as_ancestor_chain(ancestors)
+        if (
+            not isinstance(layout_element, momapy.core.layout.GroupLayout)
+            or type(layout_element).drawing_elements
+            is not momapy.core.layout.GroupLayout.drawing_elements
+        ):
+            # The element draws its children itself: they are styled first
+            return self._make_styled_tree(layout_element, ancestors).drawing_elements()
+        styled_element = _make_styled_view(
+            layout_element, self.get_computed_style(layout_element, ancestors)
+        )
+        drawing_elements = styled_element.own_drawing_elements()
+        child_ancestors = ancestors.push(layout_element)
+        for child in styled_element.children():
+            if child is not None:
+                drawing_elements += self.drawing_elements(child, child_ancestors)
+        return [styled_element._make_group(drawing_elements)]
+
+    def _make_styled_tree(self, layout_element, ancestors):
+        """Return a styled view of a layout element and of its descendants"""
+        computed_style = self.get_computed_style(layout_element, ancestors)
+        children = [child for child in layout_element.children() if child is not None]
+        if not children:
+            return _make_styled_view(layout_element, computed_style)
+        child_ancestors = ancestors.push(layout_element)
+        styled_children = {
+            id(child): self._make_styled_tree(child, child_ancestors)
+            for child in children
+        }
+        changes = dict(computed_style)
+        for field in dataclasses.fields(layout_element):
+            if field.name not in changes:
+                value = getattr(layout_element, field.name)
+                new_value = _replace_layout_elements(value, styled_children)
+                if new_value is not value:
+                    changes[field.name] = new_value
+        return _make_styled_view(layout_element, changes)
+
+
+def _replace_layout_elements(obj, new_layout_elements):
+    # Layout elements are replaced by id, in the object or in its elements if
+    # it is a collection; the object is returned if nothing is replaced
+    if isinstance(obj, (tuple, list, frozenset)):
+        new_elements = [
+            _replace_layout_elements(element, new_layout_elements) for element in obj
+        ]
+        if all(
+            new_element is element for new_element, element in zip(new_elements, obj)
+        ):
+            return obj
+        return type(obj)(new_elements)
+    if isinstance(obj, momapy.core.elements.LayoutElement):
+        return new_layout_elements.get(id(obj), obj)
+    return obj
+
+
+def _make_styled_view(layout_element, computed_style):
+    # A shallow copy is made without calling __init__, so that making it does
+    # not depend on the number of fields of the element nor on its validation
+    if not computed_style:
+        return layout_element
+    styled_element = copy.copy(layout_element)
+    # The content hash memoized on the element does not hold for the view
+    styled_element.__dict__.pop("_content_hash", None)
+    for attribute, value in computed_style.items():
+        object.__setattr__(styled_element, attribute, value)
+    return styled_element
 
 
 _css_import_keyword = pyparsing.Literal("@import")
@@ -745,13 +1479,9 @@ def _resolve_css_attribute_value(results):
     return results
 
 
-def _make_document_parser(base_dir: pathlib.Path) -> pyparsing.ParserElement:
-    def _resolve_import(results):
-        return StyleSheet.from_file(base_dir / results[1])
-
-    import_stmt = _css_import_statement.copy()
-    import_stmt.set_parse_action(_resolve_import)
-    return import_stmt[...] + _css_style_sheet[...]
+@_css_import_statement.set_parse_action
+def _resolve_css_import_statement(results):
+    return _CSSImport(results[1])
 
 
 @_css_attribute_name.set_parse_action
@@ -830,10 +1560,261 @@ def _resolve_css_style_sheet(results):
     return StyleSheet(dict(list(results[0])))
 
 
-@_css_document.set_parse_action
-def _resolve_css_document(results):
-    style_sheets = [style_sheet for style_sheet in results if style_sheet is not None]
-    return combine_style_sheets(style_sheets)
+@dataclasses.dataclass(frozen=True)
+class _CSSImport(object):
+    file_path: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _FileRecord(object):
+    """Record of the state of a file when it was parsed"""
+
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _StyleSheetCacheEntry(object):
+    """A parsed style sheet with the records of the files it was parsed from"""
+
+    style_sheet: StyleSheet
+    file_records: tuple[_FileRecord, ...]
+
+
+_style_sheet_cache: collections.OrderedDict[str, _StyleSheetCacheEntry] = (
+    collections.OrderedDict()
+)
+_style_sheet_cache_size: int | None = 128
+_style_sheet_cache_lock = threading.Lock()
+_style_sheet_cache_dir: pathlib.Path | None = None
+_style_sheet_cache_key: bytes | None = None
+_DISK_CACHE_KEY_FILE_NAME = "key"
+_DISK_CACHE_KEY_SIZE = 32
+_DISK_CACHE_SIGNATURE_SIZE = 32
+
+
+def set_style_sheet_cache_dir(cache_dir: str | os.PathLike | None) -> None:
+    """Set the directory where parsed style sheets are cached on disk.
+
+    Cache files are signed with a secret key stored in the cache directory,
+    readable by its owner only, and a cache file is only loaded if its
+    signature is valid. The disk cache is not used if the key file is not
+    owned by the current user or is accessible to other users.
+
+    Args:
+        cache_dir: The cache directory, created if it does not exist. If
+            None, parsed style sheets are only cached in memory.
+    """
+    global _style_sheet_cache_dir, _style_sheet_cache_key
+    if cache_dir is None:
+        _style_sheet_cache_dir = None
+        _style_sheet_cache_key = None
+    else:
+        _style_sheet_cache_dir = pathlib.Path(cache_dir).expanduser()
+        _style_sheet_cache_dir.mkdir(parents=True, exist_ok=True)
+        _style_sheet_cache_key = _get_or_make_disk_cache_key(_style_sheet_cache_dir)
+
+
+def set_style_sheet_cache_size(maxsize: int | None) -> None:
+    """Set the maximum number of parsed style sheets cached in memory.
+
+    When the cache is full, the least recently used style sheet is evicted
+    first. Imported style sheets are cached as well, and count towards the
+    size of the cache.
+
+    Args:
+        maxsize: The maximum number of cached style sheets. If None, the
+            cache is unbounded.
+    """
+    global _style_sheet_cache_size
+    with _style_sheet_cache_lock:
+        _style_sheet_cache_size = maxsize
+        _evict_style_sheet_cache_entries()
+
+
+def clear_style_sheet_cache() -> None:
+    """Empty the in-memory cache of parsed style sheets"""
+    with _style_sheet_cache_lock:
+        _style_sheet_cache.clear()
+
+
+def _evict_style_sheet_cache_entries():
+    if _style_sheet_cache_size is not None:
+        while len(_style_sheet_cache) > _style_sheet_cache_size:
+            _style_sheet_cache.popitem(last=False)
+
+
+def _set_memory_cached_style_sheet_entry(
+    path: pathlib.Path, entry: _StyleSheetCacheEntry
+):
+    with _style_sheet_cache_lock:
+        _style_sheet_cache[str(path)] = entry
+        _style_sheet_cache.move_to_end(str(path))
+        _evict_style_sheet_cache_entries()
+
+
+def _hash_content(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _make_file_record(path: pathlib.Path, content: bytes) -> _FileRecord:
+    stat = path.stat()
+    return _FileRecord(
+        path=str(path),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        content_hash=_hash_content(content),
+    )
+
+
+def _is_file_record_valid(file_record: _FileRecord) -> bool:
+    try:
+        stat = os.stat(file_record.path)
+    except OSError:
+        return False
+    if stat.st_mtime_ns == file_record.mtime_ns and stat.st_size == file_record.size:
+        return True
+    # The file was touched or rewritten: it is still valid if its content is
+    # the same
+    with open(file_record.path, "rb") as f:
+        return _hash_content(f.read()) == file_record.content_hash
+
+
+def _get_or_make_disk_cache_key(cache_dir: pathlib.Path) -> bytes | None:
+    key_file_path = cache_dir / _DISK_CACHE_KEY_FILE_NAME
+    try:
+        fd = os.open(key_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    else:
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(_DISK_CACHE_KEY_SIZE))
+    try:
+        with open(key_file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if hasattr(os, "getuid") and (
+                stat.st_uid != os.getuid() or stat.st_mode & 0o077
+            ):
+                return None
+            key = f.read()
+    except OSError:
+        return None
+    # The key may still be being written by another process
+    if len(key) != _DISK_CACHE_KEY_SIZE:
+        return None
+    # Cache files written by other versions of momapy are not loaded
+    try:
+        version = importlib.metadata.version("momapy")
+    except importlib.metadata.PackageNotFoundError:
+        version = ""
+    return hashlib.blake2b(version.encode(), key=key).digest()
+
+
+def _sign_disk_cache_data(data: bytes) -> bytes:
+    return hashlib.blake2b(
+        data, key=_style_sheet_cache_key, digest_size=_DISK_CACHE_SIGNATURE_SIZE
+    ).digest()
+
+
+def _get_disk_cache_file_path(path: pathlib.Path) -> pathlib.Path:
+    file_name = hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()
+    return _style_sheet_cache_dir / f"{file_name}.pickle"
+
+
+def _get_cached_style_sheet_entry(
+    path: pathlib.Path,
+) -> _StyleSheetCacheEntry | None:
+    with _style_sheet_cache_lock:
+        entry = _style_sheet_cache.get(str(path))
+    if entry is None and _style_sheet_cache_key is not None:
+        try:
+            with open(_get_disk_cache_file_path(path), "rb") as f:
+                signature = f.read(_DISK_CACHE_SIGNATURE_SIZE)
+                data = f.read()
+            # Only files signed with the key of the cache are unpickled
+            if hmac.compare_digest(signature, _sign_disk_cache_data(data)):
+                entry = pickle.loads(data)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            entry = None
+    if entry is None or not all(
+        _is_file_record_valid(file_record) for file_record in entry.file_records
+    ):
+        return None
+    _set_memory_cached_style_sheet_entry(path, entry)
+    return entry
+
+
+def _cache_style_sheet_entry(path: pathlib.Path, entry: _StyleSheetCacheEntry):
+    _set_memory_cached_style_sheet_entry(path, entry)
+    if _style_sheet_cache_key is not None:
+        cache_file_path = _get_disk_cache_file_path(path)
+        tmp_file_path = cache_file_path.with_suffix(f".{os.getpid()}.tmp")
+        data = pickle.dumps(entry)
+        try:
+            with open(tmp_file_path, "wb") as f:
+                f.write(_sign_disk_cache_data(data))
+                f.write(data)
+            os.replace(tmp_file_path, cache_file_path)
+        except OSError:
+            pass
+
+
+def _get_or_parse_style_sheet_file(
+    path: pathlib.Path, use_cache: bool
+) -> tuple[StyleSheet, tuple[_FileRecord, ...]]:
+    """Return the style sheet of a CSS file and the records of its files.
+
+    The returned style sheet may be shared with the cache and must not be
+    modified.
+    """
+    if use_cache:
+        entry = _get_cached_style_sheet_entry(path)
+        if entry is not None:
+            return entry.style_sheet, entry.file_records
+    content = path.read_bytes()
+    file_record = _make_file_record(path, content)
+    results = _css_document.parse_string(content.decode("utf-8"), parse_all=True)
+    style_sheet, file_records = _make_style_sheet_from_results(
+        results, path.parent, use_cache
+    )
+    file_records = (file_record,) + file_records
+    if use_cache:
+        _cache_style_sheet_entry(
+            path,
+            _StyleSheetCacheEntry(style_sheet=style_sheet, file_records=file_records),
+        )
+    return style_sheet, file_records
+
+
+def _make_style_sheet_from_results(
+    results: pyparsing.ParseResults, base_dir: pathlib.Path, use_cache: bool
+) -> tuple[StyleSheet | None, tuple[_FileRecord, ...]]:
+    """Combine the imported and the parsed style sheets of a CSS document"""
+    style_sheets = []
+    file_records = ()
+    has_imports = False
+    for result in results:
+        if isinstance(result, _CSSImport):
+            has_imports = True
+            imported_style_sheet, imported_file_records = (
+                _get_or_parse_style_sheet_file(
+                    (base_dir / result.file_path).resolve(), use_cache
+                )
+            )
+            style_sheets.append(imported_style_sheet)
+            file_records += imported_file_records
+        elif result is not None:
+            style_sheets.append(result)
+    if len(style_sheets) == 1 and has_imports:
+        # Imported style sheets may be shared with the cache
+        style_sheet = copy.deepcopy(style_sheets[0])
+    else:
+        style_sheet = combine_style_sheets(style_sheets)
+    return style_sheet, file_records
 
 
 def _is_presentation_attribute(field_name: str) -> bool:
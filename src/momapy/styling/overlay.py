@@ -0,0 +1,202 @@
+"""Overlay of data values on maps.
+
+An overlay colors the layout elements of a map from values attached to its
+model elements, e.g., expression values of species. Unlike a stylesheet
+made of one id selector per element, an overlay is computed in one pass over
+the layout-model mapping of the map, and applied in one pass over its
+layout, so that its cost is linear in the number of elements.
+
+Examples:
+    ```python
+    from momapy.coloring import Colormap, blue, white, red
+    from momapy.rendering.core import render_map
+    from momapy.styling import apply_overlay, make_overlay
+
+    overlay = make_overlay(map_, {"s1": 2.5, "s2": -1.0}, Colormap((blue, white, red)))
+    styled_map = apply_overlay(map_, overlay)
+    render_map(map_, "output.svg", style_sheet=overlay.to_style_resolver())
+    ```
+"""
+
+import collections.abc
+import dataclasses
+import math
+import typing
+
+import momapy.builder
+import momapy.coloring
+import momapy.core.elements
+import momapy.core.map
+import momapy.styling.core
+
+
+@dataclasses.dataclass(frozen=True)
+class Overlay(object):
+    """Style values of the layout elements of a map, computed from data.
+
+    Attributes:
+        styles: The style values, by layout element id.
+    """
+
+    styles: dict[str, dict[str, typing.Any]] = dataclasses.field(
+        default_factory=dict,
+        metadata={"description": "The style values, by layout element id"},
+    )
+
+    def to_style_resolver(
+        self,
+        style_sheet: "momapy.styling.core.StyleSheet | None" = None,
+        strict: bool = True,
+    ) -> "momapy.styling.core.StyleResolver":
+        """Return a style resolver applying the overlay at render time.
+
+        Args:
+            style_sheet: An optional stylesheet to apply below the overlay.
+            strict: If True, raises AttributeError for invalid attributes
+                of the stylesheet.
+
+        Returns:
+            The style resolver.
+        """
+        return momapy.styling.core.StyleResolver.from_style_sheet(
+            style_sheet, strict=strict, overrides=self.styles
+        )
+
+    def to_style_sheet(self) -> "momapy.styling.core.StyleSheet":
+        """Return the overlay as a stylesheet of id selectors.
+
+        Returns:
+            The stylesheet, with one rule per layout element.
+        """
+        return momapy.styling.core.StyleSheet(
+            {
+                momapy.styling.core.IdSelector(
+                    id_
+                ): momapy.styling.core.StyleCollection(style)
+                for id_, style in self.styles.items()
+            }
+        )
+
+
+def make_overlay(
+    map_: momapy.core.map.Map,
+    values: collections.abc.Mapping[str, float]
+    | collections.abc.Iterable[tuple[str, float]],
+    colormap: momapy.coloring.Colormap | None = None,
+    attributes: collections.abc.Iterable[str] = ("fill",),
+    vmin: float | None = None,
+    vmax: float | None = None,
+) -> Overlay:
+    """Make an overlay coloring the layout elements of a map from values.
+
+    Each model element whose id has a value is colored in all the layout
+    elements representing it. A model element represented by a cluster of
+    layout elements, e.g., a process, is colored in the anchor of the
+    cluster only. Values are mapped linearly from [vmin, vmax] to the
+    colormap. Non-finite values (NaN and infinities) are given to the
+    colormap as they are, and get its bad color. A map without a layout
+    model mapping has no colored layout element.
+
+    Args:
+        map_: The map.
+        values: The values, by model element id, as a mapping or as
+            (id, value) pairs.
+        colormap: The colormap. If None, a blue-white-red colormap is used.
+        attributes: The attributes set to the color of the value, when the
+            layout element has them.
+        vmin: The value mapped to the start of the colormap. If None, the
+            minimum of the finite values.
+        vmax: The value mapped to the end of the colormap. If None, the
+            maximum of the finite values.
+
+    Returns:
+        The overlay.
+
+    Raises:
+        ValueError: If a value is not finite and the colormap has no bad
+            color.
+    """
+    values = dict(values)
+    layout_model_mapping = map_.layout_model_mapping
+    if not values or layout_model_mapping is None:
+        return Overlay()
+    if colormap is None:
+        colormap = momapy.coloring.Colormap(
+            (momapy.coloring.blue, momapy.coloring.white, momapy.coloring.red)
+        )
+    finite_values = [value for value in values.values() if math.isfinite(value)]
+    if vmin is None:
+        vmin = min(finite_values, default=0.0)
+    if vmax is None:
+        vmax = max(finite_values, default=0.0)
+    span = vmax - vmin
+    attributes = tuple(attributes)
+    styles = {}
+    for key, model_element in layout_model_mapping.items():
+        value = values.get(model_element.id_)
+        if value is None:
+            continue
+        if math.isfinite(value):
+            value = (value - vmin) / span if span else 0.5
+        color = colormap(value)
+        for layout_element in layout_model_mapping.get_anchors(key):
+            style = {
+                attribute: color
+                for attribute in attributes
+                if hasattr(layout_element, attribute)
+            }
+            if style:
+                styles[layout_element.id_] = style
+    return Overlay(styles)
+
+
+def apply_overlay(
+    map_or_layout_element: (
+        momapy.core.map.Map
+        | momapy.core.elements.LayoutElement
+        | momapy.builder.Builder
+    ),
+    overlay: Overlay,
+) -> momapy.core.map.Map | momapy.core.elements.LayoutElement | momapy.builder.Builder:
+    """Apply an overlay to a map or layout element.
+
+    Frozen maps and layout elements are restyled by structural sharing, as
+    with [apply_style_sheet][momapy.styling.apply_style_sheet]. Builders are
+    modified in place.
+
+    Args:
+        map_or_layout_element: The map, element, or builder to style.
+        overlay: The overlay to apply.
+
+    Returns:
+        The styled map, layout element, or builder.
+    """
+    if momapy.builder.isinstance_or_builder(map_or_layout_element, momapy.core.map.Map):
+        layout = map_or_layout_element.layout
+    else:
+        layout = map_or_layout_element
+    is_builder = isinstance(map_or_layout_element, momapy.builder.Builder)
+    changes_by_element = {}
+    layout_elements = [layout]
+    while layout_elements:
+        layout_element = layout_elements.pop()
+        style = overlay.styles.get(layout_element.id_)
+        if style is not None:
+            style = {
+                attribute: value
+                for attribute, value in style.items()
+                if hasattr(layout_element, attribute)
+            }
+            if is_builder:
+                for attribute, value in style.items():
+                    setattr(layout_element, attribute, value)
+            elif style:
+                changes_by_element[id(layout_element)] = (layout_element, style)
+        layout_elements.extend(
+            child for child in layout_element.children() if child is not None
+        )
+    if is_builder:
+        return map_or_layout_element
+    return momapy.styling.core._apply_style_changes(
+        map_or_layout_element, changes_by_element
+    )
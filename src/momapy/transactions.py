@@ -0,0 +1,860 @@
+"""Transactions recording the edits of maps as patches.
+
+A transaction edits an object, typically a map, through a lazy builder, and
+records the edits as a patch: a log of operations, each changing an attribute
+of an element of the object, given by its path from the object, from an old
+value to a new value. Tuples and frozensets are changed element-wise, so that
+an operation only holds the elements that were removed or added. A patch can
+be applied to the object it was recorded on, serialized to JSON, and inverted
+to undo the edits, so that edits can be stored or exchanged as small deltas
+instead of whole maps.
+
+Applying a patch rebuilds the object by structural sharing: only the edited
+elements and the elements that reference them are copied, and the other
+elements are shared with the input.
+
+Examples:
+    ```python
+    from momapy.coloring import red
+    from momapy.transactions import Patch, Transaction
+
+    with Transaction(map_) as transaction:
+        transaction.builder.layout.layout_elements[0].fill = red
+    new_map = transaction.result
+    json_string = transaction.patch.to_json()
+    assert Patch.from_json(json_string).apply(map_) == new_map
+    assert transaction.inverse_patch.apply(new_map) == map_
+    ```
+"""
+
+import collections
+import collections.abc
+import dataclasses
+import difflib
+import enum
+import importlib
+import json
+import typing
+
+import frozendict
+import typing_extensions
+
+import momapy.builder
+import momapy.core.elements
+import momapy.drawing
+import momapy.monitoring
+
+
+@dataclasses.dataclass(frozen=True)
+class Member(object):
+    """Step of a path selecting an element of a frozenset by its id.
+
+    Attributes:
+        id_: The id of the element.
+    """
+
+    id_: str = dataclasses.field(metadata={"description": "The id of the element"})
+
+
+@dataclasses.dataclass(frozen=True)
+class Reference(object):
+    """Reference to an element of the object a patch applies to.
+
+    Attributes:
+        path: The path of the element from the object.
+    """
+
+    path: tuple[str | int | Member, ...] = dataclasses.field(
+        metadata={"description": "The path of the element from the object"}
+    )
+
+
+class OperationKind(enum.Enum):
+    """Kinds of operations."""
+
+    SET = 0
+    SPLICE = 1
+    UPDATE = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class Operation(object):
+    """Operation changing an attribute of an element.
+
+    A `SET` operation sets the attribute from its old value to its new
+    value. A `SPLICE` operation replaces the elements of a tuple attribute
+    starting at `index`, given by the old value, by those of the new value.
+    An `UPDATE` operation removes the elements of the old value from a
+    frozenset attribute, and adds those of the new value. Values may contain
+    references to the elements of the object the operation applies to.
+
+    Attributes:
+        path: The path of the element from the object. Steps are attribute
+            names, indices in tuples, and members of frozensets.
+        attribute: The name of the attribute that is changed.
+        old_value: The value, or the removed elements, of the attribute
+            before the operation.
+        new_value: The value, or the added elements, of the attribute after
+            the operation.
+        kind: The kind of the operation.
+        index: The index of the first replaced element, for a `SPLICE`
+            operation.
+    """
+
+    path: tuple[str | int | Member, ...] = dataclasses.field(
+        metadata={"description": "The path of the element from the object"}
+    )
+    attribute: str = dataclasses.field(
+        metadata={"description": "The name of the attribute that is changed"}
+    )
+    old_value: typing.Any = dataclasses.field(
+        metadata={
+            "description": "The value, or the removed elements, of the attribute"
+            " before the operation"
+        }
+    )
+    new_value: typing.Any = dataclasses.field(
+        metadata={
+            "description": "The value, or the added elements, of the attribute"
+            " after the operation"
+        }
+    )
+    kind: OperationKind = dataclasses.field(
+        default=OperationKind.SET,
+        metadata={"description": "The kind of the operation"},
+    )
+    index: int | None = dataclasses.field(
+        default=None,
+        metadata={
+            "description": "The index of the first replaced element, for a"
+            " splice operation"
+        },
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Patch(object):
+    """Sequence of operations recorded on an object.
+
+    The paths of the operations and the references in their values are all
+    relative to the object before the patch is applied.
+
+    Attributes:
+        operations: The operations of the patch.
+    """
+
+    operations: tuple[Operation, ...] = dataclasses.field(
+        default_factory=tuple,
+        metadata={"description": "The operations of the patch"},
+    )
+
+    def __len__(self):
+        return len(self.operations)
+
+    def apply(self, obj: typing.Any, check: bool = True) -> typing.Any:
+        """Apply the patch to an object.
+
+        Args:
+            obj: The object to apply the patch to, e.g., the map the patch
+                was recorded on.
+            check: Whether to check that the attributes changed by the
+                patch have their old values, or contain their old elements,
+                in the object.
+
+        Returns:
+            The new object. Its elements that are not edited and do not
+            reference edited elements are those of the input object.
+
+        Raises:
+            ValueError: If `check` is True and an attribute changed by the
+                patch does not have its old value in the object.
+        """
+        if not self.operations:
+            return obj
+        if check:
+            for operation in self.operations:
+                element = _get_at_path(obj, operation.path)
+                old_value = _resolve_references(
+                    operation.old_value, lambda path: _get_at_path(obj, path)
+                )
+                if not _has_old_value(
+                    getattr(element, operation.attribute), operation, old_value
+                ):
+                    raise ValueError(
+                        f"attribute '{operation.attribute}' of the element at "
+                        f"path {operation.path} does not have the old value "
+                        "of the patch"
+                    )
+        builder = momapy.builder.builder_from_object(obj, lazy=True)
+
+        def _resolve(path):
+            return _get_at_path(builder, path)
+
+        # Elements and values are all resolved before any attribute is set,
+        # since paths are relative to the object before the patch
+        changes = []
+        for operation in self.operations:
+            element = _get_at_path(builder, operation.path)
+            if operation.kind is OperationKind.UPDATE:
+                old_value = _resolve_references(operation.old_value, _resolve)
+            else:
+                old_value = operation.old_value
+            new_value = _resolve_references(
+                operation.new_value, _resolve, to_builder=True
+            )
+            changes.append((element, operation, old_value, new_value))
+        # Splices of a same attribute are applied from the last one, so that
+        # the indices of the others are still those of the object
+        changes.sort(
+            key=lambda change: (
+                -change[1].index if change[1].kind is OperationKind.SPLICE else 0
+            )
+        )
+        with momapy.monitoring.batch():
+            for element, operation, old_value, new_value in changes:
+                if operation.kind is OperationKind.SPLICE:
+                    values = list(getattr(element, operation.attribute))
+                    values[operation.index : operation.index + len(old_value)] = (
+                        new_value
+                    )
+                    new_value = values
+                elif operation.kind is OperationKind.UPDATE:
+                    values = set(getattr(element, operation.attribute))
+                    values.difference_update(old_value)
+                    values.update(new_value)
+                    new_value = values
+                setattr(element, operation.attribute, new_value)
+        return momapy.builder.object_from_builder(builder)
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize the patch to a JSON string.
+
+        Values are encoded with the type of their dataclasses, enums and
+        mappings, so that they are decoded into objects of the same type.
+
+        Args:
+            kwargs: Additional arguments passed to `json.dumps`.
+
+        Returns:
+            The JSON string.
+        """
+        encoded_operations = []
+        for operation in self.operations:
+            encoded_operation = {
+                "path": _encode_path(operation.path),
+                "attribute": operation.attribute,
+                "old_value": _encode_value(operation.old_value),
+                "new_value": _encode_value(operation.new_value),
+            }
+            if operation.kind is not OperationKind.SET:
+                encoded_operation["kind"] = operation.kind.name
+            if operation.index is not None:
+                encoded_operation["index"] = operation.index
+            encoded_operations.append(encoded_operation)
+        return json.dumps(encoded_operations, **kwargs)
+
+    @classmethod
+    def from_json(cls, json_string: str) -> typing_extensions.Self:
+        """Deserialize a patch from a JSON string made by `to_json`.
+
+        Args:
+            json_string: The JSON string.
+
+        Returns:
+            The patch.
+
+        Raises:
+            ValueError: If the string does not encode a patch, or encodes a
+                value that cannot be decoded, such as an object of a class
+                that is not part of momapy.
+        """
+        operations = []
+        for operation in json.loads(json_string):
+            try:
+                kind = OperationKind[operation.get("kind", OperationKind.SET.name)]
+                path = _decode_path(operation["path"])
+                attribute = operation["attribute"]
+                old_value = _decode_value(operation["old_value"])
+                new_value = _decode_value(operation["new_value"])
+                index = operation.get("index")
+            except (KeyError, TypeError, AttributeError) as error:
+                raise ValueError(f"invalid operation {operation}") from error
+            if (kind is OperationKind.SPLICE) != isinstance(index, int):
+                raise ValueError(f"invalid operation {operation}")
+            operations.append(
+                Operation(
+                    path=path,
+                    attribute=attribute,
+                    old_value=old_value,
+                    new_value=new_value,
+                    kind=kind,
+                    index=index,
+                )
+            )
+        return cls(tuple(operations))
+
+
+@dataclasses.dataclass
+class Transaction(object):
+    """Class for transactions recording the edits of an object.
+
+    The object is edited through `builder`, a lazy builder of the object.
+    When the transaction is committed, e.g., when its context exits without
+    error, the edited object is built and the edits are recorded as a patch
+    and as an inverse patch. Notifications of the monitored attributes set
+    in the context are coalesced with `momapy.monitoring.batch`.
+
+    Attributes:
+        obj: The object to edit.
+        builder: The lazy builder to edit the object with.
+        result: The edited object, once the transaction is committed.
+        patch: The patch from the object to the edited object, once the
+            transaction is committed.
+        inverse_patch: The patch from the edited object to the object,
+            once the transaction is committed.
+    """
+
+    obj: typing.Any = dataclasses.field(metadata={"description": "The object to edit"})
+    builder: momapy.builder.Builder = dataclasses.field(
+        init=False,
+        metadata={"description": "The lazy builder to edit the object with"},
+    )
+    result: typing.Any = dataclasses.field(
+        init=False,
+        default=None,
+        metadata={"description": "The edited object"},
+    )
+    patch: Patch | None = dataclasses.field(
+        init=False,
+        default=None,
+        metadata={"description": "The patch from the object to the edited object"},
+    )
+    inverse_patch: Patch | None = dataclasses.field(
+        init=False,
+        default=None,
+        metadata={"description": "The patch from the edited object to the object"},
+    )
+    _batch: typing.Any = dataclasses.field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        self.builder = momapy.builder.builder_from_object(self.obj, lazy=True)
+
+    def __enter__(self) -> typing_extensions.Self:
+        self._batch = momapy.monitoring.batch()
+        self._batch.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch.__exit__(exc_type, exc_value, traceback)
+        self._batch = None
+        if exc_type is None:
+            self.commit()
+
+    def commit(self) -> Patch:
+        """Build the edited object and record the edits.
+
+        Returns:
+            The patch from the object to the edited object.
+
+        Raises:
+            ValueError: If an edited element cannot be reached from the
+                object by a path.
+        """
+        builder_to_object = {}
+        self.result = momapy.builder.object_from_builder(
+            self.builder, builder_to_object=builder_to_object
+        )
+        object_to_builder = self.builder.__dict__["_lazy_object_to_builder"]
+        built_to_source = {}
+        source_to_built = {}
+        edited_builders = []
+        for key, builder in object_to_builder.items():
+            source = object_to_builder.objects[key]
+            built = builder_to_object.get(id(builder))
+            if built is None:  # no longer part of the edited object
+                continue
+            built_to_source[id(built)] = source
+            source_to_built[id(source)] = built
+            if built is not source and dataclasses.is_dataclass(builder):
+                edited_builders.append((builder, source, built))
+        source_paths = _get_paths(self.obj)
+        built_paths = _get_paths(self.result)
+        operations = []
+        inverse_operations = []
+        for builder, source, built in edited_builders:
+            for field_ in dataclasses.fields(builder):
+                # Fields that were never accessed are unchanged, up to the
+                # elements they reference
+                if field_.name not in builder.__dict__:
+                    continue
+                old_value = getattr(source, field_.name, None)
+                new_value = getattr(built, field_.name)
+                if _is_unchanged(new_value, old_value, built_to_source):
+                    continue
+                source_path = source_paths.get(id(source))
+                built_path = built_paths.get(id(built))
+                if source_path is None or built_path is None:
+                    raise ValueError(
+                        f"could not find a path to the edited element {source}"
+                    )
+                field_operations, field_inverse_operations = _make_operations(
+                    field_.name,
+                    old_value,
+                    new_value,
+                    source_path,
+                    built_path,
+                    source_paths,
+                    built_paths,
+                    built_to_source,
+                    source_to_built,
+                )
+                operations += field_operations
+                inverse_operations += field_inverse_operations
+        self.patch = Patch(tuple(operations))
+        self.inverse_patch = Patch(tuple(inverse_operations))
+        return self.patch
+
+
+def _make_operations(
+    attribute,
+    old_value,
+    new_value,
+    source_path,
+    built_path,
+    source_paths,
+    built_paths,
+    built_to_source,
+    source_to_built,
+):
+    # Returns the operations changing an attribute from its old value to its
+    # new value, and their inverse operations. Tuples are changed by splices
+    # and frozensets by updates, so that operations only hold the elements
+    # that changed
+    value_type = type(new_value)
+    if value_type is tuple and type(old_value) is tuple:
+        operations = []
+        inverse_operations = []
+        matcher = difflib.SequenceMatcher(
+            None,
+            [_get_element_key(element, {}) for element in old_value],
+            [_get_element_key(element, built_to_source) for element in new_value],
+            autojunk=False,
+        )
+        for tag, old_start, old_stop, new_start, new_stop in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            old_elements = old_value[old_start:old_stop]
+            new_elements = new_value[new_start:new_stop]
+            operations.append(
+                Operation(
+                    path=source_path,
+                    attribute=attribute,
+                    old_value=_make_references(old_elements, source_paths, {}),
+                    new_value=_make_references(
+                        new_elements, source_paths, built_to_source
+                    ),
+                    kind=OperationKind.SPLICE,
+                    index=old_start,
+                )
+            )
+            inverse_operations.append(
+                Operation(
+                    path=built_path,
+                    attribute=attribute,
+                    old_value=_make_references(new_elements, built_paths, {}),
+                    new_value=_make_references(
+                        old_elements, built_paths, source_to_built
+                    ),
+                    kind=OperationKind.SPLICE,
+                    index=new_start,
+                )
+            )
+        return operations, inverse_operations
+    if value_type is frozenset and type(old_value) is frozenset:
+        old_keys = {_get_element_key(element, {}) for element in old_value}
+        new_keys = {_get_element_key(element, built_to_source) for element in new_value}
+        removed_elements = frozenset(
+            element
+            for element in old_value
+            if _get_element_key(element, {}) not in new_keys
+        )
+        added_elements = frozenset(
+            element
+            for element in new_value
+            if _get_element_key(element, built_to_source) not in old_keys
+        )
+        operation = Operation(
+            path=source_path,
+            attribute=attribute,
+            old_value=_make_references(removed_elements, source_paths, {}),
+            new_value=_make_references(added_elements, source_paths, built_to_source),
+            kind=OperationKind.UPDATE,
+        )
+        inverse_operation = Operation(
+            path=built_path,
+            attribute=attribute,
+            old_value=_make_references(added_elements, built_paths, {}),
+            new_value=_make_references(removed_elements, built_paths, source_to_built),
+            kind=OperationKind.UPDATE,
+        )
+        # Removed elements are looked up in the builder of the object, where
+        # only references and scalars can be found
+        if _are_referenced(operation.old_value) and _are_referenced(
+            inverse_operation.old_value
+        ):
+            return [operation], [inverse_operation]
+    operation = Operation(
+        path=source_path,
+        attribute=attribute,
+        old_value=_make_references(old_value, source_paths, {}),
+        new_value=_make_references(new_value, source_paths, built_to_source),
+    )
+    inverse_operation = Operation(
+        path=built_path,
+        attribute=attribute,
+        old_value=_make_references(new_value, built_paths, {}),
+        new_value=_make_references(old_value, built_paths, source_to_built),
+    )
+    return [operation], [inverse_operation]
+
+
+def _get_element_key(element, obj_to_source):
+    # Elements of tuples and frozensets are matched by identity, up to the
+    # edited elements, and scalars by value
+    if type(element) in momapy.builder._scalar_types or element is None:
+        return (type(element), element)
+    return id(obj_to_source.get(id(element), element))
+
+
+def _are_referenced(elements):
+    return all(
+        isinstance(element, Reference)
+        or type(element) in momapy.builder._scalar_types
+        or element is None
+        for element in elements
+    )
+
+
+def _has_old_value(value, operation, old_value):
+    if operation.kind is OperationKind.SPLICE:
+        return (
+            operation.index <= len(value)
+            and tuple(value[operation.index : operation.index + len(old_value)])
+            == old_value
+        )
+    if operation.kind is OperationKind.UPDATE:
+        return old_value <= value
+    return value == old_value
+
+
+def _get_paths(obj):
+    # Returns the shortest paths from the object to the dataclass objects it
+    # contains, by id. Elements of frozensets are only reachable by their id
+    # if it is unique in the frozenset.
+    paths = {}
+    queue = collections.deque([(obj, ())])
+    while queue:
+        obj, path = queue.popleft()
+        obj_type = type(obj)
+        if obj_type is tuple:
+            queue.extend(
+                (element, path + (index,)) for index, element in enumerate(obj)
+            )
+        elif obj_type is frozenset:
+            counts = collections.Counter(
+                element.id_
+                for element in obj
+                if isinstance(element, momapy.core.elements.MapElement)
+            )
+            queue.extend(
+                (element, path + (Member(element.id_),))
+                for element in obj
+                if isinstance(element, momapy.core.elements.MapElement)
+                and counts[element.id_] == 1
+            )
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            if id(obj) in paths:
+                continue
+            paths[id(obj)] = path
+            queue.extend(
+                (getattr(obj, field_.name), path + (field_.name,))
+                for field_ in dataclasses.fields(obj)
+            )
+    return paths
+
+
+def _get_at_path(obj, path):
+    # Works both on objects and on their builders
+    for step in path:
+        if isinstance(step, Member):
+            for element in obj:
+                if element.id_ == step.id_:
+                    obj = element
+                    break
+            else:
+                raise ValueError(f"no element with id '{step.id_}' at path {path}")
+        elif isinstance(step, int):
+            obj = obj[step]
+        else:
+            obj = getattr(obj, step)
+    return obj
+
+
+def _is_unchanged(value, old_value, built_to_source):
+    # Whether a built value is the old value up to the elements it
+    # references, which are recorded by their own operations
+    if built_to_source.get(id(value), value) is old_value:
+        return True
+    value_type = type(value)
+    if value_type is not type(old_value):
+        return False
+    if value_type is tuple:
+        return len(value) == len(old_value) and all(
+            _is_unchanged(element, old_element, built_to_source)
+            for element, old_element in zip(value, old_value)
+        )
+    if value_type is frozenset:
+        return {id(built_to_source.get(id(element), element)) for element in value} == {
+            id(element) for element in old_value
+        }
+    if isinstance(value, collections.abc.Mapping):
+        if len(value) != len(old_value):
+            return False
+        if not all(
+            _is_unchanged(key, old_key, built_to_source)
+            and _is_unchanged(element, old_element, built_to_source)
+            for (key, element), (old_key, old_element) in zip(
+                value.items(), old_value.items()
+            )
+        ):
+            return False
+        if hasattr(value, "_singleton_to_key"):
+            return _is_unchanged(
+                value._singleton_to_key, old_value._singleton_to_key, built_to_source
+            )
+        return True
+    if value_type in momapy.builder._scalar_types:
+        return value == old_value
+    return False
+
+
+def _make_references(value, paths, obj_to_source):
+    # Replaces the map elements that have a path by references
+    if isinstance(value, momapy.core.elements.MapElement):
+        path = paths.get(id(obj_to_source.get(id(value), value)))
+        if path is not None:
+            return Reference(path)
+    return _map_value(
+        value, lambda element: _make_references(element, paths, obj_to_source)
+    )
+
+
+def _resolve_references(value, resolve, to_builder=False):
+    # Replaces references by the elements they resolve to. If `to_builder`
+    # is True, the values containing references are converted to builders
+    if isinstance(value, Reference):
+        return resolve(value.path)
+    return _map_value(
+        value,
+        lambda element: _resolve_references(element, resolve, to_builder),
+        to_builder,
+    )
+
+
+def _map_value(value, func, to_builder=False):
+    # Applies `func` to the parts of a value, and returns the value itself if
+    # no part changed, or a copy of the value with the new parts otherwise
+    value_type = type(value)
+    if value_type is tuple or value_type is frozenset:
+        elements = [func(element) for element in value]
+        if all(element is old_element for element, old_element in zip(elements, value)):
+            return value
+        if to_builder:
+            return momapy.builder._immutable_collection_to_builder[value_type](elements)
+        return value_type(elements)
+    if isinstance(value, collections.abc.Mapping):
+        items = [(func(key), func(element)) for key, element in value.items()]
+        singleton_to_key_items = None
+        is_unchanged = all(
+            key is old_key and element is old_element
+            for (key, element), (old_key, old_element) in zip(items, value.items())
+        )
+        if hasattr(value, "_singleton_to_key"):
+            singleton_to_key_items = [
+                (func(singleton), func(key))
+                for singleton, key in value._singleton_to_key.items()
+            ]
+            is_unchanged = is_unchanged and all(
+                singleton is old_singleton and key is old_key
+                for (singleton, key), (old_singleton, old_key) in zip(
+                    singleton_to_key_items, value._singleton_to_key.items()
+                )
+            )
+        if is_unchanged:
+            return value
+        if to_builder:
+            builder_cls = momapy.builder._immutable_collection_to_builder.get(
+                value_type
+            )
+            if builder_cls is None:
+                builder_cls = momapy.builder.get_or_make_builder_cls(value_type)
+            new_value = builder_cls(items)
+            if singleton_to_key_items is not None:
+                for singleton, key in singleton_to_key_items:
+                    new_value._singleton_to_key[singleton] = key
+            return new_value
+        new_value = value_type(items)
+        if singleton_to_key_items is not None:
+            object.__setattr__(
+                new_value,
+                "_singleton_to_key",
+                type(value._singleton_to_key)(singleton_to_key_items),
+            )
+        return new_value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        changes = {}
+        for field_ in dataclasses.fields(value):
+            attr_value = getattr(value, field_.name)
+            new_attr_value = func(attr_value)
+            if new_attr_value is not attr_value:
+                changes[field_.name] = new_attr_value
+        if not changes:
+            return value
+        if to_builder:
+            builder = momapy.builder.builder_from_object(value, lazy=True)
+            for attr_name, attr_value in changes.items():
+                setattr(builder, attr_name, attr_value)
+            return builder
+        return dataclasses.replace(value, **changes)
+    return value
+
+
+def _get_qualified_name(cls):
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+_ALLOWED_CLASSES: dict[str, type] = {
+    _get_qualified_name(frozendict.frozendict): frozendict.frozendict,
+}
+
+
+def _get_cls(qualified_name):
+    # Only the classes defined in momapy and those of the allowlist are
+    # resolved, so that decoding a patch cannot import other modules nor
+    # make objects of other classes
+    cls = _ALLOWED_CLASSES.get(qualified_name)
+    if cls is not None:
+        return cls
+    module_name, _, qualname = qualified_name.partition(":")
+    if module_name != "momapy" and not module_name.startswith("momapy."):
+        raise ValueError(f"class {qualified_name} is not allowed in patches")
+    try:
+        cls = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            cls = getattr(cls, name)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"could not find class {qualified_name}") from error
+    if not isinstance(cls, type) or _get_qualified_name(cls) != qualified_name:
+        raise ValueError(f"class {qualified_name} is not allowed in patches")
+    return cls
+
+
+def _encode_path(path):
+    return [{"member": step.id_} if isinstance(step, Member) else step for step in path]
+
+
+def _decode_path(path):
+    return tuple(
+        Member(step["member"]) if isinstance(step, dict) else step for step in path
+    )
+
+
+def _encode_value(value):
+    if isinstance(value, enum.Enum):
+        return {"enum": _get_qualified_name(type(value)), "name": value.name}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Reference):
+        return {"reference": _encode_path(value.path)}
+    if isinstance(value, momapy.drawing.NoneValueType):
+        return {"none_value": True}
+    value_type = type(value)
+    if value_type is tuple:
+        return {"tuple": [_encode_value(element) for element in value]}
+    if value_type is frozenset:
+        return {"frozenset": [_encode_value(element) for element in value]}
+    if isinstance(value, collections.abc.Mapping):
+        encoded_value = {
+            "mapping": _get_qualified_name(value_type),
+            "items": [
+                [_encode_value(key), _encode_value(element)]
+                for key, element in value.items()
+            ],
+        }
+        if hasattr(value, "_singleton_to_key"):
+            encoded_value["singleton_to_key"] = [
+                [_encode_value(singleton), _encode_value(key)]
+                for singleton, key in value._singleton_to_key.items()
+            ]
+        return encoded_value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "dataclass": _get_qualified_name(value_type),
+            "fields": {
+                field_.name: _encode_value(getattr(value, field_.name))
+                for field_ in dataclasses.fields(value)
+                if field_.init
+            },
+        }
+    raise TypeError(f"cannot encode value of type {value_type.__name__}")
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    if "reference" in value:
+        return Reference(_decode_path(value["reference"]))
+    if "none_value" in value:
+        return momapy.drawing.NoneValue
+    if "tuple" in value:
+        return tuple(_decode_value(element) for element in value["tuple"])
+    if "frozenset" in value:
+        return frozenset(_decode_value(element) for element in value["frozenset"])
+    if "enum" in value:
+        cls = _get_cls(value["enum"])
+        if not (isinstance(cls, type) and issubclass(cls, enum.Enum)):
+            raise ValueError(f"{value['enum']} is not an enum")
+        return cls[value["name"]]
+    if "mapping" in value:
+        cls = _get_cls(value["mapping"])
+        if not (isinstance(cls, type) and issubclass(cls, collections.abc.Mapping)):
+            raise ValueError(f"{value['mapping']} is not a mapping")
+        mapping = cls(
+            [
+                (_decode_value(key), _decode_value(element))
+                for key, element in value["items"]
+            ]
+        )
+        if "singleton_to_key" in value:
+            object.__setattr__(
+                mapping,
+                "_singleton_to_key",
+                type(mapping._singleton_to_key)(
+                    [
+                        (_decode_value(singleton), _decode_value(key))
+                        for singleton, key in value["singleton_to_key"]
+                    ]
+                ),
+            )
+        return mapping
+    if "dataclass" in value:
+        cls = _get_cls(value["dataclass"])
+        if not dataclasses.is_dataclass(cls):
+            raise ValueError(f"{value['dataclass']} is not a dataclass")
+        return cls(
+            **{
+                name: _decode_value(field_value)
+                for name, field_value in value["fields"].items()
+            }
+        )
+    raise ValueError(f"cannot decode value {value}")
@@ -114,7 +114,7 @@ class SurjectionDict(dict):
         variants); each bucket is a ``frozenset`` of forward keys. This is a
         fresh **snapshot** built on each access from the internally
         maintained index, so it is safe to read while the mapping is
-        mutated.
+        mutated. Use ``keys_for_value`` to look up a single value.
 
         Returns:
             A ``frozendict`` mapping each value (or ``id(value)``) to the
@@ -122,6 +122,21 @@ class SurjectionDict(dict):
         """
         return _freeze_inverse(self._inverse)
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by equality).
+
+        Unlike ``inverse``, which snapshots the whole index, only the
+        bucket of ``value`` is copied, so the lookup does not depend on
+        the size of the mapping.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return frozenset(self._inverse.get(value, ()))
+
 
 class IdentitySurjectionDict(dict):
     """A mutable dict with an identity-keyed value->keys inverse.
@@ -181,7 +196,7 @@ class IdentitySurjectionDict(dict):
         variants); each bucket is a ``frozenset`` of forward keys. This is a
         fresh **snapshot** built on each access from the internally
         maintained index, so it is safe to read while the mapping is
-        mutated.
+        mutated. Use ``keys_for_value`` to look up a single value.
 
         Returns:
             A ``frozendict`` mapping each value (or ``id(value)``) to the
@@ -189,6 +204,21 @@ class IdentitySurjectionDict(dict):
         """
         return _freeze_inverse(self._identity_inverse)
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by identity).
+
+        Unlike ``inverse``, which snapshots the whole index, only the
+        bucket of ``value`` is copied, so the lookup does not depend on
+        the size of the mapping.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return frozenset(self._identity_inverse.get(id(value), ()))
+
 
 class IdentityMultiDict(collections.abc.Mapping):
     """A mutable, identity-keyed multidict for n-to-m ``str`` -> object maps.
@@ -313,7 +343,7 @@ class IdentityMultiDict(collections.abc.Mapping):
         variants); each bucket is a ``frozenset`` of forward keys. This is a
         fresh **snapshot** built on each access from the internally
         maintained index, so it is safe to read while the mapping is
-        mutated.
+        mutated. Use ``keys_for_value`` to look up a single value.
 
         Returns:
             A ``frozendict`` mapping each value (or ``id(value)``) to the
@@ -321,6 +351,21 @@ class IdentityMultiDict(collections.abc.Mapping):
         """
         return _freeze_inverse(self._inverse)
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by identity).
+
+        Unlike ``inverse``, which snapshots the whole index, only the
+        bucket of ``value`` is copied, so the lookup does not depend on
+        the size of the mapping.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return frozenset(self._inverse.get(id(value), ()))
+
 
 class FrozenIdentityMultiDict(frozendict.frozendict):
     """An immutable, identity-keyed multidict.
@@ -376,6 +421,19 @@ class FrozenIdentityMultiDict(frozendict.frozendict):
         """
         return self._identity_inverse
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by identity).
+
+        Unlike ``inverse``, only the bucket of ``value`` is read.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return self._identity_inverse.get(id(value), frozenset())
+
 
 class FrozenSurjectionDict(frozendict.frozendict):
     """An immutable, equality-keyed surjection with a value->keys inverse.
@@ -411,6 +469,19 @@ class FrozenSurjectionDict(frozendict.frozendict):
         """
         return self._inverse
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by equality).
+
+        Unlike ``inverse``, only the bucket of ``value`` is read.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return self._inverse.get(value, frozenset())
+
 
 class FrozenIdentitySurjectionDict(frozendict.frozendict):
     """An immutable dict with an identity-keyed value->keys inverse.
@@ -453,6 +524,19 @@ class FrozenIdentitySurjectionDict(frozendict.frozendict):
         """
         return self._identity_inverse
 
+    def keys_for_value(self, value) -> frozenset:
+        """Return the keys that map to ``value`` (by identity).
+
+        Unlike ``inverse``, only the bucket of ``value`` is read.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The ``frozenset`` of keys mapped to ``value``, empty if none.
+        """
+        return self._identity_inverse.get(id(value), frozenset())
+
 
 def pretty_print(obj, max_depth=0, exclude_cls=None, _depth=0, _indent=0):
     """Pretty print a dataclass or iterable object with colors.
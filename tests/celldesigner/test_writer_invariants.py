@@ -113,10 +113,15 @@ class TestStaleMappingSurvivesWriting:
             new_map.layout_model_mapping.get_mapping(target_layout).id_
             == "STALE_ALTERNATE_ID"
         )
-        # Identity-keyed inverse: target_subunit's identity is not in
-        # the mapping; only stale_subunit's is.
+        # Identity-keyed inverse: target_layout is recorded under
+        # stale_subunit's identity, not under target_subunit's, which
+        # building keeps for the unchanged model.
         mapping = new_map.layout_model_mapping
-        assert mapping.inverse.get(id(target_subunit)) is None
+        assert target_layout in mapping.inverse.get(id(stale_subunit), ())
+        assert all(
+            key is not target_layout
+            for key in mapping.inverse.get(id(target_subunit), ())
+        )
         out_file = tmp_path / "stale.xml"
         momapy.io.core.write(new_map, out_file, writer="celldesigner")
         tree = lxml.etree.parse(str(out_file))
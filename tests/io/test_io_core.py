@@ -1,5 +1,9 @@
 """Tests for momapy.io.core module."""
 
+import os
+
+import pytest
+
 import momapy.io
 import momapy.io.core
 
@@ -88,3 +92,73 @@ def test_write_function_exists():
     """Test that write function exists."""
     assert hasattr(momapy.io.core, "write")
     assert callable(momapy.io.core.write)
+
+
+CELLDESIGNER_MAP_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "celldesigner",
+    "maps",
+    "Apoptosis_pathway.xml",
+)
+
+
+def test_read_file_header():
+    """Test that read_file_header finds the root element and namespaces."""
+    header = momapy.io.core.read_file_header(CELLDESIGNER_MAP_PATH)
+    assert header.root_tag.endswith("}sbml")
+    assert "http://www.sbml.org/2001/ns/celldesigner" in header.namespaces
+    assert len(header.data) <= momapy.io.core.HEADER_SIZE
+    header = momapy.io.core.read_file_header(CELLDESIGNER_MAP_PATH, size=10)
+    assert header.data.startswith(b"<?xml")
+    assert header.root_tag is None
+
+
+def test_file_signature_matches():
+    """Test FileSignature.matches."""
+    header = momapy.io.core.read_file_header(CELLDESIGNER_MAP_PATH)
+    assert momapy.io.core.FileSignature(root_name="sbml").matches(header)
+    assert momapy.io.core.FileSignature(
+        root_name="sbml", namespace="http://www.sbml.org/2001/ns/celldesigner"
+    ).matches(header)
+    assert not momapy.io.core.FileSignature(
+        namespace="http://sbgn.org/libsbgn/0.3"
+    ).matches(header)
+    assert not momapy.io.core.FileSignature(magic=b"\x80").matches(header)
+
+
+def test_read_does_not_import_unmatched_readers():
+    """Test that format detection does not import readers that do not match."""
+    momapy.io.register_lazy_reader(
+        "0_test_reader",
+        "momapy.nonexistent_module:Reader",
+        momapy.io.core.FileSignature(namespace="http://example.org/nonexistent"),
+    )
+    try:
+        result = momapy.io.core.read(CELLDESIGNER_MAP_PATH, return_type="model")
+        assert result.obj is not None
+    finally:
+        del momapy.io.reader_registry._lazy_plugins["0_test_reader"]
+        del momapy.io.core.reader_signatures["0_test_reader"]
+
+
+def test_read_missing_file_raises_value_error(tmp_path):
+    """Test that read raises ValueError when no reader can read the file."""
+    with pytest.raises(ValueError, match="could not find a suitable"):
+        momapy.io.core.read(tmp_path / "missing.xml")
+
+
+def test_registered_signatures_are_those_of_readers():
+    """Test that the lazy readers are registered with the reader signatures."""
+    for name in ["sbgnml-0.2", "sbgnml-0.3", "celldesigner", "sbml", "pickle"]:
+        assert (
+            momapy.io.core.reader_signatures[name]
+            is momapy.io.get_reader(name).signature
+        )
+
+
+def test_infer_writer():
+    """Test that infer_writer returns the writer of the map type."""
+    map_ = momapy.io.core.read(CELLDESIGNER_MAP_PATH).obj
+    assert momapy.io.core.infer_writer(map_) == "celldesigner"
+    with pytest.raises(ValueError):
+        momapy.io.core.infer_writer(map_.model)
@@ -0,0 +1,80 @@
+"""Tests for model element registration in momapy.io.utils."""
+
+import dataclasses
+
+import momapy.io.utils
+import momapy.sbgn.pd
+
+
+def _make_macromolecule(id_, state_variable_id="sv"):
+    state_variable = momapy.sbgn.pd.StateVariable(
+        id_=state_variable_id, variable="P", value="p"
+    )
+    return momapy.sbgn.pd.Macromolecule(
+        id_=id_, label="A", state_variables=frozenset([state_variable])
+    )
+
+
+class TestInternModelElement:
+    def test_repeated_subtrees_are_shared(self):
+        reading_context = momapy.io.utils.ReadingContext()
+        macromolecule = momapy.io.utils.intern_model_element(
+            reading_context, _make_macromolecule("m1")
+        )
+        other_macromolecule = momapy.io.utils.intern_model_element(
+            reading_context, _make_macromolecule("m2")
+        )
+        assert other_macromolecule is not macromolecule
+        assert next(iter(other_macromolecule.state_variables)) is next(
+            iter(macromolecule.state_variables)
+        )
+        assert (
+            momapy.io.utils.intern_model_element(
+                reading_context, _make_macromolecule("m1")
+            )
+            is macromolecule
+        )
+
+    def test_elements_with_different_ids_are_not_merged(self):
+        reading_context = momapy.io.utils.ReadingContext()
+        macromolecule = momapy.io.utils.intern_model_element(
+            reading_context, _make_macromolecule("m1", "sv1")
+        )
+        other_macromolecule = momapy.io.utils.intern_model_element(
+            reading_context, _make_macromolecule("m2", "sv2")
+        )
+        assert next(iter(other_macromolecule.state_variables)).id_ == "sv2"
+        assert next(iter(macromolecule.state_variables)).id_ == "sv1"
+
+
+class TestRegisterModelElement:
+    def test_keeps_smallest_id_and_remaps(self):
+        reading_context = momapy.io.utils.ReadingContext()
+        collection = set()
+        macromolecule = _make_macromolecule("m2")
+        registered = momapy.io.utils.register_model_element(
+            reading_context, macromolecule, collection, "xml_m2"
+        )
+        assert registered is macromolecule
+        other_macromolecule = dataclasses.replace(macromolecule, id_="m1")
+        registered = momapy.io.utils.register_model_element(
+            reading_context, other_macromolecule, collection, "xml_m1"
+        )
+        assert registered is other_macromolecule
+        assert len(collection) == 1
+        assert next(iter(collection)) is other_macromolecule
+        assert reading_context.xml_id_to_model_element["xml_m2"] == frozenset(
+            [other_macromolecule]
+        )
+        assert (
+            momapy.io.utils.resolve_remap(macromolecule, reading_context)
+            is other_macromolecule
+        )
+        registered = momapy.io.utils.register_model_element(
+            reading_context,
+            dataclasses.replace(macromolecule, id_="m3"),
+            collection,
+            "xml_m3",
+        )
+        assert registered is other_macromolecule
+        assert len(collection) == 1
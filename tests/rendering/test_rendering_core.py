@@ -1,7 +1,22 @@
 """Tests for momapy.rendering.core module."""
 
+import json
+import os
+import pathlib
+import re
+
+import pytest
+
+import momapy.core.layout
+import momapy.io.core
 import momapy.rendering
 import momapy.rendering.core
+import momapy.sbgn.styling
+import momapy.styling
+
+SBGN_MAPS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "sbgn", "maps", "pd"
+)
 
 
 def test_renderer_registry_exists():
@@ -38,3 +53,155 @@ def test_render_layout_elements_exists():
     """Test that render_layout_elements function exists."""
     assert hasattr(momapy.rendering.core, "render_layout_elements")
     assert callable(momapy.rendering.core.render_layout_elements)
+
+
+def test_render_profiler_records_phases(sample_node, tmp_path):
+    """Test that a profiler records phases, layout and drawing elements."""
+    profiler = momapy.rendering.core.RenderProfiler()
+    momapy.rendering.core.render_layout_element(
+        sample_node,
+        tmp_path / "output.svg",
+        renderer="svg-native",
+        profiler=profiler,
+    )
+    report = profiler.get_report()
+    for phase in ["prepare", "compile", "draw", "encode"]:
+        assert phase in report["phase"]
+    assert report["layout_element"]["Rectangle"]["calls"] == 1
+    assert sum(stat["calls"] for stat in report["drawing_element"].values()) >= 1
+    assert json.loads(profiler.to_json()) == report
+    for line in profiler.to_collapsed_stacks().splitlines():
+        stack, duration = line.rsplit(" ", 1)
+        assert stack
+        assert int(duration) >= 0
+
+
+def test_render_profiler_reset():
+    """Test that resetting a profiler discards all its recorded state."""
+    profiler = momapy.rendering.core.RenderProfiler()
+    with profiler.measure("phase", "outer"), profiler.measure("phase", "inner"):
+        pass
+    profiler._frames.append("dangling")
+    profiler._children_times.append(1.0)
+    profiler.reset()
+    assert profiler.get_report() == {}
+    assert profiler.to_collapsed_stacks() == ""
+    assert profiler._frames == []
+    assert profiler._children_times == []
+
+
+def test_render_layout_element_resolves_style_at_render_time(sample_node, tmp_path):
+    """Test that a style sheet is rendered without styling the layout element."""
+    import momapy.coloring
+    import momapy.styling
+
+    style_sheet = momapy.styling.StyleSheet(
+        {
+            momapy.styling.TypeSelector(
+                class_name="Rectangle"
+            ): momapy.styling.StyleCollection({"fill": momapy.coloring.red})
+        }
+    )
+    momapy.rendering.core.render_layout_element(
+        sample_node,
+        tmp_path / "output.svg",
+        renderer="svg-native",
+        style_sheet=style_sheet,
+        to_top_left=True,
+    )
+    assert sample_node.fill != momapy.coloring.red
+    assert "rgb(255, 0, 0)" in (tmp_path / "output.svg").read_text()
+
+
+def test_render_layout_element_applies_geometry_changing_style_sheet(
+    tmp_path, monkeypatch
+):
+    """Test that arcs are rendered against the nodes resized by a style sheet."""
+    map_ = momapy.io.core.read(os.path.join(SBGN_MAPS_DIR, "simple_annotated.sbgn")).obj
+    style_sheet = momapy.styling.StyleSheet.from_string(
+        "Macromolecule { width: 200.0; height: 100.0; }"
+    )
+    assert momapy.styling.StyleResolver.from_style_sheet(style_sheet).changes_geometry()
+    styled_layout = momapy.styling.apply_style_sheet(map_.layout, style_sheet)
+    # The layout is styled before being rendered, not at render time
+    renderer_cls = momapy.rendering.core.get_renderer("svg-native")
+
+    def _render_styled_layout_element(self, layout_element, style_resolver):
+        raise AssertionError("the style sheet was resolved at render time")
+
+    monkeypatch.setattr(
+        renderer_cls, "render_styled_layout_element", _render_styled_layout_element
+    )
+    svgs = []
+    for layout, layout_style_sheet in [
+        (map_.layout, style_sheet),
+        (styled_layout, None),
+    ]:
+        output_file_path = tmp_path / "output.svg"
+        momapy.rendering.core.render_layout_element(
+            layout,
+            output_file_path,
+            renderer="svg-native",
+            style_sheet=layout_style_sheet,
+        )
+        svgs.append(re.sub(r'id="[^"]*"', "", output_file_path.read_text()))
+    assert svgs[0] == svgs[1]
+    for layout_element in styled_layout.layout_elements:
+        if isinstance(layout_element, momapy.core.layout.Arc):
+            for point in (layout_element.start_point(), layout_element.end_point()):
+                assert f"{point.x} {point.y}" in svgs[0]
+
+
+def test_style_resolver_changes_geometry():
+    """Test that only non-presentation attributes change the geometry."""
+    style_sheet = momapy.styling.StyleSheet.from_string(
+        "Macromolecule { fill: red; stroke_width: 2.0; }"
+    )
+    style_resolver = momapy.styling.StyleResolver.from_style_sheet(style_sheet)
+    assert not style_resolver.changes_geometry()
+    style_resolver = momapy.styling.StyleResolver.from_style_sheet(
+        style_sheet, overrides={"glyph1": {"width": 10.0}}
+    )
+    assert style_resolver.changes_geometry()
+
+
+def test_render_profiler_attaches_to_instance_only(tmp_path):
+    """Test that enabling profiling does not instrument other renderers."""
+    renderer_cls = momapy.rendering.core.get_renderer("svg-native")
+    renderer = renderer_cls.from_file(tmp_path / "a.svg", 10, 10, "svg")
+    other_renderer = renderer_cls.from_file(tmp_path / "b.svg", 10, 10, "svg")
+    profiler = renderer.enable_profiling()
+    assert isinstance(profiler, momapy.rendering.core.RenderProfiler)
+    assert "render_drawing_element" in vars(renderer)
+    assert "render_drawing_element" not in vars(other_renderer)
+
+
+@pytest.mark.parametrize("preset_name", ["newt", "sbgned"])
+def test_render_with_preset_applies_all_imports(preset_name, tmp_path):
+    """Test the bundled presets render with all the style sheets they import."""
+    map_ = momapy.io.core.read(
+        os.path.join(SBGN_MAPS_DIR, "neuronal_muscle_signalling.sbgn")
+    ).obj
+    styling_dir = pathlib.Path(momapy.sbgn.styling.__file__).parent
+    no_color_scheme = momapy.styling.StyleSheet.from_file(
+        styling_dir / f"{preset_name}_no_cs.css"
+    )
+    svgs = []
+    for style_sheet in (
+        getattr(momapy.sbgn.styling, preset_name),
+        momapy.styling.combine_style_sheets(
+            [no_color_scheme, momapy.sbgn.styling.cs_black_and_white]
+        ),
+        no_color_scheme,
+    ):
+        output_file_path = tmp_path / "output.svg"
+        momapy.rendering.core.render_layout_element(
+            momapy.styling.apply_style_sheet(map_.layout, style_sheet),
+            output_file_path,
+            format_="svg",
+            renderer="svg-native",
+        )
+        # Ids of layout elements made while rendering are random
+        svgs.append(re.sub(r'id="[^"]*"', "", output_file_path.read_text()))
+    assert svgs[0] == svgs[1]
+    assert svgs[0] != svgs[2]
@@ -43,3 +43,163 @@ class TestSkiaRendering:
         )
         assert os.path.exists(output_file)
         assert os.path.getsize(output_file) > 0
+
+
+def _make_skia_renderer(width=100, height=100, batch_filters=False):
+    skia = pytest.importorskip("skia")
+    import momapy.rendering.skia
+
+    surface = skia.Surface(width, height)
+    renderer = momapy.rendering.skia.SkiaRenderer(
+        canvas=surface.getCanvas(), batch_filters=batch_filters
+    )
+    return renderer, surface
+
+
+def _make_rectangle(x, y, filter_=None, transform=None):
+    import momapy.coloring
+    import momapy.drawing
+    import momapy.geometry
+
+    return momapy.drawing.Rectangle(
+        point=momapy.geometry.Point(x, y),
+        width=5.0,
+        height=5.0,
+        rx=0.0,
+        ry=0.0,
+        fill=momapy.coloring.blue,
+        filter=filter_ if filter_ is not None else momapy.drawing.NoneValue,
+        transform=transform if transform is not None else momapy.drawing.NoneValue,
+    )
+
+
+def _make_drop_shadow_filter(dx=0.0, **kwargs):
+    import momapy.coloring
+    import momapy.drawing
+
+    return momapy.drawing.Filter(
+        effects=(
+            momapy.drawing.DropShadowEffect(
+                dx=dx, flood_color=momapy.coloring.red, flood_opacity=1.0
+            ),
+        ),
+        **kwargs,
+    )
+
+
+def test_skia_filter_paint_is_cached_by_filter_and_size():
+    """Test that the paint of a filter is reused for regions of the same size."""
+    import momapy.geometry
+
+    renderer, _ = _make_skia_renderer()
+    filter_ = _make_drop_shadow_filter()
+    skia_paint = renderer._get_or_make_filter_paint(
+        filter_, momapy.geometry.Bbox(momapy.geometry.Point(10.2, 10.7), 20.0, 10.0)
+    )
+    assert (
+        renderer._get_or_make_filter_paint(
+            filter_,
+            momapy.geometry.Bbox(momapy.geometry.Point(60.0, 45.3), 20.0, 10.0),
+        )
+        is skia_paint
+    )
+    assert list(renderer._skia_filters) == [(filter_, 20.0, 10.0)]
+    # Regions whose sizes only differ by less than a unit do not share
+    # their paint
+    assert (
+        renderer._get_or_make_filter_paint(
+            filter_,
+            momapy.geometry.Bbox(momapy.geometry.Point(10.0, 10.0), 20.2, 9.8),
+        )
+        is not skia_paint
+    )
+    assert len(renderer._skia_filters) == 2
+
+
+def test_skia_batch_filters_groups_consecutive_elements_in_order():
+    """Test that only consecutive untransformed siblings are batched."""
+    import momapy.drawing
+    import momapy.geometry
+
+    renderer, _ = _make_skia_renderer(batch_filters=True)
+    filter_ = _make_drop_shadow_filter()
+    other_filter = _make_drop_shadow_filter(dx=1.0)
+    elements = (
+        _make_rectangle(0.0, 0.0, filter_),
+        _make_rectangle(10.0, 0.0, filter_),
+        _make_rectangle(20.0, 0.0),
+        _make_rectangle(30.0, 0.0, filter_),
+        _make_rectangle(40.0, 0.0, other_filter),
+        _make_rectangle(50.0, 0.0, other_filter),
+        _make_rectangle(
+            60.0,
+            0.0,
+            other_filter,
+            transform=(momapy.geometry.Translation(1.0, 0.0),),
+        ),
+    )
+    calls = []
+    renderer.render_drawing_element = lambda drawing_element: calls.append(
+        ("single", elements.index(drawing_element))
+    )
+    renderer._render_drawing_elements_with_filter = (
+        lambda drawing_elements, batch_filter: calls.append(
+            (
+                "batch",
+                [elements.index(element) for element in drawing_elements],
+                batch_filter is filter_,
+            )
+        )
+    )
+    renderer._render_group(momapy.drawing.Group(elements=elements))
+    assert calls == [
+        ("batch", [0, 1], True),
+        ("single", 2),
+        ("single", 3),
+        ("batch", [4, 5], False),
+        ("single", 6),
+    ]
+
+
+def test_skia_filter_is_cropped_to_translated_filter_region():
+    """Test that a filter is cropped to its region at the element position."""
+    import momapy.drawing
+
+    renderer, surface = _make_skia_renderer()
+    # The filter region is (20, 30, 20, 10); the shadow of the rectangle
+    # spans x in [37, 42] and is cropped at x = 40
+    filter_ = _make_drop_shadow_filter(
+        dx=12.0,
+        filter_units=momapy.drawing.FilterUnits.USER_SPACE_ON_USE,
+        x=20.0,
+        y=30.0,
+        width=20.0,
+        height=10.0,
+    )
+    renderer.render_drawing_element(_make_rectangle(25.0, 32.0, filter_))
+    pixels = surface.makeImageSnapshot().toarray()
+    assert pixels[34, 27][3] == 255
+    assert pixels[34, 38][3] == 255
+    assert pixels[34, 39][3] == 255
+    assert pixels[34, 40][3] == 0
+    assert pixels[34, 19][3] == 0
+
+
+def test_skia_filter_is_not_clipped_inside_fractional_filter_region():
+    """Test that a filter is not cropped short of a fractional region."""
+    import momapy.drawing
+
+    renderer, surface = _make_skia_renderer()
+    # The filter region is (20, 30, 20.4, 10); its east edge is at x = 40.4
+    filter_ = _make_drop_shadow_filter(
+        dx=12.0,
+        filter_units=momapy.drawing.FilterUnits.USER_SPACE_ON_USE,
+        x=20.0,
+        y=30.0,
+        width=20.4,
+        height=10.0,
+    )
+    renderer.render_drawing_element(_make_rectangle(25.0, 32.0, filter_))
+    pixels = surface.makeImageSnapshot().toarray()
+    assert pixels[34, 40][3] == 255
+    assert pixels[34, 41][3] == 0
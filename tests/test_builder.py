@@ -1,6 +1,8 @@
 """Tests for momapy.builder module."""
 
 import dataclasses
+import typing
+
 import momapy.builder
 
 
@@ -12,6 +14,29 @@ class SimpleClass:
     name: str
 
 
+@dataclasses.dataclass(frozen=True)
+class Node:
+    """Dataclass with a defaulted field for testing lazy builders."""
+
+    name: str
+    size: float = 1.0
+
+
+@dataclasses.dataclass(frozen=True)
+class Edge:
+    """Dataclass referencing another dataclass for testing lazy builders."""
+
+    target: Node
+
+
+@dataclasses.dataclass(frozen=True)
+class Graph:
+    """Dataclass with shared references for testing lazy builders."""
+
+    nodes: tuple[Node, ...]
+    edges: tuple[Edge, ...]
+
+
 def test_isinstance_or_builder():
     """Test isinstance_or_builder function."""
     obj = SimpleClass(42, "test")
@@ -76,3 +101,119 @@ def test_object_from_builder_function():
 def test_builder_registry():
     """Test that builders dictionary exists."""
     assert isinstance(momapy.builder.builders, dict)
+
+
+def test_lazy_builder_materializes_fields_on_access():
+    """Test that lazy builders convert fields on first access only."""
+    node = Node("a", 2.0)
+    graph = Graph(nodes=(node,), edges=(Edge(node),))
+    builder = momapy.builder.builder_from_object(graph, lazy=True)
+    assert "nodes" not in vars(builder)
+    assert momapy.builder.object_from_builder(builder) is graph
+    node_builder = builder.nodes[0]
+    assert isinstance(node_builder, momapy.builder.Builder)
+    assert node_builder.size == 2.0
+    assert "edges" not in vars(builder)
+
+
+def test_lazy_builder_builds_shared_references_once():
+    """Test that an edit reaches references that were never accessed."""
+    node = Node("a")
+    other_node = Node("b")
+    graph = Graph(nodes=(node, other_node), edges=(Edge(node), Edge(other_node)))
+    builder = momapy.builder.builder_from_object(graph, lazy=True)
+    builder.nodes[0].size = 3.0
+    new_graph = momapy.builder.object_from_builder(builder)
+    assert new_graph.nodes[0].size == 3.0
+    assert new_graph.edges[0].target is new_graph.nodes[0]
+    assert new_graph.edges[1] is graph.edges[1]
+    assert new_graph.nodes[1] is other_node
+
+
+def test_builder_reuses_unchanged_objects():
+    """Test that building an unchanged builder returns the original object."""
+    node = Node("a")
+    other_node = Node("b")
+    graph = Graph(nodes=(node, other_node), edges=(Edge(node),))
+    builder = momapy.builder.builder_from_object(graph)
+    assert momapy.builder.object_from_builder(builder) is graph
+    builder.nodes[0].size = 3.0
+    new_graph = momapy.builder.object_from_builder(builder)
+    assert new_graph is not graph
+    assert new_graph.nodes[0].size == 3.0
+    assert new_graph.nodes[1] is other_node
+    assert new_graph.edges[0].target is new_graph.nodes[0]
+
+
+def test_builder_copy_does_not_copy_source():
+    """Test that copies of builders made from objects drop the objects."""
+    import copy
+
+    node = Node("a", 2.0)
+    graph = Graph(nodes=(node,), edges=(Edge(node),))
+    for lazy in (False, True):
+        builder = momapy.builder.builder_from_object(graph, lazy=lazy)
+        builder_copy = copy.deepcopy(builder)
+        assert "_source" in vars(builder)
+        assert "_source" not in vars(builder_copy)
+        assert "_source" not in vars(builder_copy.nodes[0])
+        assert builder_copy.edges[0].target is builder_copy.nodes[0]
+        new_graph = momapy.builder.object_from_builder(builder_copy)
+        assert new_graph == graph
+        assert new_graph is not graph
+        assert momapy.builder.object_from_builder(builder) is graph
+
+
+def test_builder_is_dirty_after_set():
+    """Test that setting a field to an equal value still builds a new object."""
+    node = Node("a", 2.0)
+    builder = momapy.builder.builder_from_object(node)
+    builder.size = 2.0
+    new_node = momapy.builder.object_from_builder(builder)
+    assert new_node == node
+    assert new_node is not node
+
+
+def test_builder_set_triggers_set_event():
+    """Test that setting a field of a builder triggers the set callbacks."""
+    import momapy.monitoring
+
+    builder = momapy.builder.builder_from_object(Node("a", 2.0))
+    attr_names = []
+    momapy.monitoring.on_set(
+        builder, lambda event: attr_names.append(event.attr_name), "size"
+    )
+    builder.size = 3.0
+    assert attr_names == ["size"]
+    assert builder.size == 3.0
+
+
+def test_builder_cls_field_types_are_builder_classes_of_field_types():
+    """Test that field types of same name resolve to their own builder classes."""
+
+    def _make_leaf_cls(module):
+        @dataclasses.dataclass(frozen=True)
+        class Leaf:
+            name: str = "leaf"
+
+        Leaf.__module__ = module
+        return Leaf
+
+    leaf_cls = _make_leaf_cls("first")
+    other_leaf_cls = _make_leaf_cls("second")
+
+    @dataclasses.dataclass(frozen=True)
+    class Tree:
+        leaf: leaf_cls
+        other_leaf: other_leaf_cls
+
+    tree_builder_cls = momapy.builder.get_or_make_builder_cls(Tree)
+    field_types = {
+        field_.name: typing.get_args(field_.type)
+        for field_ in dataclasses.fields(tree_builder_cls)
+    }
+    assert momapy.builder.get_builder_cls(leaf_cls) in field_types["leaf"]
+    assert momapy.builder.get_builder_cls(other_leaf_cls) in field_types["other_leaf"]
+    assert momapy.builder.get_builder_cls(
+        leaf_cls
+    ) is not momapy.builder.get_builder_cls(other_leaf_cls)
@@ -211,3 +211,20 @@ class TestCLIMainEntryPoint:
         """Test that CLI module has a run function."""
         assert hasattr(momapy.cli, "run")
         assert callable(momapy.cli.run)
+
+
+class TestCLIServeCommand:
+    """Tests for CLI serve command."""
+
+    def test_serve_passes_cache_sizes(self):
+        """Test that serve passes the cache sizes to the server."""
+        with (
+            mock.patch(
+                "sys.argv",
+                ["momapy", "serve", "--max-maps", "2", "--max-style-sheets", "3"],
+            ),
+            mock.patch("momapy.server.serve") as serve,
+        ):
+            momapy.cli.main()
+        assert serve.call_args.kwargs["max_maps"] == 2
+        assert serve.call_args.kwargs["max_style_sheets"] == 3
@@ -155,3 +155,31 @@ def test_predefined_colors():
     assert momapy.coloring.black.red == 0
     assert momapy.coloring.black.green == 0
     assert momapy.coloring.black.blue == 0
+
+
+def test_colormap_interpolates_colors():
+    """Test Colormap interpolates between evenly spaced colors."""
+    colormap = momapy.coloring.Colormap(
+        (momapy.coloring.black, momapy.coloring.white, momapy.coloring.red)
+    )
+    assert colormap(0.0) == momapy.coloring.black
+    assert colormap(-1.0) == momapy.coloring.black
+    assert colormap(0.5) == momapy.coloring.white
+    assert colormap(2.0) == momapy.coloring.red
+    assert colormap(0.25) == momapy.coloring.Color(128, 128, 128)
+    with pytest.raises(ValueError):
+        momapy.coloring.Colormap(())
+
+
+def test_colormap_maps_non_finite_values_to_bad_color():
+    """Test Colormap maps non-finite numbers to its bad color, or raises."""
+    colormap = momapy.coloring.Colormap((momapy.coloring.black, momapy.coloring.white))
+    for value in (float("nan"), float("inf"), float("-inf")):
+        with pytest.raises(ValueError):
+            colormap(value)
+    colormap = momapy.coloring.Colormap(
+        (momapy.coloring.black, momapy.coloring.white), bad=momapy.coloring.gray
+    )
+    assert colormap(float("nan")) == momapy.coloring.gray
+    assert colormap(float("inf")) == momapy.coloring.gray
+    assert colormap(1.0) == momapy.coloring.white
@@ -0,0 +1,77 @@
+"""Tests for momapy.diff module."""
+
+import dataclasses
+import os
+
+import pytest
+
+import momapy.coloring
+import momapy.diff
+import momapy.io.core
+
+APOPTOSIS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "celldesigner",
+    "maps",
+    "Apoptosis_pathway.xml",
+)
+
+
+@pytest.fixture(scope="module")
+def apoptosis_result():
+    return momapy.io.core.read(APOPTOSIS_PATH)
+
+
+@pytest.fixture(scope="module")
+def modified_apoptosis_result():
+    result = momapy.io.core.read(APOPTOSIS_PATH)
+    map_ = result.obj
+    species = sorted(map_.model.species, key=lambda species: species.id_)
+    model = dataclasses.replace(
+        map_.model,
+        species=(map_.model.species - {species[0], species[1]})
+        | {dataclasses.replace(species[0], name="CHANGED")},
+    )
+    layout = dataclasses.replace(
+        map_.layout, layout_elements=map_.layout.layout_elements[1:]
+    )
+    return dataclasses.replace(
+        result, obj=dataclasses.replace(map_, model=model, layout=layout)
+    )
+
+
+def test_diff_maps_of_same_content_is_empty(apoptosis_result):
+    other_result = momapy.io.core.read(APOPTOSIS_PATH)
+    assert momapy.diff.diff_maps(apoptosis_result, other_result).is_empty()
+    assert momapy.diff.diff_maps(apoptosis_result.obj, other_result.obj).is_empty()
+
+
+def test_diff_maps(apoptosis_result, modified_apoptosis_result):
+    map_diff = momapy.diff.diff_maps(apoptosis_result, modified_apoptosis_result)
+    assert map_diff.added_model_elements == ()
+    assert len(map_diff.removed_model_elements) == 1
+    assert [
+        (change.key, change.changed_fields)
+        for change in map_diff.modified_model_elements
+    ] == [("s_id_csa1", ("name",))]
+    assert map_diff.removed_layout_elements == (
+        apoptosis_result.obj.layout.layout_elements[0],
+    )
+    assert map_diff.added_layout_elements == ()
+    assert map_diff.modified_layout_elements == ()
+    reverse_map_diff = momapy.diff.diff_maps(
+        modified_apoptosis_result, apoptosis_result
+    )
+    assert len(reverse_map_diff.added_model_elements) == 1
+    assert len(reverse_map_diff.added_layout_elements) == 1
+
+
+def test_make_diff_overlay(apoptosis_result, modified_apoptosis_result):
+    map_ = apoptosis_result.obj
+    map_diff = momapy.diff.diff_maps(modified_apoptosis_result, apoptosis_result)
+    overlay = momapy.diff.make_diff_overlay(
+        map_, map_diff, added_color=momapy.coloring.green
+    )
+    added_layout_element = map_.layout.layout_elements[0]
+    assert overlay.styles[added_layout_element.id_] == {"stroke": momapy.coloring.green}
+    assert len(overlay.styles) > 1
@@ -0,0 +1,72 @@
+"""Tests for momapy.extraction module."""
+
+import os
+
+import pytest
+
+import momapy.celldesigner.model
+import momapy.extraction
+import momapy.io.core
+
+
+@pytest.fixture(scope="module")
+def apoptosis_map():
+    return momapy.io.core.read(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "celldesigner",
+            "maps",
+            "Apoptosis_pathway.xml",
+        )
+    ).obj
+
+
+def _get_species(map_, name):
+    return next(species for species in map_.model.species if species.name == name)
+
+
+def test_extract_submap_shares_selected_elements(apoptosis_map):
+    seed = _get_species(apoptosis_map, "CASP9")
+    submap = momapy.extraction.extract_submap(apoptosis_map, [seed], hops=1)
+    reaction_ids = {id(reaction) for reaction in apoptosis_map.model.reactions}
+    assert submap.model.reactions
+    for reaction in submap.model.reactions:
+        assert id(reaction) in reaction_ids
+        participants = [
+            role.referred_species
+            for role in reaction.reactants | reaction.products | reaction.modifiers
+        ]
+        assert any(participant is seed for participant in participants)
+        for participant in participants:
+            assert any(species is participant for species in submap.model.species)
+    layout_element_ids = [
+        id(layout_element) for layout_element in apoptosis_map.layout.layout_elements
+    ]
+    positions = [
+        layout_element_ids.index(id(layout_element))
+        for layout_element in submap.layout.layout_elements
+    ]
+    assert positions == sorted(positions)
+    for key, model_element in submap.layout_model_mapping.items():
+        assert apoptosis_map.layout_model_mapping[key] is model_element
+
+
+def test_extract_submap_grows_with_hops(apoptosis_map):
+    seed = _get_species(apoptosis_map, "CASP9")
+    sizes = [
+        len(
+            momapy.extraction.extract_submap(
+                apoptosis_map, [seed], hops=hops
+            ).layout.layout_elements
+        )
+        for hops in range(4)
+    ]
+    assert sizes == sorted(sizes)
+    assert sizes[-1] < len(apoptosis_map.layout.layout_elements)
+
+
+def test_extract_submap_raises_for_unknown_seed(apoptosis_map):
+    with pytest.raises(ValueError):
+        momapy.extraction.extract_submap(
+            apoptosis_map, [momapy.celldesigner.model.Compartment()]
+        )
@@ -0,0 +1,109 @@
+"""Tests for momapy.core.graph module."""
+
+import pytest
+
+import momapy.core.graph
+import momapy.sbgn.pd
+
+
+@pytest.fixture
+def model():
+    a = momapy.sbgn.pd.Macromolecule(label="A")
+    b = momapy.sbgn.pd.Macromolecule(label="B")
+    c = momapy.sbgn.pd.Macromolecule(label="C")
+    d = momapy.sbgn.pd.Macromolecule(label="D")
+    process = momapy.sbgn.pd.GenericProcess(
+        reactants=frozenset([momapy.sbgn.pd.Reactant(element=a)]),
+        products=frozenset([momapy.sbgn.pd.Product(element=b)]),
+    )
+    other_process = momapy.sbgn.pd.GenericProcess(
+        reactants=frozenset([momapy.sbgn.pd.Reactant(element=b)]),
+        products=frozenset([momapy.sbgn.pd.Product(element=d)]),
+    )
+    catalysis = momapy.sbgn.pd.Catalysis(source=c, target=process)
+    return momapy.sbgn.pd.SBGNPDModel(
+        entity_pools=frozenset([a, b, c, d]),
+        processes=frozenset([process, other_process]),
+        modulations=frozenset([catalysis]),
+    )
+
+
+def _get(model, label):
+    return next(
+        entity_pool for entity_pool in model.entity_pools if entity_pool.label == label
+    )
+
+
+def _get_process(model, reactant_label):
+    return next(
+        process
+        for process in model.processes
+        if next(iter(process.reactants)).element.label == reactant_label
+    )
+
+
+def test_get_graph_is_cached(model):
+    graph = model.get_graph()
+    assert isinstance(graph, momapy.core.graph.ModelGraph)
+    assert model.get_graph() is graph
+    assert len(graph) == 6
+    assert len(graph.edge_elements) == 5
+
+
+def test_neighbors_by_edge_cls(model):
+    graph = model.get_graph()
+    process = _get_process(model, "A")
+    assert graph.get_successors(_get(model, "A"), edge_cls=momapy.sbgn.pd.Reactant) == [
+        process
+    ]
+    assert graph.get_predecessors(process, edge_cls=momapy.sbgn.pd.Modulation) == [
+        _get(model, "C")
+    ]
+    assert graph.get_successors(process) == [_get(model, "B")]
+    assert graph.get_successors(_get(model, "D")) == []
+
+
+def test_get_neighborhood(model):
+    graph = model.get_graph()
+    a = _get(model, "A")
+    assert graph.get_neighborhood(a, k=0) == [a]
+    neighborhood = graph.get_neighborhood(a, k=2)
+    assert {id(node) for node in neighborhood} == {
+        id(a),
+        id(_get_process(model, "A")),
+        id(_get(model, "B")),
+        id(_get(model, "C")),
+    }
+    assert len(graph.get_neighborhood(a, k=4, direction="out")) == 5
+    assert graph.get_neighborhood(a, k=4, direction="in") == [a]
+
+
+def test_to_edge_arrays(model):
+    graph = model.get_graph()
+    sources, targets = graph.to_edge_arrays()
+    for source, target, edge_element in zip(
+        sources.tolist(), targets.tolist(), graph.edge_elements
+    ):
+        if isinstance(edge_element, momapy.sbgn.pd.Modulation):
+            assert graph.nodes[source] is edge_element.source
+            assert graph.nodes[target] is edge_element.target
+
+
+def test_roles_without_element_are_not_edges():
+    a = momapy.sbgn.pd.Macromolecule(label="A")
+    process = momapy.sbgn.pd.GenericProcess(
+        reactants=frozenset([momapy.sbgn.pd.Reactant(element=a)]),
+        products=frozenset([momapy.sbgn.pd.Product(element=None)]),
+    )
+    modulation = momapy.sbgn.pd.Catalysis(source=None, target=process)
+    model = momapy.sbgn.pd.SBGNPDModel(
+        entity_pools=frozenset([a]),
+        processes=frozenset([process]),
+        modulations=frozenset([modulation]),
+    )
+    graph = model.get_graph()
+    assert len(graph) == 2
+    assert None not in graph.nodes
+    assert len(graph.edge_elements) == 1
+    assert graph.get_successors(process) == []
+    assert graph.get_predecessors(process) == [a]
@@ -0,0 +1,75 @@
+"""Tests for momapy.hashing module."""
+
+import dataclasses
+import os
+
+import momapy.builder
+import momapy.geometry
+import momapy.hashing
+import momapy.io.core
+import momapy.sbgn.pd
+
+
+def _make_model(label="A", id_=None):
+    macromolecule = momapy.sbgn.pd.Macromolecule(label=label)
+    if id_ is not None:
+        macromolecule = dataclasses.replace(macromolecule, id_=id_)
+    return momapy.sbgn.pd.SBGNPDModel(entity_pools=frozenset([macromolecule]))
+
+
+def test_content_hash_ignores_id():
+    model = _make_model(id_="a")
+    other_model = _make_model(id_="b")
+    assert momapy.hashing.content_hash(model) == momapy.hashing.content_hash(
+        other_model
+    )
+    assert momapy.hashing.content_hash(model) != momapy.hashing.content_hash(
+        _make_model(label="B")
+    )
+    assert len(momapy.hashing.content_hash(model)) == momapy.hashing.DIGEST_SIZE
+
+
+def test_content_hash_of_collections():
+    assert momapy.hashing.content_hash(
+        frozenset(["a", "b", "c"])
+    ) == momapy.hashing.content_hash(frozenset(["c", "b", "a"]))
+    assert momapy.hashing.content_hash((1, 2)) != momapy.hashing.content_hash((2, 1))
+    assert momapy.hashing.content_hash((1,)) != momapy.hashing.content_hash([1])
+    assert momapy.hashing.content_hash(0.0) == momapy.hashing.content_hash(-0.0)
+    assert momapy.hashing.content_hash(1) == momapy.hashing.content_hash(1.0)
+    assert momapy.hashing.content_hash(1) == momapy.hashing.content_hash(True)
+    assert momapy.hashing.content_hash(1.5) != momapy.hashing.content_hash(1)
+
+
+def test_content_hash_is_memoized_on_frozen_objects():
+    point = momapy.geometry.Point(1.0, 2.0)
+    digest = momapy.hashing.content_hash(point)
+    assert point.__dict__["_content_hash"] == digest
+    builder = momapy.builder.builder_from_object(point)
+    assert momapy.hashing.content_hash(builder) != digest
+    assert "_content_hash" not in builder.__dict__
+
+
+def test_have_same_content():
+    assert momapy.hashing.have_same_content(_make_model(id_="a"), _make_model(id_="b"))
+    assert not momapy.hashing.have_same_content(object(), object())
+    assert momapy.hashing.have_same_content(1, 1.0)
+    # NaNs have the same content hash, although they are not equal
+    assert momapy.hashing.have_same_content(float("nan"), float("nan"))
+
+
+def test_maps_read_twice_have_same_content():
+    file_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "sbgn",
+        "maps",
+        "pd",
+        "simple_annotated.sbgn",
+    )
+    map_ = momapy.io.core.read(file_path).obj
+    other_map = momapy.io.core.read(file_path).obj
+    assert momapy.hashing.content_hexdigest(map_) == momapy.hashing.content_hexdigest(
+        other_map
+    )
+    assert map_.is_submap(other_map)
+    assert map_.layout.is_sublayout(other_map.layout)
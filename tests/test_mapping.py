@@ -216,6 +216,21 @@ class TestGetMapping:
         assert mapping.get_mapping(le1) is me1
         assert mapping.get_mapping(le3) is me2
 
+    def test_get_anchors(self):
+        builder = momapy.core.mapping.LayoutModelMappingBuilder()
+        le1, le2, le3, le4 = _le("1"), _le("2"), _le("3"), _le("4")
+        me1, me2, me3 = _me(), _me(), _me()
+        key1 = frozenset([le1, le2])
+        key2 = frozenset([le2, le3])
+        builder.add_mapping(key1, me1, anchor=le1)
+        builder.add_mapping(key2, me2)
+        builder.add_mapping(le4, me3)
+        assert builder.get_anchors(key1) == frozenset([le1])
+        mapping = builder.build()
+        assert mapping.get_anchors(key1) == frozenset([le1])
+        assert mapping.get_anchors(key2) == frozenset()
+        assert mapping.get_anchors(le4) == frozenset([le4])
+
 
 # ---------------------------------------------------------------------------
 # LayoutModelMappingBuilder.get_mapping()
@@ -413,3 +428,174 @@ class TestIdentityKeyedInverse:
         assert loaded.inverse[id(loaded_m2)] == {le2}
         # Forward-dict equality preserved.
         assert mapping == loaded
+
+    def test_get_child_layout_elements_with_anchor_and_frozenset_parent(self):
+        builder = momapy.core.mapping.LayoutModelMappingBuilder()
+        process_layout, arc_layout = _le("process"), _le("arc")
+        child_layout = _le("child")
+        parent_model, process_model, child_model = _me(), _me(), _me()
+        builder.add_mapping(
+            frozenset([process_layout, arc_layout, child_layout]), parent_model
+        )
+        builder.add_mapping(
+            frozenset([process_layout, arc_layout]),
+            process_model,
+            anchor=process_layout,
+        )
+        builder.add_mapping(child_layout, child_model)
+        # Model elements are ``==``-equal, so the cases are kept in a list.
+        expected = [
+            (child_model, parent_model, [child_layout]),
+            (process_model, parent_model, [process_layout]),
+            (parent_model, process_model, []),
+        ]
+        for child, parent, layouts in expected:
+            assert builder.get_child_layout_elements(child, parent) == layouts
+        mapping = builder.build()
+        for child, parent, layouts in expected:
+            assert mapping.get_child_layout_elements(child, parent) == layouts
+        # The index is built once and reused by the next calls.
+        index = mapping._child_layout_elements_index
+        mapping.get_child_layout_elements(child_model, parent_model)
+        assert mapping._child_layout_elements_index is index
+
+
+class TestBulkQueries:
+    @pytest.fixture
+    def mapping(self):
+        builder = momapy.core.mapping.LayoutModelMappingBuilder()
+        self.process_layout, self.arc_layout = _le("process"), _le("arc")
+        self.species_layout = _le("species")
+        self.process_model, self.species_model = _me(), _me()
+        builder.add_mapping(
+            frozenset([self.process_layout, self.arc_layout]),
+            self.process_model,
+            anchor=self.process_layout,
+        )
+        builder.add_mapping(self.species_layout, self.species_model)
+        return builder.build()
+
+    def test_get_mappings_matches_get_mapping(self, mapping):
+        map_elements = [
+            self.process_layout,
+            self.arc_layout,
+            self.species_layout,
+            self.species_model,
+            _le("unknown"),
+        ]
+        assert mapping.get_mappings(map_elements) == [
+            mapping.get_mapping(map_element) for map_element in map_elements
+        ]
+
+    def test_layout_to_model_table(self, mapping):
+        assert mapping.layout_to_model_table() == {
+            self.process_layout.id_: self.process_model.id_,
+            self.species_layout.id_: self.species_model.id_,
+        }
+
+    def test_model_to_layouts_table(self, mapping):
+        assert mapping.model_to_layouts_table() == {
+            self.process_model.id_: [self.process_layout.id_],
+            self.species_model.id_: [self.species_layout.id_],
+        }
+
+
+class TestCompactLayoutModelMapping:
+    @pytest.fixture
+    def mapping(self):
+        builder = momapy.core.mapping.LayoutModelMappingBuilder()
+        self.process_layout, self.arc_layout = _le("process"), _le("arc")
+        self.child_layout = _le("child")
+        self.parent_layout = _container("parent", self.child_layout)
+        self.process_model, self.parent_model = _me(), _me()
+        self.child_model = _me()
+        builder.add_mapping(
+            frozenset([self.process_layout, self.arc_layout]),
+            self.process_model,
+            anchor=self.process_layout,
+        )
+        builder.add_mapping(self.parent_layout, self.parent_model)
+        builder.add_mapping(self.child_layout, self.child_model)
+        return builder.build()
+
+    def test_round_trip(self, mapping):
+        compact_mapping = momapy.core.mapping.CompactLayoutModelMapping.from_mapping(
+            mapping
+        )
+        assert len(compact_mapping) == len(mapping)
+        new_mapping = compact_mapping.to_mapping()
+        assert new_mapping == mapping
+        assert new_mapping._singleton_to_key == mapping._singleton_to_key
+
+    def test_read_api(self, mapping):
+        compact_mapping = momapy.core.mapping.CompactLayoutModelMapping.from_mapping(
+            mapping
+        )
+        for key, model_element in mapping.items():
+            assert compact_mapping[key] is model_element
+        for map_element in [
+            self.process_layout,
+            self.arc_layout,
+            self.child_layout,
+            self.process_model,
+        ]:
+            assert compact_mapping.get_mapping(map_element) == mapping.get_mapping(
+                map_element
+            )
+        assert compact_mapping.get_child_layout_elements(
+            self.child_model, self.parent_model
+        ) == [self.child_layout]
+        assert (
+            compact_mapping.get_child_layout_elements(
+                self.parent_model, self.child_model
+            )
+            == []
+        )
+
+    def test_pickle_roundtrip(self, mapping):
+        import pickle
+
+        compact_mapping = momapy.core.mapping.CompactLayoutModelMapping.from_mapping(
+            mapping
+        )
+        loaded = pickle.loads(pickle.dumps(compact_mapping))
+        assert loaded.to_mapping() == mapping
+
+    def test_lookups_match_mapping_on_read_map(self):
+        import os
+
+        import momapy.io.core
+
+        map_ = momapy.io.core.read(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "sbgn",
+                "maps",
+                "pd",
+                "simple_annotated.sbgn",
+            )
+        ).obj
+        mapping = map_.layout_model_mapping
+        compact_mapping = momapy.core.mapping.CompactLayoutModelMapping.from_mapping(
+            mapping
+        )
+        model_elements = {id(value): value for value in mapping.values()}.values()
+        for model_element in model_elements:
+            assert compact_mapping.keys_for_value(
+                model_element
+            ) == mapping.keys_for_value(model_element)
+            for parent_model_element in model_elements:
+                assert sorted(
+                    id(layout_element)
+                    for layout_element in compact_mapping.get_child_layout_elements(
+                        model_element, parent_model_element
+                    )
+                ) == sorted(
+                    id(layout_element)
+                    for layout_element in mapping.get_child_layout_elements(
+                        model_element, parent_model_element
+                    )
+                )
+        for anchor in mapping._singleton_to_key:
+            assert compact_mapping.get_mapping(anchor) is mapping.get_mapping(anchor)
+        assert compact_mapping.get_mapping(_le("unknown")) is None
@@ -1,6 +1,9 @@
 """Tests for momapy.monitoring module."""
 
 import dataclasses
+
+import pytest
+
 import momapy.monitoring
 
 
@@ -104,3 +107,39 @@ def test_trigger_event_no_callbacks():
 
     # Should not raise any exception
     momapy.monitoring.trigger_event(event)
+
+
+def test_batch_coalesces_events():
+    """Test that events triggered in a batch are dispatched once on exit."""
+    obj = MonitoredSampleObject(value=10)
+    callback_called = []
+
+    def callback(event):
+        callback_called.append(event)
+
+    momapy.monitoring.on_set(obj, callback, "value")
+    with momapy.monitoring.batch():
+        obj.value = 20
+        with momapy.monitoring.batch():
+            obj.value = 30
+        assert callback_called == []
+    assert len(callback_called) == 1
+    assert obj.value == 30
+
+
+def test_batch_discards_events_on_exception():
+    """Test that events triggered in a batch that raises are not dispatched."""
+    obj = MonitoredSampleObject(value=10)
+    callback_called = []
+
+    def callback(event):
+        callback_called.append(event)
+
+    momapy.monitoring.on_set(obj, callback, "value")
+    with pytest.raises(ValueError), momapy.monitoring.batch():
+        obj.value = 20
+        raise ValueError("error")
+    assert callback_called == []
+    assert obj.value == 20
+    obj.value = 30
+    assert len(callback_called) == 1
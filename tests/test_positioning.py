@@ -131,3 +131,25 @@ def test_fit_multiple_points():
     assert isinstance(bbox, momapy.geometry.Bbox)
     assert bbox.width > 0
     assert bbox.height > 0
+
+
+def test_move_map_to_top_left():
+    """Test move_map_to_top_left translates the layout to the origin."""
+    import os
+
+    import momapy.io.core
+
+    map_ = momapy.io.core.read(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "sbgn",
+            "maps",
+            "pd",
+            "simple_annotated.sbgn",
+        )
+    ).obj
+    moved_map = momapy.positioning.move_map_to_top_left(map_)
+    bbox = moved_map.layout.bbox()
+    assert abs(bbox.x - bbox.width / 2) < 1e-6
+    assert abs(bbox.y - bbox.height / 2) < 1e-6
+    assert momapy.positioning.move_map_to_top_left(moved_map) is moved_map
@@ -0,0 +1,168 @@
+"""Tests for momapy.server module."""
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import momapy.server
+import momapy.styling.core
+
+SBGN_MAP = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "sbgn",
+    "maps",
+    "pd",
+    "simple_annotated.sbgn",
+)
+
+
+@pytest.fixture
+def server_url():
+    """Run a render server on a free port and return its URL."""
+    server = momapy.server.make_server(port=0, workers=2, warm_up=False, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, params, headers=None):
+    if headers is None:
+        headers = {"Content-Type": "application/json"}
+    request = urllib.request.Request(
+        url, data=json.dumps(params).encode("utf-8"), headers=headers, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_server_health(server_url):
+    """Test that the health endpoint reports the caches."""
+    url, _ = server_url
+    with urllib.request.urlopen(f"{url}/health") as response:
+        result = json.loads(response.read())
+    assert result["status"] == "ok"
+    assert result["maps"] == []
+
+
+def test_server_read_caches_map(server_url):
+    """Test that reading the same file twice reuses the read map."""
+    url, server = server_url
+    code, result = _post(f"{url}/read", {"input_file_path": SBGN_MAP})
+    assert code == 200
+    assert result["status"] == "ok"
+    assert result["map_type"] == "SBGN Process Description"
+    reader_result = server.state.read(SBGN_MAP)
+    assert server.state.read(SBGN_MAP) is reader_result
+    assert len(server.state.get_info()["maps"]) == 1
+
+
+def test_server_render(server_url, tmp_path):
+    """Test rendering a map through the server."""
+    url, _ = server_url
+    output_file_path = tmp_path / "output.svg"
+    code, result = _post(
+        f"{url}/render",
+        {
+            "input_file_path": SBGN_MAP,
+            "output_file_path": str(output_file_path),
+            "renderer": "svg-native",
+        },
+    )
+    assert code == 200
+    assert result["status"] == "ok"
+    assert output_file_path.exists()
+
+
+def test_server_unknown_command(server_url):
+    """Test that an unknown command returns an error."""
+    url, _ = server_url
+    code, result = _post(f"{url}/unknown", {})
+    assert code == 400
+    assert result["status"] == "error"
+
+
+def test_server_state_evicts_least_recently_used(tmp_path):
+    """Test that the state keeps at most max_maps maps."""
+    state = momapy.server.RenderServerState(max_maps=1)
+    state.read(SBGN_MAP)
+    copied_map = tmp_path / "copy.sbgn"
+    with open(SBGN_MAP, "rb") as f:
+        copied_map.write_bytes(f.read())
+    state.read(copied_map)
+    assert state.get_info()["maps"] == [str(copied_map.resolve())]
+
+
+def test_server_returns_500_for_unexpected_errors(server_url, monkeypatch):
+    """Test that unexpected errors are not reported as client errors."""
+    url, server = server_url
+
+    def _raise_runtime_error(params):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(server.state, "_handle_read", _raise_runtime_error)
+    code, result = _post(f"{url}/read", {"input_file_path": SBGN_MAP})
+    assert code == 500
+    assert result == {"status": "error", "error": "RuntimeError: unexpected"}
+    code, result = _post(f"{url}/export", {"input_file_path": SBGN_MAP})
+    assert code == 400
+    assert result["error"].startswith("KeyError")
+
+
+def test_server_state_evicts_least_recently_used_style_sheets(tmp_path):
+    """Test that the state keeps at most max_style_sheets style sheets."""
+    state = momapy.server.RenderServerState(max_style_sheets=2)
+    file_paths = []
+    for i in range(3):
+        file_path = tmp_path / f"style_{i}.css"
+        file_path.write_text(f"TextLayout {{ font_size: {i + 10}.0; }}")
+        file_paths.append(file_path)
+    state.get_style_sheet(file_paths[:1])
+    state.get_style_sheet(file_paths[1:2])
+    state.get_style_sheet(file_paths[:1])
+    state.get_style_sheet(file_paths[2:])
+    assert state.get_info()["style_sheets"] == [
+        str(file_paths[0].resolve()),
+        str(file_paths[2].resolve()),
+    ]
+    assert not any(
+        str(file_path.resolve()) in momapy.styling.core._style_sheet_cache
+        for file_path in file_paths
+    )
+
+
+def test_server_rejects_requests_that_are_not_json(server_url, tmp_path):
+    """Test that requests a web page could send are rejected."""
+    url, _ = server_url
+    output_file_path = tmp_path / "output.svg"
+    params = {"input_file_path": SBGN_MAP, "output_file_path": str(output_file_path)}
+    code, result = _post(f"{url}/render", params, {"Content-Type": "text/plain"})
+    assert code == 415
+    assert result["status"] == "error"
+    code, result = _post(
+        f"{url}/render",
+        params,
+        {"Content-Type": "application/json", "Origin": "http://example.org"},
+    )
+    assert code == 403
+    assert result["status"] == "error"
+    assert not output_file_path.exists()
+
+
+def test_server_returns_400_for_missing_files(server_url, tmp_path):
+    """Test that a missing input file is reported as a client error."""
+    url, _ = server_url
+    code, result = _post(
+        f"{url}/read", {"input_file_path": str(tmp_path / "missing.sbgn")}
+    )
+    assert code == 400
+    assert result["error"].startswith("FileNotFoundError")
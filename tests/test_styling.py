@@ -1,7 +1,13 @@
 """Tests for momapy.styling module."""
 
+import dataclasses
+import os
+
+import pytest
+
 import momapy.styling
 import momapy.coloring
+import momapy.core.elements
 import momapy.core.layout
 
 
@@ -685,3 +691,463 @@ class TestStyleApplication:
         # Check that style was applied to the text layout within the result
         assert isinstance(result, momapy.core.layout.TextLayout)
         assert result.font_size == 24.0
+
+
+def test_compiled_style_sheet_indexes_rules_by_rightmost_selector():
+    """Test CompiledStyleSheet only returns rules that may select an element."""
+    import momapy.geometry
+
+    text_selector = momapy.styling.TypeSelector(class_name="TextLayout")
+    node_selector = momapy.styling.ClassSelector(class_name="Node")
+    descendant_selector = momapy.styling.DescendantSelector(
+        ancestor_selector=momapy.styling.ClassSelector(class_name="GroupLayout"),
+        descendant_selector=momapy.styling.TypeSelector(class_name="TextLayout"),
+    )
+    not_selector = momapy.styling.NotSelector(selectors=(node_selector,))
+    style_sheet = momapy.styling.StyleSheet(
+        {
+            text_selector: momapy.styling.StyleCollection({"font_size": 10.0}),
+            node_selector: momapy.styling.StyleCollection({"fill": None}),
+            descendant_selector: momapy.styling.StyleCollection({"font_size": 12.0}),
+            not_selector: momapy.styling.StyleCollection({"font_size": 14.0}),
+        }
+    )
+    compiled_style_sheet = style_sheet.compile()
+    text_layout = momapy.core.layout.TextLayout(
+        text="Test", position=momapy.geometry.Point(0, 0)
+    )
+    candidate_selectors = [
+        selector
+        for selector, _ in compiled_style_sheet.get_candidate_rules(text_layout)
+    ]
+    assert candidate_selectors == [text_selector, descendant_selector, not_selector]
+    assert compiled_style_sheet.select(text_layout, []) == [
+        style_sheet[text_selector],
+        style_sheet[not_selector],
+    ]
+
+
+def test_compiled_style_sheet_matches_builders():
+    """Test CompiledStyleSheet selects builders like the built objects."""
+    import momapy.builder
+    import momapy.geometry
+
+    selector = momapy.styling.ClassSelector(class_name="TextLayout")
+    style_sheet = momapy.styling.StyleSheet(
+        {selector: momapy.styling.StyleCollection({"font_size": 10.0})}
+    )
+    text_layout_builder = momapy.builder.builder_from_object(
+        momapy.core.layout.TextLayout(text="Test", position=momapy.geometry.Point(0, 0))
+    )
+    assert style_sheet.compile().select(text_layout_builder, []) == [
+        style_sheet[selector]
+    ]
+
+
+def test_ancestor_chain_behaves_like_ancestor_list():
+    """Test the ancestor chain used for styling behaves like a list of ancestors."""
+    from momapy.styling.core import _as_ancestor_chain
+
+    chain = _as_ancestor_chain(["a", "b", "c"])
+    assert list(chain) == ["a", "b", "c"]
+    assert len(chain) == 3
+    assert chain[0] == "a"
+    assert chain[-1] == "c"
+    assert list(chain[:-1]) == ["a", "b"]
+    assert chain[:-1] is chain.parent
+    assert list(chain[:0]) == []
+    assert list(chain.push("d")) == ["a", "b", "c", "d"]
+    assert list(chain) == ["a", "b", "c"]
+    assert not _as_ancestor_chain(None)
+
+
+def test_descendant_selector_memoizes_ancestor_matches():
+    """Test DescendantSelector evaluates the ancestor selector once per ancestor."""
+    import momapy.geometry
+    from momapy.styling.core import _as_ancestor_chain
+
+    calls = []
+
+    class _CountingSelector(momapy.styling.ClassSelector):
+        def select(self, obj, ancestors):
+            calls.append(obj)
+            return super().select(obj, ancestors)
+
+    selector = momapy.styling.DescendantSelector(
+        ancestor_selector=_CountingSelector(class_name="TextLayout"),
+        descendant_selector=momapy.styling.TypeSelector(class_name="TextLayout"),
+    )
+    ancestors = _as_ancestor_chain(
+        [
+            momapy.core.layout.Layout(
+                position=momapy.geometry.Point(0, 0),
+                width=100,
+                height=100,
+                layout_elements=[],
+            )
+            for _ in range(3)
+        ]
+    )
+    text_layout = momapy.core.layout.TextLayout(
+        text="Test", position=momapy.geometry.Point(0, 0)
+    )
+    assert selector.select(text_layout, ancestors) is False
+    assert selector.select(text_layout, ancestors) is False
+    assert len(calls) == 3
+
+
+def test_apply_style_sheet_shares_unchanged_subtrees():
+    """Test apply_style_sheet only rebuilds styled elements and their ancestors."""
+    import momapy.geometry
+
+    styled_text_layout = momapy.core.layout.TextLayout(
+        text="Styled", position=momapy.geometry.Point(0, 0)
+    )
+    unstyled_layout = momapy.core.layout.Layout(
+        position=momapy.geometry.Point(0, 0),
+        width=10,
+        height=10,
+        layout_elements=(),
+    )
+    layout = momapy.core.layout.Layout(
+        position=momapy.geometry.Point(0, 0),
+        width=100,
+        height=100,
+        layout_elements=(styled_text_layout, unstyled_layout),
+    )
+    style_sheet = momapy.styling.StyleSheet(
+        {
+            momapy.styling.TypeSelector(
+                class_name="TextLayout"
+            ): momapy.styling.StyleCollection({"font_size": 24.0})
+        }
+    )
+    result = momapy.styling.apply_style_sheet(layout, style_sheet)
+    assert result is not layout
+    assert result.layout_elements[0].font_size == 24.0
+    assert result.layout_elements[1] is unstyled_layout
+    assert layout.layout_elements[0].font_size != 24.0
+    assert (
+        momapy.styling.apply_style_sheet(layout, momapy.styling.StyleSheet()) is layout
+    )
+
+
+def test_style_resolver_matches_apply_style_sheet():
+    """Test StyleResolver draws elements as apply_style_sheet styles them."""
+    import momapy.geometry
+    import momapy.meta.nodes
+
+    nodes = tuple(
+        momapy.meta.nodes.Rectangle(
+            position=momapy.geometry.Point(10 * i, 10), width=5, height=5
+        )
+        for i in range(3)
+    )
+    layout = momapy.core.layout.Layout(
+        position=momapy.geometry.Point(0, 0),
+        width=100,
+        height=100,
+        layout_elements=nodes,
+    )
+    style_sheet = momapy.styling.StyleSheet(
+        {
+            momapy.styling.TypeSelector(
+                class_name="Rectangle"
+            ): momapy.styling.StyleCollection({"fill": momapy.coloring.red}),
+            momapy.styling.IdSelector(id_=nodes[1].id_): momapy.styling.StyleCollection(
+                {"stroke_width": 3.0}
+            ),
+        }
+    )
+    style_resolver = momapy.styling.StyleResolver.from_style_sheet(style_sheet)
+    assert (
+        style_resolver.drawing_elements(layout)
+        == momapy.styling.apply_style_sheet(layout, style_sheet).drawing_elements()
+    )
+    assert layout.layout_elements is nodes
+    assert nodes[0].fill != momapy.coloring.red
+    assert style_resolver.get_computed_style(layout) == {}
+    assert style_resolver.get_computed_style(
+        nodes[0]
+    ) is style_resolver.get_computed_style(nodes[2])
+    assert style_resolver.get_computed_style(nodes[1]) == {
+        "fill": momapy.coloring.red,
+        "stroke_width": 3.0,
+    }
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _LabeledElement(momapy.core.elements.LayoutElement):
+    """A layout element that draws its label itself."""
+
+    label: momapy.core.layout.TextLayout
+
+    def bbox(self):
+        return self.label.bbox()
+
+    def drawing_elements(self):
+        return self.label.drawing_elements()
+
+    def children(self):
+        return [self.label]
+
+    def childless(self):
+        return dataclasses.replace(self, label=None)
+
+
+def test_style_resolver_applies_overrides_to_children_drawn_by_parent():
+    """Test StyleResolver styles the children an element draws itself."""
+    import momapy.geometry
+
+    label = momapy.core.layout.TextLayout(
+        text="A", position=momapy.geometry.Point(10, 10)
+    )
+    element = _LabeledElement(label=label)
+    style_sheet = momapy.styling.StyleSheet(
+        {
+            momapy.styling.TypeSelector(
+                class_name="TextLayout"
+            ): momapy.styling.StyleCollection({"stroke": momapy.coloring.blue}),
+        }
+    )
+    style_resolver = momapy.styling.Overlay(
+        {label.id_: {"fill": momapy.coloring.red}}
+    ).to_style_resolver(style_sheet)
+    drawing_elements = style_resolver.drawing_elements(element)
+    styled_label = dataclasses.replace(
+        label, fill=momapy.coloring.red, stroke=momapy.coloring.blue
+    )
+    assert drawing_elements == styled_label.drawing_elements()
+    assert element.label is label
+    assert label.fill is None
+
+
+def test_overlay_colors_layout_elements_of_model_elements():
+    """Test make_overlay colors the layout elements of valued model elements."""
+    import os
+
+    import momapy.io.core
+
+    map_ = momapy.io.core.read(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "sbgn",
+            "maps",
+            "pd",
+            "simple_annotated.sbgn",
+        )
+    ).obj
+    layout_model_mapping = map_.layout_model_mapping
+    layout_element, model_element = next(
+        (key, value)
+        for key, value in layout_model_mapping.items()
+        if not isinstance(key, frozenset) and hasattr(key, "fill")
+    )
+    overlay = momapy.styling.make_overlay(
+        map_,
+        [(model_element.id_, 1.0), ("unknown", 0.0)],
+        momapy.coloring.Colormap((momapy.coloring.white, momapy.coloring.red)),
+    )
+    assert overlay.styles[layout_element.id_] == {"fill": momapy.coloring.red}
+    styled_map = momapy.styling.apply_overlay(map_, overlay)
+    assert styled_map is not map_
+    assert layout_element.fill != momapy.coloring.red
+    styled_layout_element = next(
+        element
+        for element in styled_map.layout.descendants()
+        if element.id_ == layout_element.id_
+    )
+    assert styled_layout_element.fill == momapy.coloring.red
+    assert styled_map.layout_model_mapping.get_mapping(styled_layout_element) is (
+        model_element
+    )
+    assert (
+        overlay.to_style_resolver().drawing_elements(map_.layout)
+        == styled_map.layout.drawing_elements()
+    )
+    assert momapy.styling.make_overlay(map_, {}).styles == {}
+    with pytest.raises(ValueError):
+        momapy.styling.make_overlay(map_, {model_element.id_: float("nan")})
+    overlay = momapy.styling.make_overlay(
+        map_,
+        {model_element.id_: float("nan"), "unknown": 0.0},
+        momapy.coloring.Colormap(
+            (momapy.coloring.white, momapy.coloring.red), bad=momapy.coloring.gray
+        ),
+    )
+    assert overlay.styles[layout_element.id_] == {"fill": momapy.coloring.gray}
+    map_without_mapping = dataclasses.replace(map_, layout_model_mapping=None)
+    assert (
+        momapy.styling.make_overlay(
+            map_without_mapping, {model_element.id_: 1.0}
+        ).styles
+        == {}
+    )
+
+
+def test_style_sheet_from_file_combines_imports(tmp_path):
+    """Test StyleSheet.from_file combines all imported style sheets."""
+    (tmp_path / "a.css").write_text("TextLayout { font_size: 10.0; }")
+    (tmp_path / "b.css").write_text("Layout { stroke_width: 2.0; }")
+    (tmp_path / "main.css").write_text(
+        '@import "a.css";\n@import "b.css";\nTextLayout { font_family: "Arial"; }'
+    )
+    style_sheet = momapy.styling.StyleSheet.from_file(tmp_path / "main.css")
+    assert style_sheet[momapy.styling.TypeSelector("TextLayout")] == {
+        "font_size": 10.0,
+        "font_family": "Arial",
+    }
+    assert style_sheet[momapy.styling.TypeSelector("Layout")] == {"stroke_width": 2.0}
+
+
+def test_style_sheet_from_file_cache_is_invalidated(tmp_path):
+    """Test cached style sheets are reparsed when a file they import changes."""
+    import os
+
+    imported_file_path = tmp_path / "imported.css"
+    imported_file_path.write_text("TextLayout { font_size: 10.0; }")
+    file_path = tmp_path / "main.css"
+    file_path.write_text('@import "imported.css";')
+    style_sheet = momapy.styling.StyleSheet.from_file(file_path)
+    cached_style_sheet = momapy.styling.StyleSheet.from_file(file_path)
+    assert cached_style_sheet == style_sheet
+    assert cached_style_sheet is not style_sheet
+    imported_file_path.write_text("TextLayout { font_size: 12.0; }")
+    stat = imported_file_path.stat()
+    os.utime(imported_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    style_sheet = momapy.styling.StyleSheet.from_file(file_path)
+    assert style_sheet[momapy.styling.TypeSelector("TextLayout")] == {"font_size": 12.0}
+
+
+def test_style_sheet_from_file_uses_disk_cache(tmp_path):
+    """Test parsed style sheets are reused from the disk cache."""
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "main.css"
+    file_path.write_text("TextLayout { font_size: 10.0; }")
+    momapy.styling.set_style_sheet_cache_dir(cache_dir)
+    try:
+        style_sheet = momapy.styling.StyleSheet.from_file(file_path)
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+        momapy.styling.clear_style_sheet_cache()
+        assert momapy.styling.StyleSheet.from_file(file_path) == style_sheet
+    finally:
+        momapy.styling.set_style_sheet_cache_dir(None)
+        momapy.styling.clear_style_sheet_cache()
+
+
+def test_style_sheet_from_file_ignores_unsigned_disk_cache(tmp_path):
+    """Test cache files not signed with the key of the cache are not loaded."""
+    import pickle
+
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "main.css"
+    file_path.write_text("TextLayout { font_size: 10.0; }")
+    momapy.styling.set_style_sheet_cache_dir(cache_dir)
+    try:
+        style_sheet = momapy.styling.StyleSheet.from_file(file_path)
+        (cache_file_path,) = cache_dir.glob("*.pickle")
+        data = cache_file_path.read_bytes()
+        entry = pickle.loads(data[32:])
+        forged_entry = dataclasses.replace(
+            entry, style_sheet=momapy.styling.StyleSheet()
+        )
+        for forged_data in [
+            pickle.dumps(forged_entry),
+            data[:32] + pickle.dumps(forged_entry),
+        ]:
+            cache_file_path.write_bytes(forged_data)
+            momapy.styling.clear_style_sheet_cache()
+            assert momapy.styling.StyleSheet.from_file(file_path) == style_sheet
+    finally:
+        momapy.styling.set_style_sheet_cache_dir(None)
+        momapy.styling.clear_style_sheet_cache()
+
+
+def test_style_sheet_cache_evicts_least_recently_used(tmp_path):
+    """Test the in-memory cache keeps at most the set number of style sheets."""
+    file_paths = []
+    for i in range(3):
+        file_path = tmp_path / f"style_{i}.css"
+        file_path.write_text(f"TextLayout {{ font_size: {i + 10}.0; }}")
+        file_paths.append(file_path.resolve())
+    momapy.styling.clear_style_sheet_cache()
+    momapy.styling.set_style_sheet_cache_size(2)
+    try:
+        momapy.styling.StyleSheet.from_file(file_paths[0])
+        momapy.styling.StyleSheet.from_file(file_paths[1])
+        momapy.styling.StyleSheet.from_file(file_paths[0])
+        momapy.styling.StyleSheet.from_file(file_paths[2])
+        assert list(momapy.styling.core._style_sheet_cache) == [
+            str(file_paths[0]),
+            str(file_paths[2]),
+        ]
+        momapy.styling.set_style_sheet_cache_size(1)
+        assert list(momapy.styling.core._style_sheet_cache) == [str(file_paths[2])]
+    finally:
+        momapy.styling.set_style_sheet_cache_size(128)
+        momapy.styling.clear_style_sheet_cache()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires POSIX permissions")
+def test_style_sheet_disk_cache_requires_private_key(tmp_path):
+    """Test the disk cache is not used if its key is accessible to others."""
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "main.css"
+    file_path.write_text("TextLayout { font_size: 10.0; }")
+    momapy.styling.set_style_sheet_cache_dir(cache_dir)
+    (cache_dir / "key").chmod(0o644)
+    momapy.styling.set_style_sheet_cache_dir(cache_dir)
+    try:
+        momapy.styling.StyleSheet.from_file(file_path)
+        assert list(cache_dir.glob("*.pickle")) == []
+    finally:
+        momapy.styling.set_style_sheet_cache_dir(None)
+        momapy.styling.clear_style_sheet_cache()
+
+
+def test_layered_style_sheet_later_layers_take_precedence():
+    """Test LayeredStyleSheet resolves precedence as if layers were applied in order."""
+    import momapy.geometry
+
+    text_selector = momapy.styling.TypeSelector(class_name="TextLayout")
+    class_selector = momapy.styling.ClassSelector(class_name="TextLayout")
+    base_style_sheet = momapy.styling.StyleSheet(
+        {
+            text_selector: momapy.styling.StyleCollection({"font_size": 10.0}),
+            class_selector: momapy.styling.StyleCollection({"font_size": 12.0}),
+        }
+    )
+    top_style_sheet = momapy.styling.StyleSheet(
+        {text_selector: momapy.styling.StyleCollection({"font_size": 14.0})}
+    )
+    layered_style_sheet = momapy.styling.LayeredStyleSheet((base_style_sheet,))
+    top_layered_style_sheet = layered_style_sheet.with_layer(top_style_sheet)
+    assert layered_style_sheet.layers == (base_style_sheet,)
+    assert top_layered_style_sheet.layers == (base_style_sheet, top_style_sheet)
+    text_layout = momapy.core.layout.TextLayout(
+        text="Test", position=momapy.geometry.Point(0, 0)
+    )
+    result = momapy.styling.apply_style_sheet(text_layout, top_layered_style_sheet)
+    assert result.font_size == 14.0
+    result = momapy.styling.apply_style_sheet(text_layout, layered_style_sheet)
+    assert result.font_size == 12.0
+
+
+def test_combine_style_sheets_does_not_modify_inputs():
+    """Test combine_style_sheets leaves the combined style sheets unchanged."""
+    style1 = momapy.styling.StyleSheet(
+        {"key1": momapy.styling.StyleCollection({"fill": momapy.coloring.black})}
+    )
+    style2 = momapy.styling.StyleSheet(
+        {"key1": momapy.styling.StyleCollection({"stroke": momapy.coloring.white})}
+    )
+    style3 = momapy.styling.StyleSheet(
+        {"key1": momapy.styling.StyleCollection({"fill": momapy.coloring.red})}
+    )
+    combined = momapy.styling.combine_style_sheets([style1, style2, style3])
+    assert combined["key1"] == {
+        "fill": momapy.coloring.red,
+        "stroke": momapy.coloring.white,
+    }
+    assert style1["key1"] == {"fill": momapy.coloring.black}
+    assert style2["key1"] == {"stroke": momapy.coloring.white}
@@ -0,0 +1,232 @@
+"""Tests for momapy.transactions module."""
+
+import dataclasses
+import json
+import os
+import sys
+
+import pytest
+
+import momapy.coloring
+import momapy.io.core
+import momapy.transactions
+
+
+@pytest.fixture
+def simple_map():
+    return momapy.io.core.read(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "sbgn",
+            "maps",
+            "pd",
+            "simple_annotated.sbgn",
+        )
+    ).obj
+
+
+def test_transaction_records_patch(simple_map):
+    """Test that a patch replays the edits of a transaction after JSON."""
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        transaction.builder.layout.layout_elements[0].fill = momapy.coloring.red
+    new_map = transaction.result
+    assert new_map.layout.layout_elements[0].fill == momapy.coloring.red
+    assert len(transaction.patch) == 1
+    operation = transaction.patch.operations[0]
+    assert operation.path == ("layout", "layout_elements", 0)
+    assert operation.attribute == "fill"
+    patch = momapy.transactions.Patch.from_json(transaction.patch.to_json())
+    patched_map = patch.apply(simple_map)
+    assert patched_map == new_map
+    assert patched_map.model is simple_map.model
+    assert patched_map.layout.layout_elements[1] is simple_map.layout.layout_elements[1]
+
+
+def test_transaction_inverse_patch_undoes_removal(simple_map):
+    """Test that the inverse patch restores a removed layout element."""
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        del transaction.builder.layout.layout_elements[2]
+    new_map = transaction.result
+    assert len(new_map.layout.layout_elements) == 4
+    assert transaction.patch.operations == (
+        momapy.transactions.Operation(
+            path=("layout",),
+            attribute="layout_elements",
+            old_value=(
+                momapy.transactions.Reference(("layout", "layout_elements", 2)),
+            ),
+            new_value=(),
+            kind=momapy.transactions.OperationKind.SPLICE,
+            index=2,
+        ),
+    )
+    patch = momapy.transactions.Patch.from_json(transaction.patch.to_json())
+    patched_map = patch.apply(simple_map)
+    assert patched_map == new_map
+    assert patched_map.layout.layout_elements[2] is simple_map.layout.layout_elements[3]
+    inverse_patch = momapy.transactions.Patch.from_json(
+        transaction.inverse_patch.to_json()
+    )
+    assert inverse_patch.apply(new_map) == simple_map
+
+
+def test_patch_apply_checks_old_values(simple_map):
+    """Test that a patch is not applied to an object it was not made for."""
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        transaction.builder.layout.layout_elements[0].fill = momapy.coloring.red
+    with pytest.raises(ValueError):
+        transaction.patch.apply(transaction.result)
+
+
+def test_transaction_records_several_splices(simple_map):
+    """Test that removals and insertions in a tuple are patched element-wise."""
+    layout_elements = simple_map.layout.layout_elements
+    new_layout_element = dataclasses.replace(
+        layout_elements[0], id_="new", fill=momapy.coloring.red
+    )
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        builder_layout_elements = transaction.builder.layout.layout_elements
+        del builder_layout_elements[3]
+        del builder_layout_elements[1]
+        builder_layout_elements.append(new_layout_element)
+    new_map = transaction.result
+    assert new_map.layout.layout_elements == (
+        layout_elements[0],
+        layout_elements[2],
+        layout_elements[4],
+        new_layout_element,
+    )
+    assert [
+        (operation.kind, operation.index, len(operation.old_value))
+        for operation in transaction.patch.operations
+    ] == [
+        (momapy.transactions.OperationKind.SPLICE, 1, 1),
+        (momapy.transactions.OperationKind.SPLICE, 3, 1),
+        (momapy.transactions.OperationKind.SPLICE, 5, 0),
+    ]
+    patch = momapy.transactions.Patch.from_json(transaction.patch.to_json())
+    assert patch.apply(simple_map) == new_map
+    inverse_patch = momapy.transactions.Patch.from_json(
+        transaction.inverse_patch.to_json()
+    )
+    assert inverse_patch.apply(new_map) == simple_map
+    with pytest.raises(ValueError):
+        patch.apply(new_map)
+
+
+def test_transaction_records_frozenset_update(simple_map):
+    """Test that removals from a frozenset are patched element-wise."""
+    entity_pool = min(simple_map.model.entity_pools, key=lambda element: element.id_)
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        builder_entity_pool = next(
+            element
+            for element in transaction.builder.model.entity_pools
+            if element.id_ == entity_pool.id_
+        )
+        transaction.builder.model.entity_pools.remove(builder_entity_pool)
+    new_map = transaction.result
+    assert entity_pool not in new_map.model.entity_pools
+    (operation,) = transaction.patch.operations
+    assert operation.kind is momapy.transactions.OperationKind.UPDATE
+    assert operation.old_value == frozenset(
+        [
+            momapy.transactions.Reference(
+                ("model", "entity_pools", momapy.transactions.Member(entity_pool.id_))
+            )
+        ]
+    )
+    assert operation.new_value == frozenset()
+    patch = momapy.transactions.Patch.from_json(transaction.patch.to_json())
+    patched_map = patch.apply(simple_map)
+    assert patched_map == new_map
+    assert patched_map.layout is simple_map.layout
+    inverse_patch = momapy.transactions.Patch.from_json(
+        transaction.inverse_patch.to_json()
+    )
+    assert inverse_patch.apply(new_map) == simple_map
+
+
+def test_transaction_is_not_committed_on_exception(simple_map):
+    """Test that a transaction exiting with an exception records nothing."""
+    transaction = momapy.transactions.Transaction(simple_map)
+    with pytest.raises(RuntimeError), transaction:
+        transaction.builder.layout.layout_elements[0].fill = momapy.coloring.red
+        raise RuntimeError("error")
+    assert transaction.result is None
+    assert transaction.patch is None
+
+
+def test_empty_patch_returns_object(simple_map):
+    """Test that a transaction without edits records an empty patch."""
+    with momapy.transactions.Transaction(simple_map) as transaction:
+        pass
+    assert transaction.result is simple_map
+    assert len(transaction.patch) == 0
+    assert transaction.patch.apply(simple_map) is simple_map
+
+
+@pytest.mark.parametrize(
+    "qualified_name",
+    [
+        "os:system",
+        "subprocess:Popen",
+        "this:Zen",
+        "momapy.transactions:importlib.import_module",
+        "momapy.transactions:collections.OrderedDict",
+        "momapy.transactions:Unknown",
+    ],
+)
+@pytest.mark.parametrize("value_kind", ["dataclass", "mapping", "enum"])
+def test_patch_from_json_rejects_classes_outside_momapy(qualified_name, value_kind):
+    """Test that decoding a patch only makes objects of momapy classes."""
+    value = {value_kind: qualified_name, "fields": {}, "items": [], "name": "X"}
+    json_string = json.dumps(
+        [{"path": [], "attribute": "a", "old_value": None, "new_value": value}]
+    )
+    with pytest.raises(ValueError):
+        momapy.transactions.Patch.from_json(json_string)
+    assert "this" not in sys.modules
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"path": [], "attribute": "a", "old_value": None},
+        {"path": [], "attribute": "a", "old_value": [], "new_value": [], "kind": "X"},
+        {
+            "path": [],
+            "attribute": "a",
+            "old_value": [],
+            "new_value": [],
+            "kind": "SPLICE",
+        },
+        {"path": [], "attribute": "a", "old_value": None, "new_value": {"x": 1}},
+        {
+            "path": [],
+            "attribute": "a",
+            "old_value": None,
+            "new_value": {"dataclass": "momapy.geometry:Point", "fields": {"z": 1}},
+        },
+    ],
+)
+def test_patch_from_json_rejects_invalid_operations(operation):
+    """Test that decoding an invalid operation raises a ValueError."""
+    with pytest.raises(ValueError):
+        momapy.transactions.Patch.from_json(json.dumps([operation]))
+
+
+def test_patch_from_json_decodes_momapy_values():
+    """Test that values of momapy classes and frozendicts are decoded."""
+    import frozendict
+
+    import momapy.drawing
+    import momapy.geometry
+
+    operation = momapy.transactions.Operation(
+        path=("layout",),
+        attribute="a",
+        old_value=frozendict.frozendict({"x": momapy.geometry.Point(1.0, 2.0)}),
+        new_value=momapy.drawing.FontStyle.ITALIC,
+    )
+    patch = momapy.transactions.Patch((operation,))
+    assert momapy.transactions.Patch.from_json(patch.to_json()) == patch
@@ -365,3 +365,29 @@ class TestInverseFamilyInvariants:
         assert dict(mutable.items()) == dict(frozen.items())
         assert mutable.get("missing", frozenset()) == frozenset()
         assert frozen.get("missing", frozenset()) == frozenset()
+
+    def test_keys_for_value(self):
+        shared = object()
+        assert momapy.utils.SurjectionDict({"a": 1, "b": 1}).keys_for_value(
+            1
+        ) == frozenset({"a", "b"})
+        assert (
+            momapy.utils.FrozenSurjectionDict({"a": 1}).keys_for_value(2) == frozenset()
+        )
+        identity_instances = [
+            momapy.utils.IdentitySurjectionDict({"a": shared, "b": shared}),
+            momapy.utils.FrozenIdentitySurjectionDict({"a": shared, "b": shared}),
+            momapy.utils.IdentityMultiDict({"a": [shared], "b": [shared]}),
+            momapy.utils.FrozenIdentityMultiDict({"a": [shared], "b": [shared]}),
+        ]
+        for d in identity_instances:
+            assert d.keys_for_value(shared) == frozenset({"a", "b"})
+            assert d.keys_for_value(object()) == frozenset()
+
+    def test_mutable_keys_for_value_follows_mutations(self):
+        shared = object()
+        d = momapy.utils.IdentitySurjectionDict({"a": shared})
+        keys = d.keys_for_value(shared)
+        d["b"] = shared
+        assert keys == frozenset({"a"})
+        assert d.keys_for_value(shared) == frozenset({"a", "b"})